@@ -0,0 +1,239 @@
+"""
+Almacén en columnas de resultados de simulación.
+
+Cada campo se guarda en su propio archivo ``.npy`` dentro de una carpeta, de
+modo que ``np.load(..., mmap_mode="r")`` los proyecta en memoria sin leerlos:
+
+  campana.npy      uint8   campaña de cada partida (índice en meta["campanas"])
+  final.npy        int16   desenlace (índice en meta["terminales"])
+  salud.npy, reputacion.npy  uint8;  recursos.npy, pasos.npy  int32;  items.npy  uint8
+  camino.npy       int32   nodos visitados de todas las partidas seguidos
+                           (índice en meta["nodos"]), con
+  inicio_camino.npy int64  posición donde empieza el camino de cada partida
+  meta.json        nombres de campañas, desenlaces y nodos, y número de partidas
+
+Los archivos se escriben por lotes añadiendo al final; la cabecera ``.npy`` se
+reserva con tamaño fijo y se reescribe al cerrar con la longitud definitiva.
+Filtrar 10^7 partidas por campaña, final o umbral de estadística es una
+operación vectorizada sobre arreglos proyectados en memoria.
+
+Uso: python almacen_columnas.py escribir carpeta jason dificil -n 10000000 [--semilla 1]
+     python almacen_columnas.py consultar carpeta [--campana jason_dificil_inicio] [--final X] [--salud-min 50]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from grafo_historia import STATS, GrafoHistoria, nodo_inicial
+from juego_base import JuegoAventuraBase
+from simulador_vectorizado import TAM_LOTE, GrafoCSR, _contar_bits, simular_lote
+
+# Campo -> tipo de dato en disco
+COLUMNAS = {
+    "campana": np.uint8,
+    "final": np.int16,
+    "salud": np.uint8,
+    "reputacion": np.uint8,
+    "recursos": np.int32,
+    "pasos": np.int32,
+    "items": np.uint8,
+    "camino": np.int32,
+    "inicio_camino": np.int64,
+}
+
+# Tamaño fijo de la cabecera .npy reservada (múltiplo de 64)
+TAM_CABECERA = 128
+
+
+def _cabecera_npy(tipo, n: int) -> bytes:
+    """Cabecera .npy (versión 1.0) de un arreglo 1-D, rellenada hasta TAM_CABECERA bytes"""
+    texto = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (np.dtype(tipo).str, n)
+    texto = texto.ljust(TAM_CABECERA - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + len(texto).to_bytes(2, "little") + texto.encode("latin1")
+
+
+class EscritorColumnas:
+    """Escribe partidas por lotes en una carpeta de columnas .npy"""
+
+    def __init__(self, carpeta: str, grafo: GrafoHistoria, csr: Optional[GrafoCSR] = None):
+        os.makedirs(carpeta, exist_ok=True)
+        self.carpeta = carpeta
+        self.grafo = grafo
+        csr = csr or GrafoCSR(grafo)
+        # Nodos del grafo seguidos de los destinos inexistentes (mismos índices que GrafoCSR)
+        self.nodos = list(grafo.ids) + [csr.nombres_terminales[i][len("faltante:"):]
+                                         for i in range(len(grafo), csr.total_nodos)]
+        self.terminales: Dict[str, int] = {}
+        self.campanas: Dict[str, int] = {}
+        self.partidas = 0
+        self.longitud_caminos = 0
+        self._archivos = {}
+        self._cuentas = {campo: 0 for campo in COLUMNAS}
+        for campo, tipo in COLUMNAS.items():
+            f = open(os.path.join(carpeta, campo + ".npy"), "wb")
+            f.write(_cabecera_npy(tipo, 0))
+            self._archivos[campo] = f
+
+    def _escribir(self, campo: str, valores):
+        datos = np.ascontiguousarray(valores, dtype=COLUMNAS[campo])
+        self._archivos[campo].write(datos.tobytes())
+        self._cuentas[campo] += len(datos)
+
+    def _codigo_terminal(self, nombre: str) -> int:
+        return self.terminales.setdefault(nombre, len(self.terminales))
+
+    def escribir_lote(self, csr: GrafoCSR, raiz: str, lote: Dict[str, "np.ndarray"]):
+        """Guardar un lote de ``simulador_vectorizado.simular_lote(..., caminos=True)``"""
+        n = len(lote["nodo"])
+        codigos = np.full(csr.total_nodos + 1, -1, dtype=np.int16)
+        for i, nombre in csr.nombres_terminales.items():
+            codigos[i] = self._codigo_terminal(nombre)
+        codigos[-1] = self._codigo_terminal("limite")
+        finales = lote["nodo"].astype(np.int64)
+        # Las partidas sin terminar usan la última posición de ``codigos`` ("limite")
+        finales[lote["sin_terminar"]] = -1
+
+        self._escribir("campana", np.full(n, self.campanas.setdefault(raiz, len(self.campanas))))
+        self._escribir("final", codigos[finales])
+        for posicion, stat in enumerate(STATS):
+            self._escribir(stat, lote["stats"][:, posicion])
+        self._escribir("pasos", lote["pasos"])
+        self._escribir("items", _contar_bits(lote["inventario"]).sum(axis=1))
+        inicios = self.longitud_caminos + np.concatenate([[0], np.cumsum(lote["pasos"][:-1], dtype=np.int64)])
+        self._escribir("inicio_camino", inicios)
+        self._escribir("camino", lote["camino"])
+        self.longitud_caminos += len(lote["camino"])
+        self.partidas += n
+
+    def cerrar(self):
+        """Reescribir las cabeceras con las longitudes finales y guardar meta.json"""
+        for campo, f in self._archivos.items():
+            f.seek(0)
+            f.write(_cabecera_npy(COLUMNAS[campo], self._cuentas[campo]))
+            f.close()
+        meta = {"version": 1, "partidas": self.partidas, "campanas": list(self.campanas),
+                "terminales": list(self.terminales), "nodos": self.nodos}
+        with open(os.path.join(self.carpeta, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class LectorColumnas:
+    """Acceso proyectado en memoria a una carpeta escrita con EscritorColumnas"""
+
+    def __init__(self, carpeta: str):
+        with open(os.path.join(carpeta, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.columnas = {campo: np.load(os.path.join(carpeta, campo + ".npy"), mmap_mode="r")
+                         for campo in COLUMNAS}
+
+    def __len__(self):
+        return self.meta["partidas"]
+
+    def __getitem__(self, campo: str) -> "np.ndarray":
+        return self.columnas[campo]
+
+    def seleccionar(self, campana: Optional[str] = None, final: Optional[str] = None,
+                    **umbrales) -> "np.ndarray":
+        """Índices de las partidas que cumplen los filtros.
+
+        ``umbrales`` admite ``<campo>_min`` y ``<campo>_max`` (p. ej. ``salud_min=50``).
+        """
+        mascara = np.ones(len(self), dtype=bool)
+        if campana is not None:
+            if campana not in self.meta["campanas"]:
+                return np.zeros(0, dtype=np.int64)
+            mascara &= self.columnas["campana"] == self.meta["campanas"].index(campana)
+        if final is not None:
+            if final not in self.meta["terminales"]:
+                return np.zeros(0, dtype=np.int64)
+            mascara &= self.columnas["final"] == self.meta["terminales"].index(final)
+        for clave, valor in umbrales.items():
+            campo, limite = clave.rsplit("_", 1)
+            columna = self.columnas[campo]
+            mascara &= (columna >= valor) if limite == "min" else (columna <= valor)
+        return np.flatnonzero(mascara)
+
+    def camino(self, i: int) -> List[str]:
+        """Ids de los nodos visitados por la partida i (sin la raíz)"""
+        inicio = int(self.columnas["inicio_camino"][i])
+        nodos = self.columnas["camino"][inicio:inicio + int(self.columnas["pasos"][i])]
+        return [self.meta["nodos"][k] for k in nodos]
+
+    def finales(self, indices: Optional["np.ndarray"] = None) -> Dict[str, int]:
+        """Partidas por desenlace (de todas o de los índices dados)"""
+        columna = self.columnas["final"] if indices is None else self.columnas["final"][indices]
+        cuentas = np.bincount(columna, minlength=len(self.meta["terminales"]))
+        return dict(Counter({nombre: int(n) for nombre, n in zip(self.meta["terminales"], cuentas) if n})
+                    .most_common())
+
+
+def escribir_simulacion(carpeta: str, juego: JuegoAventuraBase, raices: List[str], partidas: int,
+                        semilla: Optional[int] = None, tam_lote: int = TAM_LOTE) -> int:
+    """Simular ``partidas`` partidas por raíz (vectorizado) y guardarlas en columnas"""
+    grafo = GrafoHistoria(juego.historia)
+    csr = GrafoCSR(grafo)
+    rng = np.random.default_rng(semilla)
+    with EscritorColumnas(carpeta, grafo, csr) as escritor:
+        for raiz in raices:
+            for inicio in range(0, partidas, tam_lote):
+                lote = simular_lote(csr, raiz, min(tam_lote, partidas - inicio), rng, caminos=True)
+                escritor.escribir_lote(csr, raiz, lote)
+        return escritor.partidas
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Almacén en columnas de resultados de simulación")
+    parser.add_argument("accion", choices=["escribir", "consultar"])
+    parser.add_argument("carpeta")
+    parser.add_argument("personaje", nargs="?", help="al escribir: personaje (sin él, todas las campañas)")
+    parser.add_argument("dificultad", nargs="?", default="facil")
+    parser.add_argument("-n", "--partidas", type=int, default=1_000_000, help="partidas por campaña")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--campana", default=None, help="id del nodo raíz de la campaña")
+    parser.add_argument("--final", default=None)
+    for stat in STATS:
+        parser.add_argument(f"--{stat}-min", type=int, default=None)
+        parser.add_argument(f"--{stat}-max", type=int, default=None)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.accion == "escribir":
+        juego = JuegoAventuraBase()
+        if args.personaje:
+            raices = [nodo_inicial(args.personaje, args.dificultad)]
+        else:
+            grafo = GrafoHistoria(juego.historia)
+            raices = [grafo.ids[i] for i in grafo.raices().values()]
+        total = escribir_simulacion(args.carpeta, juego, raices, args.partidas, args.semilla)
+        print(f"{total:,} partidas guardadas en {args.carpeta} ({time.perf_counter() - inicio:.1f} s)")
+        return 0
+
+    lector = LectorColumnas(args.carpeta)
+    umbrales = {f"{stat}_{limite}": getattr(args, f"{stat}_{limite}")
+                for stat in STATS for limite in ("min", "max") if getattr(args, f"{stat}_{limite}") is not None}
+    indices = lector.seleccionar(args.campana, args.final, **umbrales)
+    finales = lector.finales(indices)
+    duracion = time.perf_counter() - inicio
+    print(f"{len(indices):,} de {len(lector):,} partidas ({duracion * 1000:.0f} ms)")
+    for nombre, n in finales.items():
+        print(f"  {n / max(1, len(indices)):8.4%}  {nombre}")
+    if len(indices):
+        print(f"Ejemplo de camino: {' → '.join(lector.camino(int(indices[0])))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Análisis incremental del grafo de historia.
+
+Mantiene en caché, para cada nodo de ``historia``:
+  - hacia adelante (dependen de los predecesores): qué campañas lo alcanzan y el
+    intervalo [mín, máx] de cada estadística al llegar a él;
+  - hacia atrás (dependen de los sucesores): qué finales se pueden alcanzar desde
+    él y cuántos caminos distintos llevan a un final.
+
+Cuando se edita un nodo solo se recalculan los resultados que dependen de él:
+los descendientes para los resultados hacia adelante y los ancestros para los
+resultados hacia atrás. Cada región se recorre por componentes fuertemente
+conexas, así que los ciclos de la historia se resuelven por punto fijo.
+
+Dentro de un ciclo los intervalos se ensanchan hasta el límite de la estadística
+cuando siguen creciendo, así que son una sobreaproximación: tras una edición el
+resultado incremental puede quedar más ancho (nunca más estrecho) que un cálculo
+completo, porque depende del punto desde el que se reinicia el punto fijo.
+
+Uso (benchmark con grafo sintético): python analisis_incremental.py [campañas]
+"""
+import random
+import sys
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from grafo_historia import (LIMITES, STATS, STATS_INICIALES, campanas, componentes_fuertes,
+                            efectos_opcion, limitar)
+
+INFINITO = float("inf")
+
+# Intervalo de cada estadística al entrar en un nodo: ((mín, máx), (mín, máx), (mín, máx))
+Intervalos = Tuple[Tuple[float, float], ...]
+
+# Rondas de punto fijo en un ciclo antes de ensanchar los intervalos que siguen creciendo
+RONDAS_ANTES_DE_ENSANCHAR = 8
+
+
+def _transferir(intervalos: Intervalos, efectos: List[Tuple[int, int]]) -> Intervalos:
+    """Aplicar los efectos de una opción a un intervalo (el recorte es monótono)"""
+    nuevos = list(intervalos)
+    for posicion, cambio in efectos:
+        minimo, maximo = nuevos[posicion]
+        nuevos[posicion] = (limitar(posicion, minimo + cambio), limitar(posicion, maximo + cambio))
+    return tuple(nuevos)
+
+
+def _unir(a: Optional[Intervalos], b: Optional[Intervalos]) -> Optional[Intervalos]:
+    """Envolvente de dos intervalos (None = nodo no alcanzado)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return tuple((min(x[0], y[0]), max(x[1], y[1])) for x, y in zip(a, b))
+
+
+def _ensanchar(anterior: Intervalos, nuevo: Intervalos) -> Intervalos:
+    """Llevar a su límite los extremos que siguen cambiando dentro de un ciclo"""
+    resultado = []
+    for posicion, (viejo, actual) in enumerate(zip(anterior, nuevo)):
+        minimo, maximo = LIMITES[posicion]
+        lo = minimo if actual[0] < viejo[0] else actual[0]
+        hi = (INFINITO if maximo is None else maximo) if actual[1] > viejo[1] else actual[1]
+        resultado.append((lo, hi))
+    return tuple(resultado)
+
+
+class AnalisisIncremental:
+    """Resultados de análisis del grafo que se actualizan al editar nodos"""
+
+    def __init__(self, historia: Dict, raices: Optional[Dict] = None):
+        self.historia = historia
+        # Raíz de cada campaña: clave -> id de nodo
+        self.raices = dict(campanas(historia) if raices is None else raices)
+        self._raices_por_nodo: Dict[str, Set] = {}
+        for clave, raiz in self.raices.items():
+            self._raices_por_nodo.setdefault(raiz, set()).add(clave)
+
+        # Adyacencia propia (para saber qué cambió al recibir una edición)
+        self._sucesores: Dict[str, List[str]] = {}
+        self._predecesores: Dict[str, Set[str]] = {}
+
+        # Resultados en caché
+        self._alcance: Dict[str, FrozenSet] = {}
+        self._intervalos: Dict[str, Optional[Intervalos]] = {}
+        self._finales: Dict[str, FrozenSet[str]] = {}
+        self._caminos: Dict[str, float] = {}
+
+        for nodo_id in historia:
+            self._enlazar(nodo_id)
+        todos = set(historia)
+        self._recalcular_atras(todos, todos)
+        self._recalcular_adelante(todos, todos)
+
+    # ------------------- Consultas -------------------
+    def campanas_que_alcanzan(self, nodo_id: str) -> FrozenSet:
+        """Campañas desde cuya raíz se puede llegar al nodo"""
+        return self._alcance.get(nodo_id, frozenset())
+
+    def intervalos(self, nodo_id: str) -> Dict[str, Tuple[float, float]]:
+        """Rango {stat: (mín, máx)} con el que se puede llegar al nodo (vacío si es inalcanzable).
+
+        Es una cota: si el nodo está en un ciclo o detrás de uno puede ser más ancho
+        que el rango real (ver el ensanchamiento en el docstring del módulo)."""
+        intervalos = self._intervalos.get(nodo_id)
+        return dict(zip(STATS, intervalos)) if intervalos else {}
+
+    def finales_alcanzables(self, nodo_id: str) -> FrozenSet[str]:
+        """Finales que se pueden alcanzar desde el nodo"""
+        return self._finales.get(nodo_id, frozenset())
+
+    def num_caminos(self, nodo_id: str) -> float:
+        """Número de secuencias de elecciones distintas hasta un final (inf si hay ciclos)"""
+        return self._caminos.get(nodo_id, 0)
+
+    def problemas(self) -> Dict[str, List[str]]:
+        """Validación: nodos inalcanzables, sin final posible y opciones a nodos inexistentes"""
+        inalcanzables = []
+        sin_final = []
+        faltantes = []
+        for nodo_id in self.historia:
+            if not self._alcance[nodo_id]:
+                inalcanzables.append(nodo_id)
+            elif not self._finales[nodo_id]:
+                sin_final.append(nodo_id)
+            faltantes.extend(f"{nodo_id} -> {destino}" for destino in self._sucesores[nodo_id]
+                             if destino not in self.historia)
+        return {"inalcanzables": inalcanzables, "sin_final": sin_final, "faltantes": faltantes}
+
+    # ------------------- Ediciones -------------------
+    def actualizar_nodo(self, nodo) -> Tuple[int, int]:
+        """Insertar o reemplazar un NodoHistoria (recarga en caliente).
+
+        Devuelve cuántos nodos se recalcularon (hacia atrás, hacia adelante).
+        """
+        self.historia[nodo.id] = nodo
+        return self.notificar_cambio(nodo.id)
+
+    def eliminar_nodo(self, nodo_id: str) -> Tuple[int, int]:
+        """Quitar un nodo de la historia"""
+        self.historia.pop(nodo_id, None)
+        return self.notificar_cambio(nodo_id)
+
+    def notificar_cambio(self, nodo_id: str) -> Tuple[int, int]:
+        """Avisar de que las opciones o ``es_final`` de un nodo cambiaron en sitio"""
+        anteriores = self._sucesores.get(nodo_id)
+        final_anterior = self._finales.get(nodo_id) == frozenset((nodo_id,))
+        self._desenlazar(nodo_id)
+        existe = nodo_id in self.historia
+        if existe:
+            self._enlazar(nodo_id)
+        else:
+            for cache in (self._alcance, self._intervalos, self._finales, self._caminos):
+                cache.pop(nodo_id, None)
+        nuevos = self._sucesores.get(nodo_id)
+
+        # Hacia atrás: solo si cambió la estructura (el nodo y sus ancestros)
+        atras: Set[str] = set()
+        if anteriores != nuevos or not existe or final_anterior != self.historia[nodo_id].es_final:
+            atras = self._cierre({nodo_id}, self._predecesores_de)
+            self._recalcular_atras(atras, {nodo_id, *self._predecesores_de(nodo_id)})
+        # Hacia adelante: el nodo, sus sucesores viejos y nuevos, y sus descendientes
+        semillas = {v for v in set(anteriores or ()) | set(nuevos or ()) | {nodo_id} if v in self.historia}
+        adelante = self._cierre(semillas, self._sucesores_de)
+        self._recalcular_adelante(adelante, semillas)
+        return len(atras), len(adelante)
+
+    # ------------------- Internos -------------------
+    def _enlazar(self, nodo_id: str):
+        nodo = self.historia[nodo_id]
+        # La partida termina en un nodo final aunque tenga opciones
+        destinos = [] if nodo.es_final else [opcion["siguiente"] for opcion in nodo.opciones]
+        self._sucesores[nodo_id] = destinos
+        for destino in destinos:
+            self._predecesores.setdefault(destino, set()).add(nodo_id)
+
+    def _desenlazar(self, nodo_id: str):
+        for destino in self._sucesores.pop(nodo_id, ()):
+            predecesores = self._predecesores.get(destino)
+            if predecesores is not None:
+                predecesores.discard(nodo_id)
+
+    def _sucesores_de(self, nodo_id: str) -> Iterable[str]:
+        return (v for v in self._sucesores.get(nodo_id, ()) if v in self.historia)
+
+    def _predecesores_de(self, nodo_id: str) -> Iterable[str]:
+        return (p for p in self._predecesores.get(nodo_id, ()) if p in self.historia)
+
+    def _cierre(self, semillas: Set[str], vecinos) -> Set[str]:
+        """Semillas más todo lo alcanzable siguiendo ``vecinos``"""
+        region = set(semillas)
+        pila = list(semillas)
+        while pila:
+            for v in vecinos(pila.pop()):
+                if v not in region:
+                    region.add(v)
+                    pila.append(v)
+        return region
+
+    def _componentes(self, region: Set[str]) -> List[List[str]]:
+        """Componentes fuertes de la región, con los sucesores antes que sus predecesores.
+
+        Los ids se ordenan para que el orden (y con él el ensanchamiento en los ciclos)
+        no dependa del orden de iteración del conjunto."""
+        ids = sorted(nodo_id for nodo_id in region if nodo_id in self.historia)
+        posicion = {nodo_id: i for i, nodo_id in enumerate(ids)}
+        adyacencia = [[posicion[v] for v in self._sucesores[u] if v in posicion] for u in ids]
+        return [[ids[i] for i in componente] for componente in componentes_fuertes(adyacencia)]
+
+    def _recalcular_atras(self, region: Set[str], forzados: Set[str]):
+        """Finales alcanzables y número de caminos, de los sucesores hacia atrás.
+
+        Una componente solo se recalcula si está forzada o si cambió algún sucesor
+        suyo en esta misma pasada (corte temprano).
+        """
+        cambiados: Set[str] = set()
+        for componente in self._componentes(region):
+            miembros = set(componente)
+            externos = [v for u in componente for v in self._sucesores[u]
+                        if v in self.historia and v not in miembros]
+            if miembros.isdisjoint(forzados) and cambiados.isdisjoint(externos):
+                continue
+            anteriores = [(self._finales.get(u), self._caminos.get(u)) for u in componente]
+
+            ciclico = len(componente) > 1 or componente[0] in self._sucesores[componente[0]]
+            if not ciclico:
+                u = componente[0]
+                if self.historia[u].es_final:
+                    self._finales[u] = frozenset((u,))
+                    self._caminos[u] = 1
+                else:
+                    finales: Set[str] = set()
+                    caminos = 0
+                    for v in self._sucesores[u]:
+                        if v in self.historia:
+                            finales |= self._finales[v]
+                            caminos += self._caminos[v]
+                    self._finales[u] = frozenset(finales)
+                    self._caminos[u] = caminos
+            else:
+                # En un ciclo todos los miembros alcanzan exactamente lo mismo
+                finales = frozenset().union(*(self._finales[v] for v in externos))
+                for u in componente:
+                    self._finales[u] = finales
+                    self._caminos[u] = INFINITO if finales else 0
+
+            if anteriores != [(self._finales[u], self._caminos[u]) for u in componente]:
+                cambiados |= miembros
+
+    def _entrada_externa(self, u: str, miembros: Set[str]) -> Tuple[Set, Optional[Intervalos]]:
+        """Alcance e intervalos que llegan a u desde fuera de su componente"""
+        alcance = set(self._raices_por_nodo.get(u, ()))
+        intervalos = tuple((v, v) for v in STATS_INICIALES) if alcance else None
+        for p in self._predecesores_de(u):
+            if p in miembros or not self._alcance.get(p):
+                continue
+            alcance |= self._alcance[p]
+            intervalos = _unir(intervalos, self._transferencias(p, u, self._intervalos[p]))
+        return alcance, intervalos
+
+    def _transferencias(self, p: str, u: str, intervalos: Intervalos) -> Optional[Intervalos]:
+        """Envolvente de los intervalos que salen de p por las opciones que llevan a u"""
+        resultado = None
+        for opcion in self.historia[p].opciones:
+            if opcion["siguiente"] == u:
+                resultado = _unir(resultado, _transferir(intervalos, efectos_opcion(opcion)))
+        return resultado
+
+    def _recalcular_adelante(self, region: Set[str], forzados: Set[str]):
+        """Campañas que alcanzan cada nodo e intervalos de estadísticas, de las raíces hacia adelante"""
+        cambiados: Set[str] = set()
+        for componente in reversed(self._componentes(region)):
+            miembros = set(componente)
+            if miembros.isdisjoint(forzados) and all(
+                    cambiados.isdisjoint(self._predecesores_de(u)) for u in componente):
+                continue
+            anteriores = [(self._alcance.get(u), self._intervalos.get(u)) for u in componente]
+
+            alcance: Set = set()
+            entradas = {}
+            for u in componente:
+                externo, intervalos = self._entrada_externa(u, miembros)
+                alcance |= externo
+                entradas[u] = intervalos
+
+            ciclico = len(componente) > 1 or componente[0] in self._sucesores[componente[0]]
+            if not ciclico:
+                u = componente[0]
+                self._alcance[u] = frozenset(alcance)
+                self._intervalos[u] = entradas[u]
+            else:
+                # Punto fijo dentro del ciclo (con ensanchamiento para recursos, que no tiene máximo)
+                alcance = frozenset(alcance)
+                actuales = dict(entradas)
+                rondas = 0
+                cambio = True
+                while cambio:
+                    cambio = False
+                    rondas += 1
+                    for u in componente:
+                        nuevo = actuales[u]
+                        for p in self._predecesores_de(u):
+                            if p in miembros and actuales[p] is not None:
+                                nuevo = _unir(nuevo, self._transferencias(p, u, actuales[p]))
+                        if nuevo != actuales[u]:
+                            if rondas > RONDAS_ANTES_DE_ENSANCHAR and actuales[u] is not None:
+                                nuevo = _ensanchar(actuales[u], nuevo)
+                            actuales[u] = nuevo
+                            cambio = True
+                for u in componente:
+                    self._alcance[u] = alcance
+                    self._intervalos[u] = actuales[u] if alcance else None
+
+            if anteriores != [(self._alcance[u], self._intervalos[u]) for u in componente]:
+                cambiados |= miembros
+
+
+def grafo_sintetico(campanas_: int, nodos_por_campana: int, ramas: int = 3,
+                    semilla: int = 0) -> Tuple[Dict, Dict]:
+    """Historia aleatoria con muchas campañas por capas (y algún ciclo) para pruebas de rendimiento.
+
+    Devuelve (historia, raices).
+    """
+    from juego_base import NodoHistoria
+
+    rng = random.Random(semilla)
+    historia = {}
+    raices = {}
+    ancho = max(1, int(nodos_por_campana ** 0.5))
+    for c in range(campanas_):
+        ids = [f"c{c}_facil_inicio"] + [f"c{c}_n{i}" for i in range(1, nodos_por_campana)]
+        raices[(f"c{c}", "facil")] = ids[0]
+        for i, nodo_id in enumerate(ids):
+            nodo = NodoHistoria(nodo_id, f"Nodo {nodo_id}", "")
+            historia[nodo_id] = nodo
+            if i >= nodos_por_campana - ancho:
+                nodo.es_final = True
+                continue
+            for _ in range(rng.randint(1, ramas)):
+                if i > 0 and rng.random() < 0.01:
+                    destino = ids[max(1, i - rng.randint(1, ancho))]
+                else:
+                    destino = ids[min(nodos_por_campana - 1, i + rng.randint(1, 2 * ancho))]
+                nodo.agregar_opcion(f"Ir a {destino}", destino,
+                                    stat=rng.choice(STATS), cambio=rng.randint(-10, 10))
+    return historia, raices
+
+
+def main():
+    """Medir la reconstrucción completa frente a ediciones de un solo nodo"""
+    campanas_ = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    historia, raices = grafo_sintetico(campanas_, 100)
+
+    inicio = time.perf_counter()
+    analisis = AnalisisIncremental(historia, raices)
+    completo = time.perf_counter() - inicio
+
+    ids = [nodo_id for nodo_id, nodo in historia.items() if nodo.opciones]
+    rng = random.Random(1)
+    tiempos = []
+    recalculados = []
+    for _ in range(50):
+        nodo = historia[rng.choice(ids)]
+        opcion = rng.choice(nodo.opciones)
+        if rng.random() < 0.5:
+            opcion["cambio"] += 5
+        else:
+            opcion["siguiente"] = rng.choice(ids)
+        inicio = time.perf_counter()
+        recalculados.append(analisis.notificar_cambio(nodo.id))
+        tiempos.append(time.perf_counter() - inicio)
+
+    print(f"Nodos: {len(historia)} ({campanas_} campañas)")
+    print(f"Análisis completo: {completo * 1000:.1f} ms")
+    print(f"Edición de un nodo: media {sum(tiempos) / len(tiempos) * 1000:.2f} ms, "
+          f"máx {max(tiempos) * 1000:.2f} ms")
+    print(f"Nodos en región (atrás, adelante) por edición: "
+          f"{sum(a for a, _ in recalculados) // len(recalculados)}, "
+          f"{sum(b for _, b in recalculados) // len(recalculados)}")
+
+
+if __name__ == "__main__":
+    main()
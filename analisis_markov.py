@@ -0,0 +1,196 @@
+"""
+Probabilidades exactas de llegar a cada final bajo juego aleatorio.
+
+Modela la historia como una cadena de Markov absorbente: en cada nodo se elige una
+de ``nodo.opciones`` de forma uniforme (o según unos pesos por nodo) y los nodos
+``es_final`` son estados absorbentes. También absorben, para poder detectarlos:
+  - los callejones sin salida (nodos no finales sin opciones, clave ``"callejon:<id>"``),
+  - los destinos inexistentes (clave ``"faltante:<id>"``),
+  - los ciclos cerrados de los que no se puede salir (clave ``"ciclo:<id>"``).
+
+La matriz de absorción B = (I - Q)^-1 R se resuelve por bloques: se recorren las
+componentes fuertemente conexas en orden topológico inverso y solo se resuelve un
+sistema lineal (NumPy si está disponible) para las componentes con ciclos. En un
+grafo casi acíclico como el de este juego eso es prácticamente lineal en aristas.
+
+Uso: python analisis_markov.py [umbral]
+"""
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from grafo_historia import GrafoHistoria, NODO_FALTANTE, Pesos, cargar_historia, componentes_fuertes
+
+# NumPy es opcional: sin él se usa eliminación de Gauss en Python puro
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def transiciones(grafo: GrafoHistoria, pesos: Optional[Pesos] = None) -> List[List[Tuple[int, float, str]]]:
+    """Para cada nodo, lista de (destino, probabilidad, id de destino) con probabilidad > 0.
+
+    Las opciones con el mismo destino se suman. El destino es NODO_FALTANTE si
+    la opción apunta a un nodo que no existe.
+    """
+    pesos = pesos or {}
+    resultado = []
+    for i, nodo_id in enumerate(grafo.ids):
+        opciones = grafo.opciones(i)
+        w = pesos.get(nodo_id)
+        if w is None or len(w) != len(opciones) or sum(w) <= 0:
+            w = [1.0] * len(opciones)
+        total = float(sum(w))
+        acumulado = {}
+        for opcion, destino, peso in zip(opciones, grafo.sucesores[i], w):
+            if peso <= 0:
+                continue
+            clave = (destino, opcion["siguiente"] if destino == NODO_FALTANTE else grafo.ids[destino])
+            acumulado[clave] = acumulado.get(clave, 0.0) + peso / total
+        resultado.append([(destino, p, destino_id) for (destino, destino_id), p in acumulado.items()])
+    return resultado
+
+
+def resolver_lineal(a: List[List[float]], b: List[List[float]]) -> List[List[float]]:
+    """Resolver A X = B (A cuadrada no singular)"""
+    if NUMPY_AVAILABLE:
+        return np.linalg.solve(np.array(a, dtype=float), np.array(b, dtype=float)).tolist()
+    n = len(a)
+    m = len(b[0]) if b else 0
+    filas = [list(a[i]) + list(b[i]) for i in range(n)]
+    for col in range(n):
+        pivote = max(range(col, n), key=lambda r: abs(filas[r][col]))
+        filas[col], filas[pivote] = filas[pivote], filas[col]
+        p = filas[col][col]
+        filas[col] = [x / p for x in filas[col]]
+        for r in range(n):
+            if r != col and filas[r][col] != 0.0:
+                f = filas[r][col]
+                filas[r] = [x - f * y for x, y in zip(filas[r], filas[col])]
+    return [fila[n:n + m] for fila in filas]
+
+
+def absorcion(grafo: GrafoHistoria, pesos: Optional[Pesos] = None,
+              nodos: Optional[List[int]] = None,
+              trans: Optional[List[List[Tuple[int, float, str]]]] = None) -> Dict[int, Dict[str, float]]:
+    """Distribución de absorción de cada nodo: {estado absorbente: probabilidad}.
+
+    Si se pasa ``nodos`` debe estar cerrado bajo sucesores (p. ej. ``grafo.alcanzables``).
+    """
+    if trans is None:
+        trans = transiciones(grafo, pesos)
+    if nodos is None:
+        nodos = range(len(grafo))
+    adyacencia = [[v for v, _, _ in t] for t in trans]
+    resultado: Dict[int, Dict[str, float]] = {}
+
+    for componente in componentes_fuertes(adyacencia, nodos):
+        if len(componente) == 1:
+            u = componente[0]
+            if grafo.es_final[u]:
+                resultado[u] = {grafo.ids[u]: 1.0}
+                continue
+            if not trans[u]:
+                # Mismo nombre que usan los simuladores para una partida atascada
+                resultado[u] = {"callejon:" + grafo.ids[u]: 1.0}
+                continue
+            if all(v != u for v, _, _ in trans[u]):
+                dist: Dict[str, float] = {}
+                for v, p, destino_id in trans[u]:
+                    if v == NODO_FALTANTE:
+                        clave = "faltante:" + destino_id
+                        dist[clave] = dist.get(clave, 0.0) + p
+                        continue
+                    for clave, q in resultado[v].items():
+                        dist[clave] = dist.get(clave, 0.0) + p * q
+                resultado[u] = dist
+                continue
+
+        # Componente con ciclo: (I - Q_c) X = R_c
+        posicion = {u: k for k, u in enumerate(componente)}
+        claves: Dict[str, int] = {}
+        filas_r: List[Dict[int, float]] = []
+        a = [[0.0] * len(componente) for _ in componente]
+        for k, u in enumerate(componente):
+            a[k][k] = 1.0
+            r: Dict[int, float] = {}
+            for v, p, destino_id in trans[u]:
+                if v in posicion:
+                    a[k][posicion[v]] -= p
+                    continue
+                salida = {"faltante:" + destino_id: 1.0} if v == NODO_FALTANTE else resultado[v]
+                for clave, q in salida.items():
+                    c = claves.setdefault(clave, len(claves))
+                    r[c] = r.get(c, 0.0) + p * q
+            filas_r.append(r)
+
+        if not claves:
+            # Ciclo cerrado: la partida nunca termina
+            clave = "ciclo:" + grafo.ids[min(componente)]
+            for u in componente:
+                resultado[u] = {clave: 1.0}
+            continue
+
+        b = [[r.get(c, 0.0) for c in range(len(claves))] for r in filas_r]
+        x = resolver_lineal(a, b)
+        nombres = list(claves)
+        for k, u in enumerate(componente):
+            resultado[u] = {nombres[c]: valor for c, valor in enumerate(x[k]) if valor > 0.0}
+    return resultado
+
+
+def probabilidades_finales(grafo: GrafoHistoria, raiz: str,
+                           pesos: Optional[Pesos] = None) -> Dict[str, float]:
+    """Probabilidad de terminar en cada estado absorbente empezando en raiz"""
+    i = grafo.indice[raiz]
+    return absorcion(grafo, pesos, nodos=grafo.alcanzables(i))[i]
+
+
+def probabilidades_por_campana(grafo: GrafoHistoria,
+                               pesos: Optional[Pesos] = None) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """Distribución de finales de cada campaña (personaje, dificultad)"""
+    todo = absorcion(grafo, pesos)
+    return {clave: todo[raiz] for clave, raiz in grafo.raices().items()}
+
+
+def finales_improbables(grafo: GrafoHistoria, pesos: Optional[Pesos] = None,
+                        umbral: float = 1e-3) -> Tuple[List[str], Dict[str, float]]:
+    """Finales inalcanzables desde cualquier campaña y finales casi inalcanzables.
+
+    Devuelve (inalcanzables, {final: probabilidad máxima}) donde la probabilidad
+    máxima entre campañas es menor que umbral.
+    """
+    maxima: Dict[str, float] = {}
+    for dist in probabilidades_por_campana(grafo, pesos).values():
+        for clave, p in dist.items():
+            maxima[clave] = max(maxima.get(clave, 0.0), p)
+    inalcanzables = [grafo.ids[i] for i in grafo.finales() if grafo.ids[i] not in maxima]
+    raros = {grafo.ids[i]: maxima[grafo.ids[i]] for i in grafo.finales()
+             if 0.0 < maxima.get(grafo.ids[i], 0.0) < umbral}
+    return inalcanzables, raros
+
+
+def main():
+    """Imprimir el informe de probabilidades de todas las campañas"""
+    umbral = float(sys.argv[1]) if len(sys.argv) > 1 else 1e-3
+    grafo = GrafoHistoria(cargar_historia())
+
+    for (personaje, dificultad), dist in probabilidades_por_campana(grafo).items():
+        print(f"\n== {personaje} / {dificultad} ==")
+        for clave, p in sorted(dist.items(), key=lambda kv: -kv[1]):
+            marca = "" if clave in grafo.indice and grafo.es_final[grafo.indice[clave]] else "  (no es final)"
+            print(f"  {p:8.4%}  {clave}{marca}")
+
+    inalcanzables, raros = finales_improbables(grafo, umbral=umbral)
+    print(f"\nFinales inalcanzables desde cualquier campaña: {len(inalcanzables)}")
+    for nodo_id in inalcanzables:
+        print(f"  • {nodo_id}")
+    print(f"Finales con probabilidad < {umbral:g}: {len(raros)}")
+    for nodo_id, p in sorted(raros.items(), key=lambda kv: kv[1]):
+        print(f"  • {nodo_id}: {p:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Microbenchmark de la aplicación de efectos por elección.
+
+Compara, sobre todas las opciones de la historia:
+  - ``diccionario``: leer las claves stat/cambio/stat2/cambio2/item de la opción
+    y despachar por nombre en ``Jugador.modificar_stat`` (forma anterior),
+  - ``programa``: ``Jugador.ejecutar`` con el programa compilado de la opción
+    (``programa_opcion``: el que cada ``Opcion`` compiló al construir la historia),
+  - ``paso diccionario``: elección completa a la manera anterior (efectos por
+    diccionario, decisión y nodo siguiente),
+  - ``avanzar``: elección completa del motor (programa, decisión, nodo siguiente
+    y ``Consecuencia``); se compara con ``paso diccionario``.
+
+Uso: python bench_efectos.py [-r 200]
+"""
+import argparse
+import sys
+import time
+from typing import Callable, List
+
+from grafo_historia import programa_opcion
+from juego_base import JuegoAventuraBase, Jugador, avanzar
+
+
+def _por_diccionario(jugador: Jugador, opcion: dict):
+    if opcion.get("stat"):
+        jugador.modificar_stat(opcion["stat"], opcion.get("cambio", 0))
+    if opcion.get("stat2"):
+        jugador.modificar_stat(opcion["stat2"], opcion.get("cambio2", 0))
+    if opcion.get("item"):
+        jugador.agregar_item(opcion["item"])
+
+
+def _paso_diccionario(jugador: Jugador, opcion: dict):
+    _por_diccionario(jugador, opcion)
+    jugador.guardar_decision(jugador.nodo_actual, opcion["texto"], 0)
+    jugador.nodo_actual = opcion["siguiente"]
+
+
+def medir(opciones: List[dict], aplicar: Callable[[Jugador, dict], object], repeticiones: int) -> float:
+    """Nanosegundos por elección (mejor de 3 tandas)"""
+    mejor = float("inf")
+    for _ in range(3):
+        jugador = Jugador("Benchmark")
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            for opcion in opciones:
+                aplicar(jugador, opcion)
+            # Que la lista de decisiones no crezca sin límite entre repeticiones
+            jugador.truncar_decisiones(0)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor / (repeticiones * len(opciones)) * 1e9
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Microbenchmark de aplicación de efectos")
+    parser.add_argument("-r", "--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    historia = JuegoAventuraBase().historia
+    opciones = [opcion for nodo in historia.values() for opcion in nodo.opciones]
+    variantes = {
+        "diccionario": _por_diccionario,
+        "programa": lambda jugador, opcion: jugador.ejecutar(programa_opcion(opcion)),
+        "paso diccionario": _paso_diccionario,
+        "avanzar": lambda jugador, opcion: avanzar(jugador, 0, opcion),
+    }
+    print(f"{len(opciones)} opciones x {args.repeticiones} repeticiones")
+    base = None
+    for nombre, aplicar in variantes.items():
+        ns = medir(opciones, aplicar, args.repeticiones)
+        base = base or ns
+        print(f"  {nombre:<17} {ns:8.1f} ns/elección  (x{base / ns:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Búsqueda dirigida de finales raros.
+
+Dado un final, encuentra las secuencias de elecciones que llegan a él sin
+depender del muestreo aleatorio:
+  - con el índice inverso (``GrafoHistoria.predecesores``) se recorre el grafo
+    hacia atrás desde el final para saber qué nodos pueden llegar a él y a qué
+    distancia; las campañas cuya raíz no está entre ellos se descartan,
+  - el camino más corto se obtiene bajando por distancias decrecientes,
+  - los k caminos más probables (bajo juego aleatorio, uniforme o con pesos) se
+    obtienen con una búsqueda de primero el mejor sobre el coste -log(p),
+    podada a los nodos que pueden llegar al final; como los costes no son
+    negativos, los caminos salen en orden exacto de probabilidad.
+
+Uso: python busqueda_finales.py grayson_dificil_final_talon [-k 3]
+"""
+import argparse
+import difflib
+import heapq
+import math
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from grafo_historia import NODO_FALTANTE, GrafoHistoria, Pesos, cargar_historia
+
+# Límite de caminos parciales extraídos de la cola por búsqueda
+MAX_EXPANSIONES = 200000
+
+
+def resolver_final(grafo: GrafoHistoria, final: str) -> str:
+    """Id de un final (admite el id exacto o un sufijo único como ``final_talon``)"""
+    if final in grafo.indice:
+        return final
+    candidatos = [nodo_id for nodo_id in grafo.ids if nodo_id.endswith(final)]
+    if len(candidatos) == 1:
+        return candidatos[0]
+    if candidatos:
+        raise ValueError(f"'{final}' es ambiguo: {', '.join(sorted(candidatos))}")
+    parecidos = difflib.get_close_matches(final, grafo.ids, n=5)
+    raise ValueError(f"No existe el nodo '{final}'" + (f"; ¿quizá {', '.join(parecidos)}?" if parecidos else ""))
+
+
+def distancias_hasta(grafo: GrafoHistoria, destino: int) -> Dict[int, int]:
+    """Número mínimo de elecciones desde cada nodo que puede llegar a destino (BFS inverso)"""
+    distancia = {destino: 0}
+    frontera = [destino]
+    while frontera:
+        siguiente = []
+        for v in frontera:
+            for u, _ in grafo.predecesores[v]:
+                if u not in distancia and not grafo.es_final[u]:
+                    distancia[u] = distancia[v] + 1
+                    siguiente.append(u)
+        frontera = siguiente
+    return distancia
+
+
+def camino_mas_corto(grafo: GrafoHistoria, raiz: int, destino: int,
+                     distancia: Optional[Dict[int, int]] = None) -> Optional[List[Tuple[int, int]]]:
+    """Pares (nodo, opción) del camino más corto de raiz a destino (None si no hay)"""
+    distancia = distancia if distancia is not None else distancias_hasta(grafo, destino)
+    if raiz not in distancia:
+        return None
+    camino = []
+    u = raiz
+    while u != destino:
+        k = next(k for k, v in enumerate(grafo.sucesores[u])
+                 if v != NODO_FALTANTE and distancia.get(v) == distancia[u] - 1)
+        camino.append((u, k))
+        u = grafo.sucesores[u][k]
+    return camino
+
+
+def _probabilidades(grafo: GrafoHistoria, u: int, pesos: Pesos) -> List[float]:
+    opciones = grafo.opciones(u)
+    w = pesos.get(grafo.ids[u])
+    if w is None or len(w) != len(opciones) or sum(w) <= 0:
+        w = [1.0] * len(opciones)
+    total = float(sum(w))
+    return [peso / total for peso in w]
+
+
+def caminos_mas_probables(grafo: GrafoHistoria, raiz: int, destino: int, k: int = 3,
+                          pesos: Optional[Pesos] = None,
+                          distancia: Optional[Dict[int, int]] = None) -> List[Tuple[float, List[Tuple[int, int]]]]:
+    """Los k caminos de raiz a destino con mayor probabilidad: [(probabilidad, [(nodo, opción)])]"""
+    pesos = pesos or {}
+    distancia = distancia if distancia is not None else distancias_hasta(grafo, destino)
+    if raiz not in distancia:
+        return []
+    resultados = []
+    # Cola de (coste = -log p, desempate, nodo, camino como lista enlazada)
+    cola = [(0.0, 0, raiz, None)]
+    extraidos: Dict[int, int] = {}
+    contador = 1
+    expansiones = 0
+    while cola and len(resultados) < k and expansiones < MAX_EXPANSIONES:
+        coste, _, u, camino = heapq.heappop(cola)
+        expansiones += 1
+        if u == destino:
+            pasos = []
+            while camino is not None:
+                camino, paso = camino
+                pasos.append(paso)
+            resultados.append((math.exp(-coste), pasos[::-1]))
+            continue
+        # Un nodo no puede aparecer en más de k de los k mejores caminos más veces de las que se extrae
+        extraidos[u] = extraidos.get(u, 0) + 1
+        if extraidos[u] > k:
+            continue
+        for opcion, (v, p) in enumerate(zip(grafo.sucesores[u], _probabilidades(grafo, u, pesos))):
+            if p > 0 and v in distancia:
+                heapq.heappush(cola, (coste - math.log(p), contador, v, (camino, (u, opcion))))
+                contador += 1
+    return resultados
+
+
+def buscar(grafo: GrafoHistoria, final: str, k: int = 3, pesos: Optional[Pesos] = None,
+           raices: Optional[Dict[Tuple[str, str], int]] = None) -> dict:
+    """Caminos más cortos y más probables hacia un final desde cada campaña que lo alcanza"""
+    final = resolver_final(grafo, final)
+    destino = grafo.indice[final]
+    distancia = distancias_hasta(grafo, destino)
+    raices = raices if raices is not None else grafo.raices()
+    por_campana = {}
+    for clave, raiz in raices.items():
+        if raiz not in distancia:
+            continue
+        por_campana[clave] = {
+            "mas_corto": camino_mas_corto(grafo, raiz, destino, distancia),
+            "mas_probables": caminos_mas_probables(grafo, raiz, destino, k, pesos, distancia),
+        }
+    # Si ninguna campaña llega, los antecesores sin predecesores indican dónde se corta la historia
+    origenes = sorted(grafo.ids[u] for u in distancia if not grafo.predecesores[u] and u != destino)
+    return {"final": final, "nodos_que_llegan": len(distancia), "campanas": por_campana, "origenes": origenes}
+
+
+def describir(grafo: GrafoHistoria, camino: List[Tuple[int, int]]) -> List[str]:
+    """Texto de cada elección de un camino"""
+    return [f"{grafo.ids[u]}: «{grafo.opciones(u)[k]['texto']}»" for u, k in camino]
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Búsqueda dirigida de caminos hacia un final")
+    parser.add_argument("final", help="id del final (o un sufijo único)")
+    parser.add_argument("-k", type=int, default=3, help="número de caminos más probables")
+    args = parser.parse_args()
+
+    grafo = GrafoHistoria(cargar_historia())
+    try:
+        resultado = buscar(grafo, args.final, args.k)
+    except ValueError as e:
+        print(e)
+        return 1
+    print(f"Final: {resultado['final']}  ({resultado['nodos_que_llegan'] - 1} nodos pueden llegar a él)")
+    if not resultado["campanas"]:
+        print("Ninguna campaña llega a este final.")
+        if resultado["origenes"]:
+            print(f"Nodos sin predecesores que llevan a él: {', '.join(resultado['origenes'][:10])}")
+        return 1
+    for (personaje, dificultad), datos in resultado["campanas"].items():
+        print(f"\n== {personaje} / {dificultad} ==")
+        print(f"  Más corto ({len(datos['mas_corto'])} elecciones):")
+        for linea in describir(grafo, datos["mas_corto"]):
+            print(f"    {linea}")
+        for numero, (p, camino) in enumerate(datos["mas_probables"], 1):
+            print(f"  Más probable #{numero}: p = {p:.3e} ({len(camino)} elecciones)")
+            for linea in describir(grafo, camino):
+                print(f"    {linea}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
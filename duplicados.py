@@ -0,0 +1,189 @@
+"""
+Detección de descripciones casi duplicadas con MinHash + LSH.
+
+Cada ``NodoHistoria.descripcion`` se normaliza (minúsculas, sin tildes ni
+puntuación) y se reduce a su conjunto de k-gramas de caracteres. Una firma
+MinHash de ``num_perm`` valores estima la similitud de Jaccard entre dos textos;
+partiendo la firma en bandas (LSH) solo se comparan los pares que coinciden en
+alguna banda, así que el coste es casi lineal en número de nodos en lugar de
+cuadrático. Los candidatos se verifican con el Jaccard exacto y se agrupan en
+clusters (unión-búsqueda).
+
+Uso: python duplicados.py [umbral] [--json salida.json]
+"""
+import json
+import random
+import re
+import sys
+import unicodedata
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+from grafo_historia import cargar_historia
+
+# NumPy es opcional: acelera el cálculo de firmas
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    NUMPY_AVAILABLE = False
+
+PRIMO = (1 << 31) - 1  # primo de Mersenne; a*x cabe en 64 bits
+
+
+def normalizar(texto: str) -> str:
+    """Texto en minúsculas, sin tildes ni signos y con espacios simples"""
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    texto = re.sub(r"[^a-z0-9ñ ]+", " ", texto)
+    return " ".join(texto.split())
+
+
+def tejas(texto: str, k: int = 5) -> Set[int]:
+    """Conjunto de k-gramas de caracteres (hasheados a 32 bits) del texto normalizado"""
+    texto = normalizar(texto)
+    if len(texto) <= k:
+        return {zlib.crc32(texto.encode("utf-8")) % PRIMO} if texto else set()
+    return {zlib.crc32(texto[i:i + k].encode("utf-8")) % PRIMO for i in range(len(texto) - k + 1)}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Similitud de Jaccard exacta entre dos conjuntos"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def parametros_lsh(num_perm: int, umbral: float) -> Tuple[int, int]:
+    """(bandas, filas) con bandas * filas <= num_perm cuyo umbral (1/b)^(1/r) se acerca más al pedido"""
+    mejor = None
+    for filas in range(1, num_perm + 1):
+        bandas = num_perm // filas
+        error = abs((1.0 / bandas) ** (1.0 / filas) - umbral)
+        if mejor is None or error < mejor[0]:
+            mejor = (error, bandas, filas)
+    return mejor[1], mejor[2]
+
+
+class MinHash:
+    """Generador de firmas MinHash con permutaciones (a*x + b) mod p reproducibles"""
+
+    def __init__(self, num_perm: int = 128, semilla: int = 1):
+        rng = random.Random(semilla)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, PRIMO) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, PRIMO) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.int64)[:, None]
+            self._b = np.array(self.b, dtype=np.int64)[:, None]
+
+    def firma(self, conjunto: Set[int]) -> Tuple[int, ...]:
+        """Firma MinHash de un conjunto de enteros"""
+        if not conjunto:
+            return tuple([PRIMO] * self.num_perm)
+        if NUMPY_AVAILABLE:
+            x = np.fromiter(conjunto, dtype=np.int64, count=len(conjunto))[None, :]
+            return tuple(((self._a * x + self._b) % PRIMO).min(axis=1).tolist())
+        return tuple(min((a * x + b) % PRIMO for x in conjunto) for a, b in zip(self.a, self.b))
+
+
+def pares_similares(textos: Dict[str, str], umbral: float = 0.5, num_perm: int = 128,
+                    k: int = 5, semilla: int = 1) -> List[Tuple[str, str, float]]:
+    """Pares (id_a, id_b, jaccard) con similitud >= umbral, ordenados de mayor a menor"""
+    conjuntos = {clave: tejas(texto, k) for clave, texto in textos.items()}
+    minhash = MinHash(num_perm, semilla)
+    bandas, filas = parametros_lsh(num_perm, umbral)
+
+    cubetas: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+    for clave, conjunto in conjuntos.items():
+        if not conjunto:
+            continue
+        firma = minhash.firma(conjunto)
+        for banda in range(bandas):
+            trozo = firma[banda * filas:(banda + 1) * filas]
+            cubetas.setdefault((banda, trozo), []).append(clave)
+
+    candidatos: Set[Tuple[str, str]] = set()
+    for miembros in cubetas.values():
+        for i in range(len(miembros)):
+            for j in range(i + 1, len(miembros)):
+                a, b = miembros[i], miembros[j]
+                candidatos.add((a, b) if a < b else (b, a))
+
+    pares = []
+    for a, b in candidatos:
+        similitud = jaccard(conjuntos[a], conjuntos[b])
+        if similitud >= umbral:
+            pares.append((a, b, similitud))
+    pares.sort(key=lambda t: (-t[2], t[0], t[1]))
+    return pares
+
+
+def agrupar(pares: List[Tuple[str, str, float]]) -> List[Dict]:
+    """Clusters conexos de los pares similares con su similitud mínima y media"""
+    padre: Dict[str, str] = {}
+
+    def raiz(x):
+        while padre.setdefault(x, x) != x:
+            padre[x] = padre[padre[x]]
+            x = padre[x]
+        return x
+
+    for a, b, _ in pares:
+        ra, rb = raiz(a), raiz(b)
+        if ra != rb:
+            padre[max(ra, rb)] = min(ra, rb)
+
+    grupos: Dict[str, Dict] = {}
+    for a, b, similitud in pares:
+        grupo = grupos.setdefault(raiz(a), {"nodos": set(), "pares": []})
+        grupo["nodos"].update((a, b))
+        grupo["pares"].append((a, b, similitud))
+
+    clusters = []
+    for grupo in grupos.values():
+        similitudes = [s for _, _, s in grupo["pares"]]
+        clusters.append({
+            "nodos": sorted(grupo["nodos"]),
+            "similitud_min": min(similitudes),
+            "similitud_media": sum(similitudes) / len(similitudes),
+            "pares": grupo["pares"],
+        })
+    clusters.sort(key=lambda c: (-len(c["nodos"]), -c["similitud_media"]))
+    return clusters
+
+
+def clusters_descripciones(historia: Dict, umbral: float = 0.5, **kwargs) -> List[Dict]:
+    """Clusters de nodos de la historia con descripciones casi duplicadas"""
+    textos = {nodo_id: nodo.descripcion for nodo_id, nodo in historia.items()}
+    return agrupar(pares_similares(textos, umbral, **kwargs))
+
+
+def main():
+    """Imprimir (o exportar a JSON) los clusters de descripciones casi duplicadas"""
+    args = sys.argv[1:]
+    salida: Optional[str] = None
+    if "--json" in args:
+        pos = args.index("--json")
+        salida = args[pos + 1]
+        del args[pos:pos + 2]
+    umbral = float(args[0]) if args else 0.5
+
+    clusters = clusters_descripciones(cargar_historia(), umbral)
+    if salida:
+        with open(salida, "w", encoding="utf-8") as f:
+            json.dump(clusters, f, ensure_ascii=False, indent=2)
+        print(f"{len(clusters)} clusters guardados en {salida}")
+        return
+
+    print(f"{len(clusters)} clusters con similitud >= {umbral:g}")
+    for cluster in clusters:
+        print(f"\n[{len(cluster['nodos'])} nodos] media {cluster['similitud_media']:.2f}, "
+              f"mín {cluster['similitud_min']:.2f}")
+        for a, b, similitud in cluster["pares"]:
+            print(f"  {similitud:.2f}  {a}  ~  {b}")
+
+
+if __name__ == "__main__":
+    main()
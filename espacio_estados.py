@@ -0,0 +1,221 @@
+"""
+Enumeración exacta del espacio de estados (nodo, estadísticas, inventario).
+
+A diferencia del muestreo aleatorio, recorre todos los estados de juego
+distintos alcanzables desde la raíz de una campaña, memorizando por estado
+completo: nodo, (salud, reputacion, recursos) ya recortadas e inventario como
+máscara de bits. Después calcula sobre el grafo de estados:
+  - cuántas secuencias de elecciones llegan a cada estado (inf si pasan por un ciclo),
+  - la probabilidad de cada estado terminal bajo juego aleatorio (uniforme o con pesos).
+
+Si el número de estados supera el límite (p. ej. un ciclo que acumula recursos
+sin fin, o un grafo sintético enorme) se detiene con ``EspacioDemasiadoGrande``
+indicando cuánta memoria llevaría seguir.
+
+Uso: python espacio_estados.py [personaje dificultad] [--max-estados N] [--json salida.json]
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from analisis_markov import resolver_lineal
+from grafo_historia import (GrafoHistoria, NODO_FALTANTE, STATS_INICIALES, Pesos, aplicar_efectos,
+                            cargar_historia, componentes_fuertes, efectos_opcion, nodo_inicial)
+
+INFINITO = float("inf")
+
+# Estado: (nodo, salud, reputacion, recursos, máscara de items)
+Estado = Tuple[int, int, int, int, int]
+
+# Estados máximos antes de abandonar
+MAX_ESTADOS = 2_000_000
+
+# Coste aproximado en memoria de cada estado (tupla, entrada del índice y aristas)
+BYTES_POR_ESTADO = 400
+
+
+class EspacioDemasiadoGrande(MemoryError):
+    """El espacio de estados supera el límite configurado"""
+
+    def __init__(self, raiz: str, estados: int, pendientes: int):
+        self.estados = estados
+        self.pendientes = pendientes
+        self.bytes_estimados = (estados + pendientes) * BYTES_POR_ESTADO
+        super().__init__(
+            f"El espacio de estados de '{raiz}' supera {estados:,} estados "
+            f"(~{estados * BYTES_POR_ESTADO / 2**20:,.1f} MB) y quedan {pendientes:,} por expandir; "
+            f"seguir necesitaría al menos ~{self.bytes_estimados / 2**20:,.1f} MB. "
+            f"Sube max_estados o revisa los ciclos que acumulan estadísticas."
+        )
+
+
+class EspacioEstados:
+    """Grafo de estados alcanzables desde una raíz, con multiplicidades y probabilidades"""
+
+    def __init__(self, grafo: GrafoHistoria, raiz: str, pesos: Optional[Pesos] = None,
+                 max_estados: int = MAX_ESTADOS):
+        self.grafo = grafo
+        self.raiz = raiz
+        pesos = pesos or {}
+        faltantes = sorted({d for destinos in grafo.faltantes.values() for d in destinos})
+        self._faltantes = {destino: len(grafo) + k for k, destino in enumerate(faltantes)}
+        self._nombres_faltantes = {i: destino for destino, i in self._faltantes.items()}
+
+        self.estados: List[Estado] = []
+        self.indice: Dict[Estado, int] = {}
+        # Aristas de cada estado: (estado destino, probabilidad de la opción)
+        self.sucesores: List[List[Tuple[int, float]]] = []
+
+        inicial = (grafo.indice[raiz], *STATS_INICIALES, 0)
+        self._agregar(inicial)
+        pendientes = [0]
+        while pendientes:
+            e = pendientes.pop()
+            nodo, *stats, items = self.estados[e]
+            aristas = []
+            if nodo < len(grafo) and not grafo.es_final[nodo]:
+                opciones = grafo.opciones(nodo)
+                w = pesos.get(grafo.ids[nodo])
+                if w is None or len(w) != len(opciones) or sum(w) <= 0:
+                    w = [1.0] * len(opciones)
+                total = float(sum(w))
+                for opcion, destino, peso in zip(opciones, grafo.sucesores[nodo], w):
+                    if destino == NODO_FALTANTE:
+                        destino = self._faltantes[opcion["siguiente"]]
+                    nuevos = aplicar_efectos(tuple(stats), efectos_opcion(opcion))
+                    item = opcion.get("item")
+                    siguiente = (destino, *nuevos, items | (1 << grafo.indice_items[item]) if item else items)
+                    j = self.indice.get(siguiente)
+                    if j is None:
+                        if len(self.estados) >= max_estados:
+                            raise EspacioDemasiadoGrande(raiz, len(self.estados), len(pendientes) + 1)
+                        j = self._agregar(siguiente)
+                        pendientes.append(j)
+                    aristas.append((j, peso / total))
+            self.sucesores[e] = aristas
+
+        # Probabilidad de quedar atrapado en ciclos de estados sin salida
+        self.ciclos_cerrados: Dict[str, float] = {}
+        self.caminos, self.probabilidad = self._contar()
+
+    def _agregar(self, estado: Estado) -> int:
+        self.indice[estado] = len(self.estados)
+        self.estados.append(estado)
+        self.sucesores.append([])
+        return self.indice[estado]
+
+    def _contar(self) -> Tuple[List[float], List[float]]:
+        """Caminos que llegan a cada estado y probabilidad de terminar en cada estado terminal"""
+        n = len(self.estados)
+        caminos = [0] * n
+        masa = [0.0] * n
+        caminos[0] = 1
+        masa[0] = 1.0
+        probabilidad = [0.0] * n
+        adyacencia = [[j for j, _ in aristas] for aristas in self.sucesores]
+        for componente in reversed(componentes_fuertes(adyacencia)):
+            ciclico = len(componente) > 1 or componente[0] in adyacencia[componente[0]]
+            if not ciclico:
+                e = componente[0]
+                visitas = [masa[e]]
+                if not self.sucesores[e]:
+                    probabilidad[e] = masa[e]
+            else:
+                for e in componente:
+                    caminos[e] = INFINITO
+                posicion = {e: k for k, e in enumerate(componente)}
+                if all(j in posicion for e in componente for j, _ in self.sucesores[e]):
+                    # Ciclo cerrado: la masa que entra nunca termina la partida
+                    nombre = "ciclo:" + self.grafo.ids[self.estados[min(componente)][0]]
+                    self.ciclos_cerrados[nombre] = self.ciclos_cerrados.get(nombre, 0.0) + \
+                        sum(masa[e] for e in componente)
+                    continue
+                # Visitas esperadas dentro del ciclo: v_C (I - Q_C) = masa de entrada
+                a = [[1.0 if i == j else 0.0 for j in range(len(componente))] for i in range(len(componente))]
+                for e in componente:
+                    for j, p in self.sucesores[e]:
+                        if j in posicion:
+                            a[posicion[j]][posicion[e]] -= p
+                visitas = [x[0] for x in resolver_lineal(a, [[masa[e]] for e in componente])]
+            for e, v in zip(componente, visitas):
+                for j, p in self.sucesores[e]:
+                    if ciclico and j in componente:
+                        continue
+                    caminos[j] += caminos[e]
+                    masa[j] += v * p
+        return caminos, probabilidad
+
+    # ------------------- Consultas -------------------
+    def nombre_terminal(self, e: int) -> str:
+        """Nombre del desenlace de un estado terminal"""
+        nodo = self.estados[e][0]
+        if nodo in self._nombres_faltantes:
+            return "faltante:" + self._nombres_faltantes[nodo]
+        if self.grafo.es_final[nodo]:
+            return self.grafo.ids[nodo]
+        return "callejon:" + self.grafo.ids[nodo]
+
+    def terminales(self) -> List[int]:
+        """Estados en los que termina la partida"""
+        return [e for e, aristas in enumerate(self.sucesores) if not aristas]
+
+    def finales(self) -> Dict[str, Dict[str, float]]:
+        """Por desenlace: estados distintos, caminos y probabilidad exacta"""
+        resumen: Dict[str, Dict[str, float]] = {}
+        for e in self.terminales():
+            datos = resumen.setdefault(self.nombre_terminal(e), {"estados": 0, "caminos": 0, "probabilidad": 0.0})
+            datos["estados"] += 1
+            datos["caminos"] += self.caminos[e]
+            datos["probabilidad"] += self.probabilidad[e]
+        for nombre, p in self.ciclos_cerrados.items():
+            resumen[nombre] = {"estados": 0, "caminos": INFINITO, "probabilidad": p}
+        return resumen
+
+    def describir(self, e: int) -> dict:
+        """Estado legible: nodo, estadísticas e items"""
+        nodo, salud, reputacion, recursos, items = self.estados[e]
+        return {
+            "nodo": self.grafo.ids[nodo] if nodo < len(self.grafo) else "faltante:" + self._nombres_faltantes[nodo],
+            "salud": salud, "reputacion": reputacion, "recursos": recursos,
+            "items": [item for k, item in enumerate(self.grafo.items) if items >> k & 1],
+            "caminos": self.caminos[e],
+        }
+
+
+def main():
+    """Enumerar el espacio de estados de una o todas las campañas"""
+    parser = argparse.ArgumentParser(description="Enumeración exacta del espacio de estados")
+    parser.add_argument("personaje", nargs="?")
+    parser.add_argument("dificultad", nargs="?")
+    parser.add_argument("--max-estados", type=int, default=MAX_ESTADOS)
+    parser.add_argument("--json", dest="salida", default=None,
+                        help="guardar todos los estados alcanzables (solo con una campaña)")
+    args = parser.parse_args()
+
+    grafo = GrafoHistoria(cargar_historia())
+    if args.personaje:
+        raices = {(args.personaje, args.dificultad): nodo_inicial(args.personaje, args.dificultad)}
+    else:
+        raices = {clave: grafo.ids[i] for clave, i in grafo.raices().items()}
+
+    for (personaje, dificultad), raiz in raices.items():
+        print(f"\n== {personaje} / {dificultad} ==")
+        try:
+            espacio = EspacioEstados(grafo, raiz, max_estados=args.max_estados)
+        except EspacioDemasiadoGrande as e:
+            print(f"  {e}")
+            continue
+        print(f"  Estados alcanzables: {len(espacio.estados):,}  (terminales: {len(espacio.terminales()):,})")
+        for nombre, datos in sorted(espacio.finales().items(), key=lambda kv: -kv[1]["probabilidad"]):
+            caminos = "inf" if datos["caminos"] == INFINITO else f"{datos['caminos']:,}"
+            print(f"  {datos['probabilidad']:8.4%}  caminos {caminos:>8}  estados {datos['estados']:>5}  {nombre}")
+        if args.salida and len(raices) == 1:
+            with open(args.salida, "w", encoding="utf-8") as f:
+                json.dump([espacio.describir(e) for e in range(len(espacio.estados))], f,
+                          ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Exploración guiada por cobertura (al estilo de un fuzzer).
+
+Simula partidas como ``simulador`` pero, en vez de elegir al azar, prefiere en
+cada nodo la opción que lleva a lo que aún no se ha visto:
+  1. una opción (arista) que nunca se ha elegido,
+  2. la que lleva más cerca de una opción sin cubrir (distancia en el grafo,
+     calculada hacia atrás desde los nodos con opciones pendientes y
+     recalculada solo cuando se cubre una opción nueva),
+  3. una combinación (nodo, rango de salud, rango de reputación) nueva,
+deshaciendo los empates al azar. Cuenta la cobertura de nodos, opciones y
+rangos de estadísticas de cada campaña y la compara con el juego uniforme.
+
+Uso: python exploracion.py [personaje dificultad] [-n 100000] [--semilla 1] [--json cobertura.json]
+"""
+import argparse
+import json
+import random
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+from grafo_historia import NODO_FALTANTE, GrafoHistoria, aplicar_efectos, efectos_opcion, nodo_inicial
+from juego_base import JuegoAventuraBase, Jugador, NodoHistoria
+from simulador import Politica, simular_partida
+
+# Puntos de salud / reputación por rango de la cobertura de estadísticas
+ANCHO_RANGO = 25
+
+
+def rango(salud: int, reputacion: int) -> Tuple[int, int]:
+    """Rango de estadísticas usado en la cobertura"""
+    return salud // ANCHO_RANGO, reputacion // ANCHO_RANGO
+
+
+class Cobertura:
+    """Nodos, opciones y rangos de estadísticas ejercitados en una campaña"""
+
+    def __init__(self, grafo: GrafoHistoria, raiz: str):
+        self.grafo = grafo
+        self.raiz = raiz
+        self.alcanzables = grafo.alcanzables(grafo.indice[raiz])
+        # Cada opción jugable (de un nodo no final) tiene un número de arista
+        self.aristas: Dict[Tuple[int, int], int] = {}
+        for u in self.alcanzables:
+            if not grafo.es_final[u]:
+                for k in range(len(grafo.sucesores[u])):
+                    self.aristas[(u, k)] = len(self.aristas)
+        self.nodos_vistos: Set[int] = {grafo.indice[raiz]}
+        self.aristas_vistas: Dict[int, int] = {}
+        self.rangos_vistos: Set[Tuple[int, int, int]] = set()
+        self.faltantes_vistos: Set[str] = set()
+        self.partidas = 0
+        # Distancia de cada nodo a la opción sin cubrir más cercana (None = recalcular)
+        self._distancia: Optional[Dict[int, int]] = None
+
+    def _distancias(self) -> Dict[int, int]:
+        """BFS hacia atrás desde los nodos que aún tienen opciones sin cubrir"""
+        if self._distancia is None:
+            distancia = {u: 0 for (u, _), a in self.aristas.items() if a not in self.aristas_vistas}
+            frontera = list(distancia)
+            while frontera:
+                siguiente = []
+                for v in frontera:
+                    for u, k in self.grafo.predecesores[v]:
+                        if u not in distancia and (u, k) in self.aristas:
+                            distancia[u] = distancia[v] + 1
+                            siguiente.append(u)
+                frontera = siguiente
+            self._distancia = distancia
+        return self._distancia
+
+    def registrar(self, u: int, k: int, jugador: Jugador):
+        """Anotar que en el nodo u se eligió la opción k (con las estadísticas previas del jugador)"""
+        arista = self.aristas[(u, k)]
+        if arista not in self.aristas_vistas:
+            self._distancia = None
+        self.aristas_vistas[arista] = self.aristas_vistas.get(arista, 0) + 1
+        self.rangos_vistos.add((u, *rango(jugador.salud, jugador.reputacion)))
+        v = self.grafo.sucesores[u][k]
+        if v == NODO_FALTANTE:
+            self.faltantes_vistos.add(self.grafo.opciones(u)[k]["siguiente"])
+        else:
+            self.nodos_vistos.add(v)
+
+    def novedad(self, u: int, k: int, stats: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Puntuación de exploración de la opción k del nodo u (mayor es más nueva)"""
+        arista = self.aristas[(u, k)]
+        nueva = 0 if arista in self.aristas_vistas else 1
+        v = self.grafo.sucesores[u][k]
+        distancia = None if v == NODO_FALTANTE else self._distancias().get(v)
+        cercania = -len(self.aristas) if distancia is None else -distancia
+        salud, reputacion, _ = aplicar_efectos(stats, efectos_opcion(self.grafo.opciones(u)[k]))
+        rango_nuevo = 0 if v == NODO_FALTANTE or (v, *rango(salud, reputacion)) in self.rangos_vistos else 1
+        return nueva, cercania, rango_nuevo
+
+    def completa(self) -> bool:
+        """Todas las opciones alcanzables se han elegido al menos una vez"""
+        return len(self.aristas_vistas) == len(self.aristas)
+
+    def informe(self) -> dict:
+        """Porcentajes de cobertura de la campaña y de toda la historia"""
+        total_historia = len(self.grafo)
+        opciones_historia = sum(len(s) for s in self.grafo.sucesores)
+        return {
+            "raiz": self.raiz,
+            "partidas": self.partidas,
+            "nodos": len(self.nodos_vistos),
+            "nodos_alcanzables": len(self.alcanzables),
+            "opciones": len(self.aristas_vistas),
+            "opciones_alcanzables": len(self.aristas),
+            "rangos": len(self.rangos_vistos),
+            "faltantes": sorted(self.faltantes_vistos),
+            "cobertura_nodos": len(self.nodos_vistos) / len(self.alcanzables),
+            "cobertura_opciones": len(self.aristas_vistas) / max(1, len(self.aristas)),
+            "cobertura_historia_nodos": len(self.nodos_vistos) / total_historia,
+            "cobertura_historia_opciones": len(self.aristas_vistas) / max(1, opciones_historia),
+            "sin_cubrir": [f"{self.grafo.ids[u]}[{k}]" for (u, k), a in self.aristas.items()
+                           if a not in self.aristas_vistas],
+        }
+
+
+class PoliticaCobertura:
+    """Política que elige la opción más nueva según la cobertura (o al azar si guiada=False)"""
+
+    def __init__(self, cobertura: Cobertura, guiada: bool = True):
+        self.cobertura = cobertura
+        self.guiada = guiada
+
+    def __call__(self, nodo: NodoHistoria, jugador: Jugador, rng: random.Random) -> int:
+        # Por la clave con la que se llegó al nodo: algún nodo tiene un ``id`` distinto de su clave
+        u = self.cobertura.grafo.indice[jugador.nodo_actual]
+        if self.guiada:
+            stats = (jugador.salud, jugador.reputacion, jugador.recursos)
+            puntos = [self.cobertura.novedad(u, k, stats) for k in range(len(nodo.opciones))]
+            mejor = max(puntos)
+            k = rng.choice([k for k, p in enumerate(puntos) if p == mejor])
+        else:
+            k = rng.randrange(len(nodo.opciones))
+        self.cobertura.registrar(u, k, jugador)
+        return k
+
+
+def explorar(historia: Dict[str, NodoHistoria], raiz: str, partidas: int, semilla: Optional[int] = None,
+             guiada: bool = True, grafo: Optional[GrafoHistoria] = None) -> Cobertura:
+    """Jugar hasta ``partidas`` partidas o hasta cubrir todas las opciones alcanzables"""
+    cobertura = Cobertura(grafo or GrafoHistoria(historia), raiz)
+    politica: Politica = PoliticaCobertura(cobertura, guiada)
+    rng = random.Random(semilla)
+    while cobertura.partidas < partidas and not cobertura.completa():
+        simular_partida(historia, raiz, politica, rng)
+        cobertura.partidas += 1
+    return cobertura
+
+
+def main():
+    """Comparar la exploración guiada con el juego uniforme en cada campaña"""
+    parser = argparse.ArgumentParser(description="Exploración guiada por cobertura")
+    parser.add_argument("personaje", nargs="?")
+    parser.add_argument("dificultad", nargs="?", default="facil")
+    parser.add_argument("-n", "--partidas", type=int, default=100000, help="máximo de partidas por campaña")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--json", dest="salida", default=None, help="guardar el informe de cobertura")
+    args = parser.parse_args()
+
+    juego = JuegoAventuraBase()
+    grafo = GrafoHistoria(juego.historia)
+    if args.personaje:
+        raices = [nodo_inicial(args.personaje, args.dificultad)]
+    else:
+        raices = [grafo.ids[i] for i in grafo.raices().values()]
+
+    informes: List[dict] = []
+    for raiz in raices:
+        guiada = explorar(juego.historia, raiz, args.partidas, args.semilla, True, grafo).informe()
+        uniforme = explorar(juego.historia, raiz, args.partidas, args.semilla, False, grafo).informe()
+        informes.append({"guiada": guiada, "uniforme": uniforme})
+        print(f"\n== {raiz} ==")
+        for nombre, datos in (("guiada", guiada), ("uniforme", uniforme)):
+            print(f"  {nombre:<9} {datos['partidas']:>7} partidas  "
+                  f"nodos {datos['nodos']}/{datos['nodos_alcanzables']} ({datos['cobertura_nodos']:.1%})  "
+                  f"opciones {datos['opciones']}/{datos['opciones_alcanzables']} "
+                  f"({datos['cobertura_opciones']:.1%})  rangos {datos['rangos']}")
+        if guiada["sin_cubrir"]:
+            print(f"  sin cubrir: {', '.join(guiada['sin_cubrir'][:10])}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(informes, f, ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
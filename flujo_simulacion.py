@@ -0,0 +1,282 @@
+"""
+Simulación como flujo de generadores con agregación en línea.
+
+Ninguna etapa guarda las partidas: cada una consume el generador anterior y
+produce el siguiente, así que la memoria no depende del número de partidas.
+
+    fuente_partidas   ->   resumir   ->   agregadores
+    (juega y emite eventos)   (una fila por partida)
+
+  - ``fuente_partidas`` juega cada elección con ``juego_base.avanzar`` (el mismo
+    paso que el juego y los simuladores) y emite eventos ``("inicio", raiz,
+    jugador)``, ``("eleccion", consecuencia)`` y ``("fin", resultado,
+    jugador)``. Cuando se emite un evento su efecto ya está aplicado, así que
+    las etapas siguientes solo leen: el jugador es el de la partida en curso y
+    no deben modificarlo.
+  - ``resumir`` convierte los eventos de cada partida en un resumen como el de
+    ``simulador.simular_partida`` más el camino recorrido.
+  - Los agregadores (``Welford``, ``Histograma``, ``ContadorFinales``,
+    ``TopCaminos`` o cualquier objeto con ``agregar(resumen)`` y
+    ``resultado()``, incluido ``ResultadosSimulacion``) se alimentan fila a fila.
+
+Se pueden intercalar etapas propias (cualquier función generador -> generador),
+tanto sobre los eventos (entre la fuente y ``resumir``) como sobre los
+resúmenes con ``ejecutar(..., etapas=[...])``.
+
+Uso: python flujo_simulacion.py jason dificil -n 1000000 [--semilla 1] [--top 5]
+"""
+import argparse
+import heapq
+import random
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from grafo_historia import STATS, nodo_inicial
+from juego_base import JuegoAventuraBase, Jugador, NodoHistoria, avanzar
+from simulador import MAX_PASOS, Politica, politica_uniforme
+
+# Una etapa transforma un flujo de eventos o de resúmenes en otro
+Etapa = Callable[[Iterator], Iterator]
+
+
+# ------------------- Etapas -------------------
+def fuente_partidas(historia: Dict[str, NodoHistoria], raiz: str, partidas: int,
+                    rng: random.Random, politica: Politica = politica_uniforme,
+                    max_pasos: int = MAX_PASOS) -> Iterator[tuple]:
+    """Jugar ``partidas`` partidas desde raiz y emitir sus eventos"""
+    for _ in range(partidas):
+        jugador = Jugador("Simulación")
+        jugador.nodo_actual = raiz
+        yield ("inicio", raiz, jugador)
+        resultado = "limite"
+        for _ in range(max_pasos):
+            nodo = historia.get(jugador.nodo_actual)
+            if nodo is None:
+                resultado = "faltante:" + jugador.nodo_actual
+                break
+            if nodo.es_final:
+                resultado = nodo.id
+                break
+            if not nodo.opciones:
+                resultado = "callejon:" + nodo.id
+                break
+            k = politica(nodo, jugador, rng)
+            yield ("eleccion", avanzar(jugador, k, nodo.opciones[k]))
+        yield ("fin", resultado, jugador)
+
+
+def resumir(eventos: Iterable[tuple]) -> Iterator[dict]:
+    """Un resumen por partida: final, pasos, estadísticas, items y camino (ids de nodo)"""
+    camino: List[str] = []
+    for evento in eventos:
+        if evento[0] == "inicio":
+            camino = [evento[1]]
+        elif evento[0] == "eleccion":
+            camino.append(evento[1].siguiente)
+        else:
+            _, resultado, jugador = evento
+            yield {
+                "final": resultado,
+                "pasos": len(camino) - 1,
+                "salud": jugador.salud,
+                "reputacion": jugador.reputacion,
+                "recursos": jugador.recursos,
+                "items": jugador.num_items,
+                "camino": tuple(camino),
+            }
+
+
+def filtrar(condicion: Callable[[dict], bool]) -> Etapa:
+    """Etapa que deja pasar solo los resúmenes que cumplen la condición"""
+    def etapa(resumenes: Iterable[dict]) -> Iterator[dict]:
+        return (r for r in resumenes if condicion(r))
+    return etapa
+
+
+# ------------------- Agregadores en línea -------------------
+class Welford:
+    """Media y varianza de un campo en una pasada (algoritmo de Welford)"""
+
+    def __init__(self, campo: str):
+        self.campo = campo
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, resumen: dict):
+        x = resumen[self.campo]
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (x - self.media)
+        self.minimo = x if self.minimo is None else min(self.minimo, x)
+        self.maximo = x if self.maximo is None else max(self.maximo, x)
+
+    def combinar(self, otro: "Welford"):
+        """Unir con otro acumulador del mismo campo (fórmula de Chan)"""
+        if not otro.n:
+            return
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.media += delta * otro.n / n
+        self.n = n
+        self.minimo = otro.minimo if self.minimo is None else min(self.minimo, otro.minimo)
+        self.maximo = otro.maximo if self.maximo is None else max(self.maximo, otro.maximo)
+
+    def resultado(self) -> dict:
+        varianza = self.m2 / self.n if self.n else 0.0
+        return {"n": self.n, "media": self.media, "desviacion": varianza ** 0.5,
+                "min": self.minimo, "max": self.maximo}
+
+
+class Histograma:
+    """Histograma de un campo numérico en cubetas de ``ancho``"""
+
+    def __init__(self, campo: str, ancho: int = 1):
+        self.campo = campo
+        self.ancho = ancho
+        self.cuentas = Counter()
+
+    def agregar(self, resumen: dict):
+        self.cuentas[resumen[self.campo] // self.ancho * self.ancho] += 1
+
+    def resultado(self) -> Dict[int, int]:
+        return dict(sorted(self.cuentas.items()))
+
+
+class ContadorFinales:
+    """Número de partidas que terminan en cada final"""
+
+    def __init__(self):
+        self.cuentas = Counter()
+
+    def agregar(self, resumen: dict):
+        self.cuentas[resumen["final"]] += 1
+
+    def resultado(self) -> Dict[str, int]:
+        return dict(self.cuentas.most_common())
+
+
+class TopCaminos:
+    """Caminos más frecuentes con memoria acotada (algoritmo Space-Saving).
+
+    Guarda como mucho ``capacidad`` caminos; los k primeros son exactos si su
+    frecuencia supera partidas / capacidad, y ``error`` acota la sobreestimación.
+    El camino con menos cuenta se busca en un montículo con invalidación
+    perezosa: sumar a un camino no toca el montículo y, al sacar una entrada con
+    una cuenta antigua, se vuelve a meter con la actual. Cada partida cuesta
+    O(log capacidad) amortizado.
+    """
+
+    def __init__(self, k: int = 10, capacidad: int = 1000):
+        self.k = k
+        self.capacidad = capacidad
+        self.cuentas: Dict[Tuple[str, ...], int] = {}
+        self.error: Dict[Tuple[str, ...], int] = {}
+        # (cuenta cuando se metió, orden de llegada, camino): una entrada por camino guardado
+        self._monticulo: List[Tuple[int, int, Tuple[str, ...]]] = []
+        self._llegadas = 0
+
+    def _meter(self, camino: Tuple[str, ...]):
+        self._llegadas += 1
+        heapq.heappush(self._monticulo, (self.cuentas[camino], self._llegadas, camino))
+
+    def _sacar_minimo(self) -> Tuple[str, ...]:
+        """Quitar del montículo el camino con menos cuenta (sigue en ``cuentas``)"""
+        while True:
+            cuenta, _, camino = heapq.heappop(self._monticulo)
+            if self.cuentas[camino] == cuenta:
+                return camino
+            self._meter(camino)
+
+    def agregar(self, resumen: dict):
+        camino = resumen["camino"]
+        if camino in self.cuentas:
+            self.cuentas[camino] += 1
+            return
+        if len(self.cuentas) < self.capacidad:
+            self.cuentas[camino] = 1
+            self.error[camino] = 0
+        else:
+            # Sustituir el camino menos frecuente: el nuevo hereda su cuenta como cota de error
+            minimo = self._sacar_minimo()
+            cuenta = self.cuentas.pop(minimo)
+            del self.error[minimo]
+            self.cuentas[camino] = cuenta + 1
+            self.error[camino] = cuenta
+        self._meter(camino)
+
+    def resultado(self) -> List[Tuple[Tuple[str, ...], int, int]]:
+        """[(camino, cuenta, error máximo)] de los k más frecuentes"""
+        mejores = heapq.nlargest(self.k, self.cuentas.items(), key=lambda kv: kv[1])
+        return [(camino, cuenta, self.error[camino]) for camino, cuenta in mejores]
+
+
+def agregadores_por_defecto(top: int = 10) -> Dict[str, object]:
+    """Finales, media/varianza de cada estadística y de los pasos, histograma de pasos y top de caminos"""
+    agregadores: Dict[str, object] = {"finales": ContadorFinales()}
+    for campo in ("pasos", "items") + STATS:
+        agregadores[campo] = Welford(campo)
+    agregadores["histograma_pasos"] = Histograma("pasos")
+    agregadores["caminos"] = TopCaminos(top)
+    return agregadores
+
+
+# ------------------- Ejecución -------------------
+def ejecutar(fuente: Iterator[tuple], agregadores: Dict[str, object],
+             etapas: Optional[List[Etapa]] = None) -> Dict[str, object]:
+    """Encadenar la fuente con ``resumir`` y las etapas extra, y alimentar los
+    agregadores. Devuelve {nombre: agregador}."""
+    flujo = resumir(fuente)
+    for etapa in etapas or []:
+        flujo = etapa(flujo)
+    destinos = list(agregadores.values())
+    for resumen in flujo:
+        for agregador in destinos:
+            agregador.agregar(resumen)
+    return agregadores
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulación en flujo con agregación en línea")
+    parser.add_argument("personaje")
+    parser.add_argument("dificultad", nargs="?", default="facil")
+    parser.add_argument("-n", "--partidas", type=int, default=100000)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--top", type=int, default=5, help="caminos más frecuentes a mostrar")
+    args = parser.parse_args()
+
+    juego = JuegoAventuraBase()
+    raiz = nodo_inicial(args.personaje, args.dificultad)
+    if raiz not in juego.historia:
+        parser.error(f"Nodo raíz '{raiz}' no encontrado")
+
+    inicio = time.perf_counter()
+    fuente = fuente_partidas(juego.historia, raiz, args.partidas, random.Random(args.semilla))
+    agregadores = ejecutar(fuente, agregadores_por_defecto(args.top))
+    duracion = time.perf_counter() - inicio
+
+    print(f"Campaña: {raiz}  ({args.partidas} partidas, {args.partidas / duracion:,.0f} partidas/segundo)")
+    print("\nFINALES:")
+    for final, n in agregadores["finales"].resultado().items():
+        print(f"  {n / args.partidas:8.4%}  {final}")
+    print()
+    for campo in ("pasos", "items") + STATS:
+        r = agregadores[campo].resultado()
+        print(f"{campo.capitalize():<11} media {r['media']:7.2f}  desv {r['desviacion']:6.2f}  "
+              f"mín {r['min']}  máx {r['max']}")
+    print("\nCAMINOS MÁS FRECUENTES:")
+    for camino, n, error in agregadores["caminos"].resultado():
+        cota = f" (±{error})" if error else ""
+        print(f"  {n}{cota}  {' → '.join(camino[1:])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
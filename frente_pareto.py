@@ -0,0 +1,116 @@
+"""
+Frente de Pareto de las estadísticas finales alcanzables en cada final.
+
+Para cada final calcula el conjunto de tripletas (salud, reputacion, recursos)
+no dominadas que algún camino puede conseguir, aplicando el recorte de
+``Jugador.modificar_stat``. Como sumar y recortar es monótono, si un estado
+domina a otro al llegar a un nodo lo sigue dominando tras cualquier camino; por
+eso basta con propagar hacia adelante el frente de cada nodo (programación
+dinámica) y podar los estados dominados en cada paso, sin enumerar caminos.
+
+Con ``sentido="min"`` se obtiene el frente de los peores resultados posibles.
+Si un ciclo de la historia permite acumular recursos sin límite, esos puntos
+aparecen con ``recursos = inf``.
+
+Uso: python frente_pareto.py [max|min]
+"""
+import sys
+from typing import Dict, Iterable, List, Set, Tuple
+
+from grafo_historia import (GrafoHistoria, NODO_FALTANTE, STATS_INICIALES, aplicar_efectos,
+                            cargar_historia, componentes_fuertes, efectos_opcion)
+
+Estado = Tuple[int, int, int]
+
+INFINITO = float("inf")
+
+# Rondas por nodo de un ciclo antes de dar por no acotados los recursos que siguen creciendo
+RONDAS_ANTES_DE_ENSANCHAR = 10
+
+
+def podar(estados: Iterable[Estado], sentido: str = "max") -> List[Estado]:
+    """Estados no dominados, ordenados (el mejor primero según la primera estadística)"""
+    signo = 1 if sentido == "max" else -1
+    candidatos = sorted(set(estados), key=lambda e: tuple(-signo * x for x in e))
+    frente: List[Estado] = []
+    for estado in candidatos:
+        dominado = False
+        for otro in frente:
+            if all(signo * o >= signo * e for o, e in zip(otro, estado)):
+                dominado = True
+                break
+        if not dominado:
+            frente.append(estado)
+    return frente
+
+
+def fronteras(grafo: GrafoHistoria, raiz: str, sentido: str = "max") -> Dict[str, List[Estado]]:
+    """Frente de Pareto de cada final alcanzable desde raiz"""
+    inicio = grafo.indice[raiz]
+    nodos = grafo.alcanzables(inicio)
+    efectos = {u: [efectos_opcion(opcion) for opcion in grafo.opciones(u)] for u in nodos}
+    frente: Dict[int, Set[Estado]] = {u: set() for u in nodos}
+    frente[inicio].add(tuple(STATS_INICIALES))
+
+    def propagar(u: int) -> Dict[int, List[Estado]]:
+        salida: Dict[int, List[Estado]] = {}
+        if grafo.es_final[u]:
+            return salida
+        for v, efecto in zip(grafo.sucesores[u], efectos[u]):
+            if v != NODO_FALTANTE:
+                salida.setdefault(v, []).extend(aplicar_efectos(e, efecto) for e in frente[u])
+        return salida
+
+    # Componentes en orden topológico: cuando se procesa una, sus entradas ya están completas
+    for componente in reversed(componentes_fuertes(grafo.sucesores, nodos)):
+        miembros = set(componente)
+        pendientes = list(componente)
+        rondas = 0
+        while pendientes:
+            rondas += 1
+            u = pendientes.pop()
+            for v, estados in propagar(u).items():
+                if sentido == "max" and v in miembros and rondas > RONDAS_ANTES_DE_ENSANCHAR * len(componente):
+                    # Recursos (sin máximo) que siguen creciendo al volver con la misma salud y reputación
+                    previos = {e[:2]: e[2] for e in frente[v]}
+                    estados = [e[:2] + (INFINITO,) if e[2] > previos.get(e[:2], INFINITO) else e
+                               for e in estados]
+                nuevo = set(podar(frente[v] | set(estados), sentido))
+                if nuevo != frente[v]:
+                    frente[v] = nuevo
+                    if v in miembros and v not in pendientes:
+                        pendientes.append(v)
+
+    return {grafo.ids[u]: podar(frente[u], sentido) for u in nodos if grafo.es_final[u] and frente[u]}
+
+
+def fronteras_por_campana(grafo: GrafoHistoria, sentido: str = "max") -> Dict[Tuple[str, str], Dict[str, List[Estado]]]:
+    """Frentes de Pareto de los finales de cada campaña (personaje, dificultad)"""
+    return {clave: fronteras(grafo, grafo.ids[raiz], sentido) for clave, raiz in grafo.raices().items()}
+
+
+def en_frente(estado: Estado, frente: List[Estado], sentido: str = "max") -> bool:
+    """Indica si un estado final no está dominado por ningún punto del frente"""
+    signo = 1 if sentido == "max" else -1
+    return not any(otro != tuple(estado) and all(signo * o >= signo * e for o, e in zip(otro, estado))
+                   for otro in frente)
+
+
+def _formato(valor) -> str:
+    return "inf" if valor == INFINITO else f"{valor:3d}"
+
+
+def main():
+    """Imprimir el frente de Pareto de cada final de cada campaña"""
+    sentido = sys.argv[1] if len(sys.argv) > 1 else "max"
+    grafo = GrafoHistoria(cargar_historia())
+    for (personaje, dificultad), por_final in fronteras_por_campana(grafo, sentido).items():
+        print(f"\n== {personaje} / {dificultad} ==")
+        for final, frente in sorted(por_final.items()):
+            print(f"  {final}: {len(frente)} puntos")
+            for salud, reputacion, recursos in frente:
+                print(f"    ❤️ {salud:3d}  ⭐ {reputacion:3d}  💎 {_formato(recursos)}")
+
+
+if __name__ == "__main__":
+    main()
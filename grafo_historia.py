@@ -0,0 +1,305 @@
+"""
+Representación compilada del grafo de historia.
+
+Convierte el diccionario ``historia`` de ``JuegoAventuraBase`` (id -> NodoHistoria)
+en una forma indexada por enteros que usan los módulos de análisis: índice de nodos,
+sucesores por opción, aristas inversas y raíces de cada campaña.
+No importa nada de la interfaz (Tk, PIL, pygame).
+"""
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Mismo mapeo que usa la GUI para construir el nodo inicial de cada campaña
+PREFIJOS_POR_PERSONAJE = {
+    "jason": "jason",     # Red Hood
+    "dick": "grayson",    # Nightwing usa prefijo 'grayson_'
+    "tim": "tim",         # Red Robin
+    "damian": "damian"    # Robin
+}
+DIFICULTADES = ("facil", "normal", "dificil")
+
+# Índice usado en ``sucesores`` cuando una opción apunta a un nodo inexistente
+NODO_FALTANTE = -1
+
+# Pesos por nodo: id de nodo -> peso de cada opción (en el orden de nodo.opciones)
+Pesos = Dict[str, List[float]]
+
+# Estadísticas del jugador: valores iniciales y límites (mismas reglas que Jugador.modificar_stat)
+STATS = ("salud", "reputacion", "recursos")
+STATS_INICIALES = (100, 50, 3)
+LIMITES = ((0, 100), (0, 100), (0, None))
+
+
+def nodo_inicial(personaje: str, dificultad: str) -> str:
+    """Id del nodo raíz de la campaña (personaje, dificultad)"""
+    prefijo = PREFIJOS_POR_PERSONAJE.get(personaje, personaje)
+    return f"{prefijo}_{dificultad}_inicio"
+
+
+def campanas(historia: Dict) -> Dict[Tuple[str, str], str]:
+    """Raíces de todas las campañas (personaje, dificultad) presentes en la historia"""
+    raices = {}
+    for personaje in PREFIJOS_POR_PERSONAJE:
+        for dificultad in DIFICULTADES:
+            raiz = nodo_inicial(personaje, dificultad)
+            if raiz in historia:
+                raices[(personaje, dificultad)] = raiz
+    return raices
+
+
+def efectos_opcion(opcion: dict) -> List[Tuple[int, int]]:
+    """Efectos de una opción como pares (posición en STATS, cambio), en orden de aplicación"""
+    efectos = []
+    for clave_stat, clave_cambio in (("stat", "cambio"), ("stat2", "cambio2")):
+        stat = opcion.get(clave_stat)
+        if stat in STATS:
+            efectos.append((STATS.index(stat), opcion.get(clave_cambio, 0)))
+    return efectos
+
+
+# Posición del bit de cada item en el inventario de Jugador (global al proceso, para
+# que los programas de efectos la lleven ya resuelta)
+ITEMS: List[str] = []
+INDICE_ITEMS: Dict[str, int] = {}
+
+
+def indice_item(item: str) -> int:
+    """Posición del bit de un item (se asigna la primera vez que aparece)"""
+    indice = INDICE_ITEMS.get(item)
+    if indice is None:
+        indice = INDICE_ITEMS[item] = len(ITEMS)
+        ITEMS.append(item)
+    return indice
+
+
+# Programa de efectos compilado de una opción: ((posición, cambio, mínimo, máximo), ...)
+# y el bit del item que da en el inventario (None si no da ninguno)
+ProgramaEfectos = Tuple[Tuple[Tuple[int, int, int, int], ...], Optional[int]]
+
+
+def compilar_efectos(opcion: dict) -> ProgramaEfectos:
+    """Compilar los efectos de una opción a un programa sin nombres.
+
+    Cada paso lleva la posición en STATS, el cambio y los límites ya resueltos
+    (``sys.maxsize`` si no hay máximo); los cambios nulos se omiten. El item se
+    guarda como su bit del inventario (``indice_item``).
+    """
+    pasos = tuple((posicion, cambio, LIMITES[posicion][0],
+                   sys.maxsize if LIMITES[posicion][1] is None else LIMITES[posicion][1])
+                  for posicion, cambio in efectos_opcion(opcion) if cambio)
+    item = opcion.get("item")
+    return pasos, indice_item(item) if item else None
+
+
+class Opcion(dict):
+    """Opción de un nodo: el mismo diccionario de siempre, con su programa de
+    efectos compilado al crearla (al construir la historia) y recompilado en cuanto
+    se edita (recarga en caliente, sensibilidad), así que nunca se aplica un
+    efecto antiguo."""
+    __slots__ = ("programa",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.programa: ProgramaEfectos = compilar_efectos(self)
+
+    def __reduce__(self):
+        # Los bits de los items son del proceso: al copiar o deserializar se recompila
+        return type(self), (dict(self),)
+
+    def __setitem__(self, clave, valor):
+        super().__setitem__(clave, valor)
+        self.programa = compilar_efectos(self)
+
+    def __delitem__(self, clave):
+        super().__delitem__(clave)
+        self.programa = compilar_efectos(self)
+
+    def __ior__(self, otro):
+        super().__ior__(otro)
+        self.programa = compilar_efectos(self)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.programa = compilar_efectos(self)
+
+    def setdefault(self, clave, defecto=None):
+        valor = super().setdefault(clave, defecto)
+        self.programa = compilar_efectos(self)
+        return valor
+
+    def pop(self, clave, *defecto):
+        valor = super().pop(clave, *defecto)
+        self.programa = compilar_efectos(self)
+        return valor
+
+    def popitem(self):
+        par = super().popitem()
+        self.programa = compilar_efectos(self)
+        return par
+
+    def clear(self):
+        super().clear()
+        self.programa = compilar_efectos(self)
+
+
+def programa_opcion(opcion: dict) -> ProgramaEfectos:
+    """Programa de efectos de una opción (el de la ``Opcion``; un dict normal se
+    compila cada vez)"""
+    if isinstance(opcion, Opcion):
+        return opcion.programa
+    return compilar_efectos(opcion)
+
+
+def limitar(posicion: int, valor):
+    """Recortar un valor de estadística a sus límites"""
+    minimo, maximo = LIMITES[posicion]
+    valor = max(minimo, valor)
+    return valor if maximo is None else min(maximo, valor)
+
+
+def aplicar_efectos(valores: Tuple, efectos: List[Tuple[int, int]]) -> Tuple:
+    """Aplicar efectos a una tupla (salud, reputacion, recursos)"""
+    valores = list(valores)
+    for posicion, cambio in efectos:
+        valores[posicion] = limitar(posicion, valores[posicion] + cambio)
+    return tuple(valores)
+
+
+def cargar_historia() -> Dict:
+    """Construir la historia completa del juego"""
+    from juego_base import JuegoAventuraBase
+    return JuegoAventuraBase().historia
+
+
+def componentes_fuertes(sucesores: List[List[int]],
+                        nodos: Optional[Iterable[int]] = None) -> List[List[int]]:
+    """Componentes fuertemente conexas de una lista de adyacencia (Tarjan iterativo).
+
+    Se devuelven en orden topológico inverso: cada componente aparece después
+    de todas las componentes a las que puede llegar. Las aristas hacia
+    NODO_FALTANTE o hacia nodos fuera de ``nodos`` se ignoran.
+    """
+    if nodos is None:
+        nodos = range(len(sucesores))
+    nodos = list(nodos)
+    dentro = set(nodos)
+    indice = {}
+    bajo = {}
+    en_pila = set()
+    pila = []
+    componentes = []
+    contador = 0
+    for inicio in nodos:
+        if inicio in indice:
+            continue
+        trabajo = [(inicio, 0)]
+        while trabajo:
+            u, k = trabajo.pop()
+            if k == 0:
+                indice[u] = bajo[u] = contador
+                contador += 1
+                pila.append(u)
+                en_pila.add(u)
+            destinos = sucesores[u]
+            while k < len(destinos):
+                v = destinos[k]
+                k += 1
+                if v == NODO_FALTANTE or v not in dentro:
+                    continue
+                if v not in indice:
+                    trabajo.append((u, k))
+                    trabajo.append((v, 0))
+                    break
+                if v in en_pila:
+                    bajo[u] = min(bajo[u], indice[v])
+            else:
+                if bajo[u] == indice[u]:
+                    componente = []
+                    while True:
+                        w = pila.pop()
+                        en_pila.discard(w)
+                        componente.append(w)
+                        if w == u:
+                            break
+                    componentes.append(componente)
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    bajo[padre] = min(bajo[padre], bajo[u])
+    return componentes
+
+
+class GrafoHistoria:
+    """Vista indexada (solo lectura) de un diccionario de nodos de historia"""
+
+    def __init__(self, historia: Dict):
+        self.historia = historia
+        self.ids: List[str] = list(historia)
+        self.indice: Dict[str, int] = {nodo_id: i for i, nodo_id in enumerate(self.ids)}
+        self.es_final: List[bool] = [historia[nodo_id].es_final for nodo_id in self.ids]
+
+        # Sucesores en el orden de ``nodo.opciones`` (NODO_FALTANTE si el destino no existe)
+        self.sucesores: List[List[int]] = []
+        self.faltantes: Dict[str, List[str]] = {}
+        for nodo_id in self.ids:
+            destinos = []
+            for opcion in historia[nodo_id].opciones:
+                destino = self.indice.get(opcion["siguiente"], NODO_FALTANTE)
+                if destino == NODO_FALTANTE:
+                    self.faltantes.setdefault(nodo_id, []).append(opcion["siguiente"])
+                destinos.append(destino)
+            self.sucesores.append(destinos)
+
+        # Items que se pueden obtener, en orden de aparición
+        self.items: List[str] = []
+        self.indice_items: Dict[str, int] = {}
+        for nodo_id in self.ids:
+            for opcion in historia[nodo_id].opciones:
+                item = opcion.get("item")
+                if item and item not in self.indice_items:
+                    self.indice_items[item] = len(self.items)
+                    self.items.append(item)
+
+        # Índice inverso: para cada nodo, pares (predecesor, índice de opción)
+        self.predecesores: List[List[Tuple[int, int]]] = [[] for _ in self.ids]
+        for origen, destinos in enumerate(self.sucesores):
+            for k, destino in enumerate(destinos):
+                if destino != NODO_FALTANTE:
+                    self.predecesores[destino].append((origen, k))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def opciones(self, i: int) -> List[dict]:
+        """Opciones del nodo con índice i"""
+        return self.historia[self.ids[i]].opciones
+
+    def es_callejon(self, i: int) -> bool:
+        """Nodo que no es final pero no tiene opciones (la partida se queda atascada)"""
+        return not self.es_final[i] and not self.sucesores[i]
+
+    def finales(self) -> List[int]:
+        """Índices de todos los nodos finales"""
+        return [i for i, final in enumerate(self.es_final) if final]
+
+    def raices(self) -> Dict[Tuple[str, str], int]:
+        """Índice del nodo raíz de cada campaña"""
+        return {clave: self.indice[raiz] for clave, raiz in campanas(self.historia).items()}
+
+    def alcanzables(self, raiz: int) -> List[int]:
+        """Nodos alcanzables desde raiz, en orden de descubrimiento (DFS)"""
+        visto = {raiz}
+        orden = [raiz]
+        pila = [raiz]
+        while pila:
+            u = pila.pop()
+            for v in self.sucesores[u]:
+                if v != NODO_FALTANTE and v not in visto:
+                    visto.add(v)
+                    orden.append(v)
+                    pila.append(v)
+        return orden
+
+    def componentes_fuertes(self, nodos: Optional[Iterable[int]] = None) -> List[List[int]]:
+        """Componentes fuertemente conexas del grafo (ver ``componentes_fuertes``)"""
+        return componentes_fuertes(self.sucesores, nodos)
@@ -0,0 +1,388 @@
+"""
+Política óptima: qué opción elegir en cada nodo para maximizar un objetivo.
+
+El jugador controla todas las elecciones y los efectos son deterministas, así
+que basta con inducción hacia atrás sobre los estados (nodo, cubeta de
+estadísticas). Las estadísticas se agrupan en cubetas de ``ancho`` puntos (con
+la cubeta 0 reservada para el valor 0, que es el que decide la supervivencia) y
+los recursos se topan en ``tope_recursos``. Por defecto el tope se deduce del
+grafo (``cota_recursos``): ningún camino sin ciclos que den recursos llega a él,
+así que llegar al tope significa que un ciclo permite acumularlos sin límite y
+esos recursos se cuentan como ``inf`` (igual que en ``frente_pareto``). Con
+ancho 1 y el tope automático el resultado es exacto. Las componentes con ciclos
+se resuelven por iteración de valores hasta que no cambian.
+
+Objetivos disponibles (ver ``objetivo``):
+  - ``salud`` / ``reputacion`` / ``recursos``: valor de la estadística al llegar a un final,
+  - ``supervivencia``: llegar a un final con salud > 0,
+  - ``final:<id>``: llegar a ese final (id exacto o sufijo único; si no es un final, error).
+Los empates se deshacen a favor del camino más corto.
+
+El resultado se puede usar en el simulador (``PoliticaOptima``), exportar como
+tabla JSON o como guía de estrategia en texto.
+
+Uso: python politica_optima.py [--objetivo reputacion] [--ancho 1] [--tabla t.json] [--pesos p.json] [--guia guia.md]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from busqueda_finales import resolver_final
+from frente_pareto import INFINITO
+from grafo_historia import (GrafoHistoria, NODO_FALTANTE, STATS, STATS_INICIALES, Pesos, aplicar_efectos,
+                            cargar_historia, componentes_fuertes, efectos_opcion)
+from juego_base import Jugador, NodoHistoria
+
+# Puntos de salud y reputación por cubeta (1 = exacto)
+ANCHO_CUBETA = 1
+
+# Un objetivo puntúa el desenlace: (id del nodo terminal, es un final de verdad, estadísticas)
+Objetivo = Callable[[str, bool, Tuple[int, int, int]], float]
+
+Cubeta = Tuple[int, int, int]
+
+SIN_VALOR = (float("-inf"), 0)
+
+
+def objetivo(nombre: str, grafo: GrafoHistoria) -> Objetivo:
+    """Construir un objetivo a partir de su nombre.
+
+    En ``final:<id>`` el id se comprueba contra el grafo (admite un sufijo único,
+    como ``busqueda_finales.resolver_final``); si no es un final lanza ValueError.
+    """
+    if nombre in STATS:
+        posicion = STATS.index(nombre)
+        return lambda nodo_id, es_final, stats: stats[posicion] if es_final else -1.0
+    if nombre == "supervivencia":
+        return lambda nodo_id, es_final, stats: 1.0 if es_final and stats[0] > 0 else 0.0
+    if nombre.startswith("final:"):
+        final = resolver_final(grafo, nombre[len("final:"):])
+        if not grafo.es_final[grafo.indice[final]]:
+            raise ValueError(f"'{final}' no es un nodo final")
+        return lambda nodo_id, es_final, stats: 1.0 if nodo_id == final else 0.0
+    raise ValueError(f"Objetivo desconocido: '{nombre}'")
+
+
+def cubeta(stats: Tuple[int, int, int], ancho: int = ANCHO_CUBETA, tope_recursos: Optional[int] = None) -> Cubeta:
+    """Cubeta de unas estadísticas exactas (sin tope de recursos si ``tope_recursos`` es None)"""
+    salud, reputacion, recursos = stats
+    return (0 if salud <= 0 else 1 + (salud - 1) // ancho,
+            0 if reputacion <= 0 else 1 + (reputacion - 1) // ancho,
+            recursos if tope_recursos is None else min(recursos, tope_recursos))
+
+
+def representante(c: Cubeta, ancho: int = ANCHO_CUBETA) -> Tuple[int, int, int]:
+    """Estadísticas con las que se evalúa una cubeta (su punto medio)"""
+    salud, reputacion, recursos = c
+    return (0 if salud == 0 else min(100, (salud - 1) * ancho + 1 + ancho // 2),
+            0 if reputacion == 0 else min(100, (reputacion - 1) * ancho + 1 + ancho // 2),
+            recursos)
+
+
+def cota_recursos(grafo: GrafoHistoria, raices: List[str]) -> int:
+    """Recursos máximos que puede tener un jugador sin recorrer un ciclo que los aumente.
+
+    Camino más largo (en ganancia de recursos) sobre el grafo de componentes
+    fuertes: dentro de una componente se suman todas sus ganancias, porque dar
+    vueltas a un ciclo sin ganancia neta no suma nada (el recorte en 0 solo puede
+    quitar).
+    """
+    posicion = STATS.index("recursos")
+    nodos = set()
+    for raiz in raices:
+        nodos.update(grafo.alcanzables(grafo.indice[raiz]))
+
+    def ganancia(opcion: dict) -> int:
+        return sum(max(0, cambio) for p, cambio in efectos_opcion(opcion) if p == posicion)
+
+    componentes = componentes_fuertes(grafo.sucesores, nodos)
+    componente_de = {u: i for i, componente in enumerate(componentes) for u in componente}
+    # Las componentes salen con los sumideros primero: las de destino ya tienen su ganancia
+    mejor: List[int] = []
+    for i, componente in enumerate(componentes):
+        interior = salida = 0
+        for u in componente:
+            if grafo.es_final[u]:
+                continue
+            for opcion, v in zip(grafo.opciones(u), grafo.sucesores[u]):
+                if componente_de.get(v) == i:
+                    interior += ganancia(opcion)
+                else:
+                    salida = max(salida, ganancia(opcion) + (mejor[componente_de[v]] if v in componente_de else 0))
+        mejor.append(interior + salida)
+    return STATS_INICIALES[posicion] + max((mejor[componente_de[grafo.indice[raiz]]] for raiz in raices), default=0)
+
+
+class SolucionOptima:
+    """Valor óptimo y elección óptima de cada estado (nodo, cubeta) alcanzable desde las raíces.
+
+    Con ``tope_recursos=None`` el tope es ``cota_recursos + 1`` y los estados en el
+    tope tienen recursos no acotados (``inf``). Con un tope menor o igual que la
+    cota, los valores de recursos en el tope son solo cotas inferiores
+    (``saturado`` lo indica).
+    """
+
+    def __init__(self, grafo: GrafoHistoria, raices: List[str], funcion_objetivo: Objetivo,
+                 ancho: int = ANCHO_CUBETA, tope_recursos: Optional[int] = None):
+        self.grafo = grafo
+        self.raices = raices
+        self.ancho = ancho
+        self.cota_recursos = cota_recursos(grafo, raices)
+        self.tope_recursos = tope_recursos if tope_recursos is not None else self.cota_recursos + 1
+        # Por encima de la cota solo se llega dando vueltas a un ciclo que da recursos
+        self.no_acotado = self.tope_recursos > self.cota_recursos
+        self._objetivo = funcion_objetivo
+
+        self.estados: List[Tuple[int, Cubeta]] = []
+        self.indice: Dict[Tuple[int, Cubeta], int] = {}
+        # Por estado: destino de cada opción (NODO_FALTANTE -> estado terminal propio)
+        self.sucesores: List[List[int]] = []
+        self._faltantes: Dict[str, int] = {}
+        self._explorar()
+        self.valor: List[Tuple[float, int]] = [SIN_VALOR] * len(self.estados)
+        self.eleccion: List[Optional[int]] = [None] * len(self.estados)
+        self._resolver()
+
+    def _estado(self, nodo: int, c: Cubeta) -> Tuple[int, bool]:
+        clave = (nodo, c)
+        if clave in self.indice:
+            return self.indice[clave], False
+        self.indice[clave] = len(self.estados)
+        self.estados.append(clave)
+        self.sucesores.append([])
+        return self.indice[clave], True
+
+    def _representante(self, c: Cubeta) -> Tuple:
+        """Estadísticas de una cubeta, con recursos ``inf`` en el tope si no están acotados"""
+        stats = representante(c, self.ancho)
+        if self.no_acotado and c[2] >= self.tope_recursos:
+            return stats[:2] + (INFINITO,)
+        return stats
+
+    def _explorar(self):
+        grafo = self.grafo
+        inicial = cubeta(STATS_INICIALES, self.ancho, self.tope_recursos)
+        pendientes = [self._estado(grafo.indice[raiz], inicial)[0] for raiz in self.raices]
+        while pendientes:
+            e = pendientes.pop()
+            nodo, c = self.estados[e]
+            if nodo < 0 or grafo.es_final[nodo]:
+                continue
+            stats = self._representante(c)
+            destinos = []
+            for opcion, v in zip(grafo.opciones(nodo), grafo.sucesores[nodo]):
+                siguiente = cubeta(aplicar_efectos(stats, efectos_opcion(opcion)), self.ancho, self.tope_recursos)
+                if v == NODO_FALTANTE:
+                    # Cada destino inexistente es un terminal aparte (índices negativos)
+                    v = self._faltantes.setdefault(opcion["siguiente"], -2 - len(self._faltantes))
+                j, nuevo = self._estado(v, siguiente)
+                if nuevo:
+                    pendientes.append(j)
+                destinos.append(j)
+            self.sucesores[e] = destinos
+
+    def _terminal(self, e: int) -> Tuple[float, int]:
+        nodo, c = self.estados[e]
+        if nodo < 0:
+            nodo_id = next(destino for destino, i in self._faltantes.items() if i == nodo)
+            return self._objetivo(nodo_id, False, self._representante(c)), 0
+        return self._objetivo(self.grafo.ids[nodo], self.grafo.es_final[nodo], self._representante(c)), 0
+
+    def _mejor(self, e: int) -> Tuple[Tuple[float, int], Optional[int]]:
+        mejor, eleccion = SIN_VALOR, None
+        for k, j in enumerate(self.sucesores[e]):
+            valor, pasos = self.valor[j]
+            # Mayor valor y, a igualdad, menos pasos (se guarda como -pasos)
+            candidato = (valor, pasos - 1)
+            if eleccion is None or candidato > mejor:
+                mejor, eleccion = candidato, k
+        return mejor, eleccion
+
+    def _resolver(self):
+        # Las componentes salen con los sumideros primero: al llegar a una, sus sucesores ya tienen valor
+        for componente in componentes_fuertes(self.sucesores):
+            if len(componente) == 1 and componente[0] not in self.sucesores[componente[0]]:
+                e = componente[0]
+                if self.sucesores[e]:
+                    self.valor[e], self.eleccion[e] = self._mejor(e)
+                else:
+                    self.valor[e] = self._terminal(e)
+                continue
+            # Ciclo: iteración de valores desde "sin valor" hasta el punto fijo
+            cambiado = True
+            while cambiado:
+                cambiado = False
+                for e in componente:
+                    valor, eleccion = self._mejor(e)
+                    if valor > self.valor[e]:
+                        self.valor[e], self.eleccion[e] = valor, eleccion
+                        cambiado = True
+
+    # ------------------- Consultas -------------------
+    def valor_desde(self, raiz: str) -> float:
+        """Valor óptimo alcanzable desde una raíz"""
+        inicial = cubeta(STATS_INICIALES, self.ancho, self.tope_recursos)
+        return self.valor[self.indice[(self.grafo.indice[raiz], inicial)]][0]
+
+    def saturado(self) -> bool:
+        """Indica si algún estado llegó a un tope de recursos manual que no es una cota segura"""
+        return not self.no_acotado and any(c[2] >= self.tope_recursos for _, c in self.estados)
+
+    def tabla(self) -> Dict[str, Dict[Cubeta, int]]:
+        """{id de nodo: {cubeta: índice de la opción óptima}}"""
+        resultado: Dict[str, Dict[Cubeta, int]] = {}
+        for (nodo, c), k in zip(self.estados, self.eleccion):
+            if k is not None:
+                resultado.setdefault(self.grafo.ids[nodo], {})[c] = k
+        return resultado
+
+    def pesos(self) -> Pesos:
+        """Pesos para ``PoliticaTabla``: la opción óptima más frecuente de cada nodo (sin estadísticas)"""
+        pesos: Pesos = {}
+        for nodo_id, filas in self.tabla().items():
+            votos: Dict[int, int] = {}
+            for k in filas.values():
+                votos[k] = votos.get(k, 0) + 1
+            elegida = max(votos, key=lambda k: (votos[k], -k))
+            opciones = len(self.grafo.historia[nodo_id].opciones)
+            pesos[nodo_id] = [1.0 if k == elegida else 0.0 for k in range(opciones)]
+        return pesos
+
+    def camino(self, raiz: str) -> List[dict]:
+        """Recorrido óptimo desde raiz con las estadísticas exactas en cada paso"""
+        politica = PoliticaOptima(self.tabla(), self.ancho, self.tope_recursos)
+        stats = tuple(STATS_INICIALES)
+        nodo = self.grafo.indice[raiz]
+        pasos = []
+        visitados = set()
+        while nodo != NODO_FALTANTE and not self.grafo.es_final[nodo] and self.grafo.opciones(nodo):
+            clave = (nodo, stats)
+            if clave in visitados:
+                break
+            visitados.add(clave)
+            k = politica.elegir(self.grafo.ids[nodo], stats, len(self.grafo.opciones(nodo)))
+            opcion = self.grafo.opciones(nodo)[k]
+            stats = aplicar_efectos(stats, efectos_opcion(opcion))
+            pasos.append({"nodo": self.grafo.ids[nodo], "opcion": k, "texto": opcion["texto"],
+                          "siguiente": opcion["siguiente"], **dict(zip(STATS, stats))})
+            nodo = self.grafo.sucesores[nodo][k]
+        return pasos
+
+
+class PoliticaOptima:
+    """Política del simulador a partir de una tabla {nodo: {cubeta: opción}}.
+
+    En una cubeta que no está en la tabla (p. ej. con otras cubetas o estadísticas
+    iniciales distintas) se usa la cubeta más cercana del mismo nodo; en un nodo
+    sin tabla se juega de forma uniforme.
+    """
+
+    def __init__(self, tabla: Dict[str, Dict[Cubeta, int]], ancho: int = ANCHO_CUBETA,
+                 tope_recursos: Optional[int] = None):
+        self.tabla = tabla
+        self.ancho = ancho
+        self.tope_recursos = tope_recursos
+
+    def elegir(self, nodo_id: str, stats: Tuple[int, int, int], opciones: int) -> Optional[int]:
+        """Opción óptima para unas estadísticas exactas (None si el nodo no tiene tabla)"""
+        filas = self.tabla.get(nodo_id)
+        if not filas:
+            return None
+        c = cubeta(stats, self.ancho, self.tope_recursos)
+        k = filas.get(c)
+        if k is None:
+            cercana = min(filas, key=lambda otra: sum(abs(a - b) for a, b in zip(otra, c)))
+            k = filas[cercana]
+        return k if k < opciones else None
+
+    def __call__(self, nodo: NodoHistoria, jugador: Jugador, rng: random.Random) -> int:
+        k = self.elegir(jugador.nodo_actual, (jugador.salud, jugador.reputacion, jugador.recursos), len(nodo.opciones))
+        return rng.randrange(len(nodo.opciones)) if k is None else k
+
+    def identidad(self) -> str:
+        datos = json.dumps(self.a_dict(), sort_keys=True, separators=(",", ":"))
+        return f"optima:{zlib.crc32(datos.encode('utf-8')):08x}"
+
+    def a_dict(self) -> dict:
+        """Tabla serializable a JSON"""
+        return {"ancho": self.ancho, "tope_recursos": self.tope_recursos,
+                "tabla": {nodo_id: {",".join(map(str, c)): k for c, k in filas.items()}
+                          for nodo_id, filas in self.tabla.items()}}
+
+    @classmethod
+    def desde_dict(cls, datos: dict) -> "PoliticaOptima":
+        """Reconstruir la política guardada con ``a_dict``"""
+        tabla = {nodo_id: {tuple(int(x) for x in c.split(",")): k for c, k in filas.items()}
+                 for nodo_id, filas in datos["tabla"].items()}
+        return cls(tabla, datos.get("ancho", ANCHO_CUBETA), datos.get("tope_recursos"))
+
+
+def guia_estrategia(solucion: SolucionOptima, raices: Dict[Tuple[str, str], str], nombre_objetivo: str) -> str:
+    """Guía de estrategia en texto: el recorrido óptimo de cada campaña"""
+    historia = solucion.grafo.historia
+    lineas = [f"GUÍA DE ESTRATEGIA — objetivo: {nombre_objetivo}", ""]
+    for (personaje, dificultad), raiz in raices.items():
+        pasos = solucion.camino(raiz)
+        lineas.append(f"== {personaje} / {dificultad} ==  (valor óptimo: {solucion.valor_desde(raiz):g})")
+        for numero, paso in enumerate(pasos, 1):
+            nodo = historia[paso["nodo"]]
+            lineas.append(f"  {numero:2d}. {nodo.titulo}: elige «{paso['texto']}»  "
+                          f"[salud {paso['salud']}, reputación {paso['reputacion']}, recursos {paso['recursos']}]")
+        destino = pasos[-1]["siguiente"] if pasos else raiz
+        titulo = historia[destino].titulo if destino in historia else "(nodo inexistente)"
+        lineas.append(f"  → {destino}: {titulo}")
+        lineas.append("")
+    return "\n".join(lineas)
+
+
+def main():
+    """Resolver las 12 campañas y exportar la política y la guía"""
+    parser = argparse.ArgumentParser(description="Política óptima por inducción hacia atrás")
+    parser.add_argument("--objetivo", default="reputacion",
+                        help="salud, reputacion, recursos, supervivencia o final:<id>")
+    parser.add_argument("--ancho", type=int, default=ANCHO_CUBETA)
+    parser.add_argument("--tope-recursos", type=int, default=None,
+                        help="tope manual de recursos (por defecto se deduce del grafo y es exacto)")
+    parser.add_argument("--tabla", default=None, help="guardar la política en un JSON")
+    parser.add_argument("--pesos", default=None, help="guardar pesos por nodo para PoliticaTabla")
+    parser.add_argument("--guia", default=None, help="guardar la guía de estrategia")
+    args = parser.parse_args()
+
+    grafo = GrafoHistoria(cargar_historia())
+    raices = {clave: grafo.ids[i] for clave, i in grafo.raices().items()}
+    try:
+        funcion_objetivo = objetivo(args.objetivo, grafo)
+    except ValueError as e:
+        parser.error(str(e))
+    inicio = time.perf_counter()
+    solucion = SolucionOptima(grafo, list(raices.values()), funcion_objetivo, args.ancho, args.tope_recursos)
+    duracion = time.perf_counter() - inicio
+    print(f"{len(solucion.estados):,} estados resueltos en {duracion:.2f} s (tope de recursos {solucion.tope_recursos})")
+    if solucion.saturado():
+        print(f"  aviso: el tope manual {solucion.tope_recursos} no supera la cota {solucion.cota_recursos}; "
+              f"los recursos en el tope son solo cotas inferiores")
+    for (personaje, dificultad), raiz in raices.items():
+        print(f"  {personaje:>6} / {dificultad:<8} valor óptimo {solucion.valor_desde(raiz):g}")
+
+    guia = guia_estrategia(solucion, raices, args.objetivo)
+    if args.guia:
+        with open(args.guia, "w", encoding="utf-8") as f:
+            f.write(guia)
+    else:
+        print("\n" + guia)
+    if args.tabla:
+        with open(args.tabla, "w", encoding="utf-8") as f:
+            json.dump(PoliticaOptima(solucion.tabla(), args.ancho, solucion.tope_recursos).a_dict(), f,
+                      ensure_ascii=False)
+    if args.pesos:
+        with open(args.pesos, "w", encoding="utf-8") as f:
+            json.dump(solucion.pesos(), f, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Partidas de referencia ("golden runs") para detectar cambios en la historia.
+
+``grabar`` juega un conjunto fijo de partidas con semilla por campaña
+(semilla ``"<raiz>-<n>"``, elección uniforme) y guarda de cada una el camino
+(nodo, opción elegida, destino), las estadísticas tras cada paso, los efectos
+declarados de cada opción elegida (sin recortar: un cambio de +10 a +20 con la
+salud ya a 100 también se detecta) y el estado final del ``Jugador``, más una
+firma compacta (CRC32) de todo ello.
+
+``comprobar`` vuelve a jugar las mismas partidas contra la historia actual y,
+para las que cambian de firma, indica el primer paso distinto y de qué tipo es:
+número de opciones cambiado, destino (``siguiente``) cambiado, efectos cambiados
+o nodo final distinto. Así se detectan redirecciones o cambios de estadísticas
+accidentales en cualquiera de las opciones sin abrir la interfaz.
+
+Uso: python regresion.py grabar [-n 50] [--archivo partidas_referencia.json]
+     python regresion.py comprobar [--archivo partidas_referencia.json]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from grafo_historia import campanas
+from juego_base import JuegoAventuraBase, Jugador, NodoHistoria, avanzar
+from simulador import MAX_PASOS
+
+ARCHIVO_REFERENCIA = "partidas_referencia.json"
+
+# Partidas de referencia por campaña
+PARTIDAS_POR_CAMPANA = 50
+
+
+def jugar_registrando(historia: Dict[str, NodoHistoria], raiz: str, semilla: str,
+                      max_pasos: int = MAX_PASOS) -> dict:
+    """Jugar una partida uniforme con semilla y registrar cada paso"""
+    rng = random.Random(semilla)
+    jugador = Jugador("Referencia")
+    jugador.nodo_actual = raiz
+    pasos: List[list] = []
+    for _ in range(max_pasos):
+        nodo = historia.get(jugador.nodo_actual)
+        if nodo is None or nodo.es_final or not nodo.opciones:
+            break
+        k = rng.randrange(len(nodo.opciones))
+        consecuencia = avanzar(jugador, k, nodo.opciones[k])
+        # [nodo, opción elegida, número de opciones, destino, salud, reputación, recursos,
+        #  efectos declarados [[estadística, cambio], ...], item]
+        pasos.append([consecuencia.origen, k, len(nodo.opciones), consecuencia.siguiente,
+                      jugador.salud, jugador.reputacion, jugador.recursos,
+                      [list(efecto) for efecto in consecuencia.efectos], consecuencia.item])
+    final = {"nodo_actual": jugador.nodo_actual, "salud": jugador.salud, "reputacion": jugador.reputacion,
+             "recursos": jugador.recursos, "inventario": list(jugador.inventario)}
+    return {"raiz": raiz, "semilla": semilla, "pasos": pasos, "final": final, "firma": firma(pasos, final)}
+
+
+def firma(pasos: List[list], final: dict) -> str:
+    """Firma compacta de una partida"""
+    datos = json.dumps([pasos, final], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return f"{zlib.crc32(datos.encode('utf-8')):08x}"
+
+
+def grabar(historia: Dict[str, NodoHistoria], partidas: int = PARTIDAS_POR_CAMPANA) -> List[dict]:
+    """Partidas de referencia de todas las campañas"""
+    return [jugar_registrando(historia, raiz, f"{raiz}-{n}")
+            for raiz in campanas(historia).values() for n in range(partidas)]
+
+
+def compactar(referencias: List[dict]) -> dict:
+    """Formato de archivo: los ids de nodo se guardan una vez y los pasos los referencian por índice"""
+    nodos: Dict[str, int] = {}
+    partidas = []
+    for r in referencias:
+        pasos = [[nodos.setdefault(p[0], len(nodos)), p[1], p[2], nodos.setdefault(p[3], len(nodos)), *p[4:]]
+                 for p in r["pasos"]]
+        partidas.append({**r, "pasos": pasos})
+    return {"version": 1, "nodos": list(nodos), "partidas": partidas}
+
+
+def expandir(datos: dict) -> List[dict]:
+    """Inverso de ``compactar``"""
+    nodos = datos["nodos"]
+    return [{**r, "pasos": [[nodos[p[0]], p[1], p[2], nodos[p[3]], *p[4:]] for p in r["pasos"]]}
+            for r in datos["partidas"]]
+
+
+def diferencia(referencia: dict, actual: dict) -> Optional[dict]:
+    """Primer paso en el que difieren dos partidas (None si son iguales)"""
+    if referencia["firma"] == actual["firma"]:
+        return None
+    for paso, (antes, ahora) in enumerate(zip(referencia["pasos"], actual["pasos"])):
+        if antes == ahora:
+            continue
+        nodo = antes[0]
+        if antes[0] != ahora[0]:
+            tipo = "nodo distinto"
+        elif antes[2] != ahora[2]:
+            tipo = "número de opciones cambiado"
+        elif antes[3] != ahora[3]:
+            tipo = "destino cambiado"
+        else:
+            tipo = "efectos cambiados"
+        return {"paso": paso, "tipo": tipo, "nodo": nodo, "opcion": antes[1], "antes": antes, "ahora": ahora}
+    paso = min(len(referencia["pasos"]), len(actual["pasos"]))
+    if len(referencia["pasos"]) != len(actual["pasos"]):
+        return {"paso": paso, "tipo": "longitud distinta", "nodo": referencia["final"]["nodo_actual"],
+                "antes": len(referencia["pasos"]), "ahora": len(actual["pasos"])}
+    return {"paso": paso, "tipo": "estado final distinto", "nodo": referencia["final"]["nodo_actual"],
+            "antes": referencia["final"], "ahora": actual["final"]}
+
+
+def comprobar(historia: Dict[str, NodoHistoria], referencias: List[dict]) -> List[dict]:
+    """Repetir las partidas de referencia y devolver sus diferencias"""
+    diferencias = []
+    for referencia in referencias:
+        if referencia["raiz"] not in historia:
+            diferencias.append({"semilla": referencia["semilla"], "paso": 0, "tipo": "campaña eliminada",
+                                "nodo": referencia["raiz"]})
+            continue
+        d = diferencia(referencia, jugar_registrando(historia, referencia["raiz"], referencia["semilla"]))
+        if d:
+            diferencias.append({"semilla": referencia["semilla"], **d})
+    return diferencias
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Partidas de referencia para detectar cambios en la historia")
+    parser.add_argument("accion", choices=["grabar", "comprobar"])
+    parser.add_argument("-n", "--partidas", type=int, default=PARTIDAS_POR_CAMPANA,
+                        help="partidas por campaña al grabar")
+    parser.add_argument("--archivo", default=ARCHIVO_REFERENCIA)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    historia = JuegoAventuraBase().historia
+    if args.accion == "grabar":
+        referencias = grabar(historia, args.partidas)
+        with open(args.archivo, "w", encoding="utf-8") as f:
+            json.dump(compactar(referencias), f, ensure_ascii=False, separators=(",", ":"))
+        print(f"{len(referencias)} partidas de referencia guardadas en {args.archivo}")
+        return 0
+
+    with open(args.archivo, "r", encoding="utf-8") as f:
+        referencias = expandir(json.load(f))
+    diferencias = comprobar(historia, referencias)
+    # Agrupar por (tipo, nodo, opción): una misma edición suele afectar a muchas partidas
+    grupos: Dict[tuple, List[dict]] = {}
+    for d in diferencias:
+        grupos.setdefault((d["tipo"], d["nodo"], d.get("opcion")), []).append(d)
+    for (tipo, nodo, opcion), lista in sorted(grupos.items(), key=lambda kv: -len(kv[1])):
+        ejemplo = lista[0]
+        sitio = nodo if opcion is None else f"{nodo}[{opcion}]"
+        print(f"✗ {tipo}: {sitio} ({len(lista)} partidas, p. ej. {ejemplo['semilla']} paso {ejemplo['paso']})")
+        if "antes" in ejemplo:
+            print(f"    antes: {ejemplo['antes']}")
+            print(f"    ahora: {ejemplo.get('ahora')}")
+    print(f"\n{len(referencias) - len(diferencias)}/{len(referencias)} partidas sin cambios "
+          f"({time.perf_counter() - inicio:.2f} s)")
+    return 1 if diferencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Repetición determinista de partidas guardadas.
+
+Vuelve a ejecutar la lista ``jugador.decisiones`` de un archivo como
+``partida_guardada.json`` contra la historia actual: parte de la raíz de la
+campaña de la partida (``personaje`` y ``dificultad``), busca en cada nodo la
+opción registrada (por texto o por índice), aplica sus efectos igual que el
+juego y comprueba que la partida pasa por los nodos registrados y termina en el
+``nodo_actual`` guardado. Informa de la primera divergencia (nodo distinto,
+opción que ya no existe...) y de las estadísticas o items que no coinciden; la
+partida solo coincide si no hay ninguna de las dos cosas (un cambio de efectos
+también cuenta como fallo). Una partida recién empezada, sin decisiones, se
+comprueba igual: debe seguir en la raíz.
+
+Las partidas antiguas guardan ids sin prefijo de personaje (``dificil_inicio``)
+y no guardan el personaje; los ids se resuelven probando los prefijos de
+``PREFIJOS_POR_PERSONAJE`` y el personaje se deduce de ellos.
+
+Con ``--procesos`` los archivos se reparten entre varios procesos que heredan la
+historia por ``fork``, como en ``simulador.simular_paralelo``.
+
+Uso: python repeticion.py partida_guardada.json [carpeta ...] [--procesos 0] [--json informe.json]
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from typing import Dict, List, Optional
+
+from grafo_historia import DIFICULTADES, PREFIJOS_POR_PERSONAJE, STATS, nodo_inicial
+from juego_base import JuegoAventuraBase, Jugador, NodoHistoria, avanzar, decisiones_de_partida
+
+# Estado de solo lectura que los procesos hijos heredan del padre
+_COMPARTIDO: Dict = {}
+
+
+def _normalizar(texto: str) -> str:
+    return " ".join(str(texto).split()).casefold()
+
+
+def resolver_nodo(historia: Dict[str, NodoHistoria], nodo_id: str, prefijo: Optional[str] = None) -> Optional[str]:
+    """Id actual de un nodo guardado (admite ids antiguos sin prefijo de personaje).
+
+    Con un prefijo conocido se prefiere el id con prefijo: algunos ids antiguos
+    siguen existiendo como nodos sueltos que la campaña ya no usa.
+    """
+    if prefijo and f"{prefijo}_{nodo_id}" in historia:
+        return f"{prefijo}_{nodo_id}"
+    if nodo_id in historia:
+        return nodo_id
+    for p in dict.fromkeys(PREFIJOS_POR_PERSONAJE.values()):
+        if f"{p}_{nodo_id}" in historia:
+            return f"{p}_{nodo_id}"
+    return None
+
+
+def deducir_prefijo(historia: Dict[str, NodoHistoria], decisiones: List[dict]) -> Optional[str]:
+    """Prefijo de personaje con el que se resuelven más nodos de un registro antiguo"""
+    mejor, aciertos = None, 0
+    for prefijo in dict.fromkeys(PREFIJOS_POR_PERSONAJE.values()):
+        n = sum(1 for d in decisiones if resolver_nodo(historia, d["nodo"], prefijo))
+        if n > aciertos:
+            mejor, aciertos = prefijo, n
+    return mejor
+
+
+def buscar_opcion(nodo: NodoHistoria, eleccion) -> Optional[int]:
+    """Índice de la opción registrada: por índice, por texto exacto o por texto normalizado"""
+    if isinstance(eleccion, int):
+        return eleccion if 0 <= eleccion < len(nodo.opciones) else None
+    for k, opcion in enumerate(nodo.opciones):
+        if opcion["texto"] == eleccion:
+            return k
+    buscado = _normalizar(eleccion)
+    for k, opcion in enumerate(nodo.opciones):
+        if _normalizar(opcion["texto"]) == buscado:
+            return k
+    return None
+
+
+def raiz_de_partida(historia: Dict[str, NodoHistoria], datos: dict, decisiones: List[dict],
+                    prefijo: Optional[str] = None) -> Optional[str]:
+    """Raíz de la campaña de una partida guardada: ``nodo_inicial(personaje, dificultad)``.
+
+    Las partidas antiguas no guardan el personaje (ni, a veces, la dificultad): se
+    deducen del id del primer nodo registrado (o del nodo actual si no hay decisiones).
+    """
+    guardado = datos.get("jugador", datos)
+    personaje, dificultad = datos.get("personaje"), datos.get("dificultad")
+    if personaje is None or dificultad is None:
+        primero = decisiones[0]["nodo"] if decisiones else guardado.get("nodo_actual", "")
+        primero = resolver_nodo(historia, primero, prefijo) or primero
+        for nombre, p in PREFIJOS_POR_PERSONAJE.items():
+            if primero.startswith(p + "_") and (personaje is None or personaje == nombre):
+                personaje = nombre
+                if dificultad is None:
+                    dificultad = next((d for d in DIFICULTADES if primero.startswith(f"{p}_{d}_")), None)
+                break
+    if personaje is None or dificultad is None:
+        return None
+    return nodo_inicial(personaje, dificultad)
+
+
+def repetir(historia: Dict[str, NodoHistoria], datos: dict, raiz: Optional[str] = None) -> dict:
+    """Repetir la partida guardada en ``datos`` (formato de partida_guardada.json).
+
+    La partida empieza en la raíz de su campaña (``raiz_de_partida``, o ``raiz``
+    si se da); si el primer nodo registrado no es esa raíz hay divergencia en el
+    paso 0. Devuelve un informe con ``ok`` (sin divergencia ni diferencias), los
+    pasos repetidos, la primera divergencia (o None) y las diferencias de
+    estadísticas e inventario con lo guardado.
+    """
+    guardado = datos.get("jugador", datos)
+    decisiones = decisiones_de_partida(guardado)
+    prefijo = None
+    if any(d["nodo"] not in historia for d in decisiones):
+        prefijo = deducir_prefijo(historia, decisiones)
+
+    informe = {"pasos": 0, "divergencia": None, "diferencias": {}, "nodo_final": None}
+    if raiz is None:
+        raiz = raiz_de_partida(historia, datos, decisiones, prefijo)
+    if raiz is None:
+        informe["divergencia"] = {"paso": 0, "motivo": "campaña desconocida"}
+        informe["ok"] = False
+        return informe
+
+    jugador = Jugador(guardado.get("nombre", "Repetición"))
+    jugador.nodo_actual = raiz
+    for paso, decision in enumerate(decisiones):
+        esperado = resolver_nodo(historia, decision["nodo"], prefijo)
+        nodo = historia.get(jugador.nodo_actual)
+        divergencia = None
+        if esperado is None:
+            divergencia = {"motivo": "nodo inexistente", "nodo_guardado": decision["nodo"]}
+        elif esperado != jugador.nodo_actual:
+            divergencia = {"motivo": "nodo distinto", "nodo_guardado": esperado, "nodo_real": jugador.nodo_actual}
+        elif nodo is None:
+            divergencia = {"motivo": "nodo inexistente", "nodo_guardado": jugador.nodo_actual}
+        else:
+            k = buscar_opcion(nodo, decision["eleccion"])
+            if k is None:
+                divergencia = {"motivo": "opción inexistente", "nodo_guardado": esperado,
+                               "eleccion": decision["eleccion"]}
+        if divergencia:
+            informe["divergencia"] = {"paso": paso, **divergencia}
+            break
+        avanzar(jugador, k, nodo.opciones[k])
+        informe["pasos"] += 1
+
+    informe["nodo_final"] = jugador.nodo_actual
+    if informe["divergencia"] is None and "nodo_actual" in guardado:
+        esperado = resolver_nodo(historia, guardado["nodo_actual"], prefijo) or guardado["nodo_actual"]
+        if esperado != jugador.nodo_actual:
+            informe["divergencia"] = {"paso": len(decisiones), "motivo": "nodo final distinto",
+                                      "nodo_guardado": esperado, "nodo_real": jugador.nodo_actual}
+    for stat in STATS:
+        if stat in guardado and guardado[stat] != getattr(jugador, stat):
+            informe["diferencias"][stat] = (guardado[stat], getattr(jugador, stat))
+    if "inventario" in guardado and sorted(guardado["inventario"]) != sorted(jugador.inventario):
+        informe["diferencias"]["inventario"] = (guardado["inventario"], jugador.inventario)
+    informe["ok"] = informe["divergencia"] is None and not informe["diferencias"]
+    return informe
+
+
+def repetir_archivo(ruta: str, historia: Optional[Dict[str, NodoHistoria]] = None) -> dict:
+    """Repetir un archivo de partida guardada"""
+    historia = historia if historia is not None else _COMPARTIDO["historia"]
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+        informe = repetir(historia, datos)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        informe = {"ok": False, "pasos": 0, "divergencia": {"paso": 0, "motivo": f"archivo ilegible: {e}"},
+                   "diferencias": {}, "nodo_final": None}
+    informe["archivo"] = ruta
+    return informe
+
+
+def _iniciar_trabajador():
+    """Preparar un proceso hijo que no heredó la historia (arranque sin fork)"""
+    if "historia" not in _COMPARTIDO:
+        _COMPARTIDO["historia"] = JuegoAventuraBase().historia
+
+
+def repetir_lote(rutas: List[str], historia: Dict[str, NodoHistoria], procesos: int = 1) -> List[dict]:
+    """Repetir muchos archivos, en paralelo si procesos != 1 (0 = todos los núcleos)"""
+    procesos = procesos or os.cpu_count() or 1
+    _COMPARTIDO["historia"] = historia
+    try:
+        if procesos == 1:
+            return [repetir_archivo(ruta) for ruta in rutas]
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+        gc.freeze()
+        with contexto.Pool(procesos, initializer=_iniciar_trabajador) as pool:
+            return pool.map(repetir_archivo, rutas, chunksize=max(1, len(rutas) // (procesos * 8)))
+    finally:
+        if procesos != 1:
+            gc.unfreeze()
+        _COMPARTIDO.clear()
+
+
+def buscar_partidas(rutas: List[str]) -> List[str]:
+    """Archivos .json indicados directamente o dentro de las carpetas dadas"""
+    archivos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            for carpeta, _, nombres in os.walk(ruta):
+                archivos.extend(os.path.join(carpeta, n) for n in sorted(nombres) if n.endswith(".json"))
+        else:
+            archivos.append(ruta)
+    return archivos
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Repetir partidas guardadas contra la historia actual")
+    parser.add_argument("rutas", nargs="*", default=["partida_guardada.json"])
+    parser.add_argument("--procesos", type=int, default=1, help="procesos en paralelo (0 = todos los núcleos)")
+    parser.add_argument("--json", dest="salida", default=None, help="guardar el informe completo")
+    args = parser.parse_args()
+
+    archivos = buscar_partidas(args.rutas)
+    informes = repetir_lote(archivos, JuegoAventuraBase().historia, args.procesos)
+    fallos = [i for i in informes if not i["ok"]]
+    for informe in fallos[:20]:
+        d = informe["divergencia"]
+        if d is None:
+            print(f"✗ {informe['archivo']}: {informe['pasos']} decisiones repetidas, efectos distintos")
+        else:
+            detalle = ", ".join(f"{k}={v}" for k, v in d.items() if k not in ("paso", "motivo"))
+            print(f"✗ {informe['archivo']}: paso {d['paso']}: {d['motivo']} ({detalle})")
+        for stat, (guardado, real) in informe["diferencias"].items():
+            print(f"  {stat}: guardado {guardado}, repetido {real}")
+    if len(archivos) == 1 and not fallos:
+        informe = informes[0]
+        print(f"✓ {informe['archivo']}: {informe['pasos']} decisiones repetidas, termina en {informe['nodo_final']}")
+    print(f"\n{len(archivos) - len(fallos)}/{len(archivos)} partidas coinciden")
+    motivos = Counter((i["divergencia"]["motivo"], i["divergencia"].get("nodo_guardado")) if i["divergencia"]
+                      else ("efectos distintos", ", ".join(i["diferencias"])) for i in fallos)
+    for (motivo, nodo), n in motivos.most_common(10):
+        print(f"  {n:6d}  {motivo}: {nodo}")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(informes, f, ensure_ascii=False, indent=1)
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Análisis de sensibilidad de las opciones para el balance de la historia.
+
+Para una opción (nodo, índice) responde a dos preguntas:
+  - ¿Cuánto cambia la distribución de finales de cada campaña si la opción pasa
+    a ser más (o menos) probable? Se calcula de forma exacta a partir de la matriz
+    de absorción ya resuelta con una actualización de rango uno
+    (Sherman-Morrison): solo hace falta el número esperado de visitas al nodo
+    desde cada raíz y, si el nodo está en un ciclo, las visitas de vuelta dentro
+    de su componente. Si el cambio deja el ciclo sin salida (la actualización
+    no está definida) se resuelve de nuevo la absorción de las campañas afectadas.
+  - ¿Cuánto se mueven los rangos de estadísticas de los finales si cambia el
+    ``cambio`` de la opción? Se edita la opción sobre el análisis incremental,
+    se leen los intervalos de los finales afectados y se deshace la edición.
+
+Nota: como las opciones no dependen de las estadísticas, cambiar ``cambio`` no
+altera la probabilidad de ningún final; solo el peso de la opción (o su destino)
+lo hace.
+
+Uso: python sensibilidad.py [factor_peso] [delta_cambio] [top]
+"""
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from analisis_incremental import AnalisisIncremental
+from analisis_markov import absorcion, resolver_lineal, transiciones
+from grafo_historia import (GrafoHistoria, NODO_FALTANTE, STATS, Pesos, cargar_historia,
+                            componentes_fuertes)
+
+# Por debajo de este denominador la actualización de Sherman-Morrison no es fiable
+TOLERANCIA_SINGULAR = 1e-9
+
+
+class AnalisisSensibilidad:
+    """Sensibilidad de finales y estadísticas a cada opción, a partir de resultados en caché"""
+
+    def __init__(self, historia: Dict, pesos: Optional[Pesos] = None):
+        self.historia = historia
+        self.pesos = pesos or {}
+        self.grafo = GrafoHistoria(historia)
+        self.trans = transiciones(self.grafo, self.pesos)
+        self.absorcion = absorcion(self.grafo, trans=self.trans)
+        self.raices = self.grafo.raices()
+        self.incremental = AnalisisIncremental(historia)
+
+        adyacencia = [[v for v, _, _ in t] for t in self.trans]
+        componentes = componentes_fuertes(adyacencia)
+        self._componente: Dict[int, List[int]] = {u: c for c in componentes for u in c}
+        # Orden topológico (las componentes de origen primero)
+        self._orden = list(reversed(componentes))
+        self.visitas = {clave: self._visitas_esperadas(raiz) for clave, raiz in self.raices.items()}
+        self._vueltas: Dict[int, Dict[int, float]] = {}
+
+    # ------------------- Visitas esperadas -------------------
+    def _es_absorbente(self, u: int) -> bool:
+        return self.grafo.es_final[u] or not self.trans[u]
+
+    def _visitas_esperadas(self, raiz: int) -> Dict[int, float]:
+        """Fila de la matriz fundamental N[raiz, ·]: visitas esperadas a cada nodo transitorio"""
+        entrada: Dict[int, float] = {raiz: 1.0}
+        visitas: Dict[int, float] = {}
+        for componente in self._orden:
+            if not any(u in entrada for u in componente):
+                continue
+            transitorios = [u for u in componente if not self._es_absorbente(u)]
+            if not transitorios:
+                continue
+            posicion = {u: k for k, u in enumerate(transitorios)}
+            if len(transitorios) == 1 and all(v != transitorios[0] for v, _, _ in self.trans[transitorios[0]]):
+                valores = [entrada.get(transitorios[0], 0.0)]
+            else:
+                # v_C (I - Q_C) = entrada  =>  (I - Q_C)^T v_C^T = entrada^T
+                a = [[1.0 if i == j else 0.0 for j in range(len(transitorios))] for i in range(len(transitorios))]
+                for u in transitorios:
+                    for v, p, _ in self.trans[u]:
+                        if v in posicion:
+                            a[posicion[v]][posicion[u]] -= p
+                valores = [x[0] for x in resolver_lineal(a, [[entrada.get(u, 0.0)] for u in transitorios])]
+            for u, valor in zip(transitorios, valores):
+                if valor == 0.0:
+                    continue
+                visitas[u] = valor
+                for v, p, _ in self.trans[u]:
+                    if v != NODO_FALTANTE and v not in posicion:
+                        entrada[v] = entrada.get(v, 0.0) + valor * p
+        return visitas
+
+    def _visitas_de_vuelta(self, u: int) -> Dict[int, float]:
+        """Columna N[·, u] restringida a la componente de u (fuera de ella es cero)"""
+        if u in self._vueltas:
+            return self._vueltas[u]
+        componente = [w for w in self._componente[u] if not self._es_absorbente(w)]
+        posicion = {w: k for k, w in enumerate(componente)}
+        # (I - Q_C) x = e_u
+        a = [[1.0 if i == j else 0.0 for j in range(len(componente))] for i in range(len(componente))]
+        for w in componente:
+            for v, p, _ in self.trans[w]:
+                if v in posicion:
+                    a[posicion[w]][posicion[v]] -= p
+        x = resolver_lineal(a, [[1.0 if w == u else 0.0] for w in componente])
+        self._vueltas[u] = {w: fila[0] for w, fila in zip(componente, x)}
+        return self._vueltas[u]
+
+    # ------------------- Sensibilidad de probabilidades -------------------
+    def _fila(self, u: int, pesos: List[float]) -> Dict[Tuple[int, str], float]:
+        """Probabilidad de cada destino del nodo u con los pesos dados"""
+        total = float(sum(pesos))
+        fila: Dict[Tuple[int, str], float] = {}
+        for opcion, destino, peso in zip(self.grafo.opciones(u), self.grafo.sucesores[u], pesos):
+            if peso > 0 and total > 0:
+                clave = (destino, opcion["siguiente"])
+                fila[clave] = fila.get(clave, 0.0) + peso / total
+        return fila
+
+    def _pesos(self, u: int) -> List[float]:
+        opciones = self.grafo.opciones(u)
+        w = self.pesos.get(self.grafo.ids[u])
+        if w is None or len(w) != len(opciones) or sum(w) <= 0:
+            w = [1.0] * len(opciones)
+        return list(w)
+
+    def sensibilidad_peso(self, nodo_id: str, indice: int,
+                          factor: float = 2.0) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Cambio exacto en la distribución de finales de cada campaña al multiplicar por
+        ``factor`` el peso de la opción ``indice`` del nodo (factor 0 = quitar la opción)."""
+        u = self.grafo.indice[nodo_id]
+        pesos = self._pesos(u)
+        nuevos = list(pesos)
+        nuevos[indice] *= factor
+        if sum(nuevos) <= 0:
+            raise ValueError(f"El nodo '{nodo_id}' se quedaría sin opciones")
+
+        antes = self._fila(u, pesos)
+        despues = self._fila(u, nuevos)
+        delta = {clave: despues.get(clave, 0.0) - antes.get(clave, 0.0) for clave in set(antes) | set(despues)}
+
+        # s = (d · B) / (1 - d · N[:, u])
+        vueltas = self._visitas_de_vuelta(u)
+        numerador: Dict[str, float] = {}
+        denominador = 1.0
+        for (v, destino_id), d in delta.items():
+            if d == 0.0:
+                continue
+            fila_b = {"faltante:" + destino_id: 1.0} if v == NODO_FALTANTE else self.absorcion[v]
+            for clave, q in fila_b.items():
+                numerador[clave] = numerador.get(clave, 0.0) + d * q
+            denominador -= d * vueltas.get(v, 0.0)
+        if abs(denominador) < TOLERANCIA_SINGULAR:
+            # Sin la opción el ciclo del nodo se queda sin salida: (I - Q) deja de ser
+            # invertible y la actualización de rango uno no vale
+            return self._recalcular(u, nuevos)
+
+        resultado = {}
+        for clave_campana, visitas in self.visitas.items():
+            n = visitas.get(u, 0.0)
+            if n == 0.0:
+                continue
+            cambios = {clave: n * valor / denominador for clave, valor in numerador.items()
+                       if abs(n * valor) > 1e-15}
+            if cambios:
+                resultado[clave_campana] = cambios
+        return resultado
+
+    def _recalcular(self, u: int, nuevos: List[float]) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Cambio en la distribución de finales resolviendo de nuevo la absorción de cada
+        campaña que pasa por u, con los pesos ``nuevos`` en u"""
+        pesos = dict(self.pesos)
+        pesos[self.grafo.ids[u]] = nuevos
+        trans = transiciones(self.grafo, pesos)
+        resultado = {}
+        for clave_campana, raiz in self.raices.items():
+            if self.visitas[clave_campana].get(u, 0.0) == 0.0:
+                continue
+            antes = self.absorcion[raiz]
+            despues = absorcion(self.grafo, nodos=self.grafo.alcanzables(raiz), trans=trans)[raiz]
+            cambios = {clave: despues.get(clave, 0.0) - antes.get(clave, 0.0) for clave in set(antes) | set(despues)}
+            cambios = {clave: valor for clave, valor in cambios.items() if abs(valor) > 1e-15}
+            if cambios:
+                resultado[clave_campana] = cambios
+        return resultado
+
+    # ------------------- Sensibilidad de estadísticas -------------------
+    def sensibilidad_cambio(self, nodo_id: str, indice: int, delta: int = 10,
+                            segundo: bool = False) -> Dict[str, Dict[str, Tuple[float, float]]]:
+        """Desplazamiento (Δmín, Δmáx) de los rangos de estadísticas de cada final al sumar
+        ``delta`` al ``cambio`` (o a ``cambio2`` si segundo) de la opción."""
+        opcion = self.historia[nodo_id].opciones[indice]
+        clave_stat, clave_cambio = ("stat2", "cambio2") if segundo else ("stat", "cambio")
+        if opcion.get(clave_stat) not in STATS:
+            return {}
+
+        finales = self.incremental.finales_alcanzables(nodo_id)
+        antes = {final: self.incremental.intervalos(final) for final in finales}
+        opcion[clave_cambio] += delta
+        try:
+            self.incremental.notificar_cambio(nodo_id)
+            despues = {final: self.incremental.intervalos(final) for final in finales}
+        finally:
+            opcion[clave_cambio] -= delta
+            self.incremental.notificar_cambio(nodo_id)
+
+        resultado = {}
+        for final in finales:
+            cambios = {}
+            for stat in STATS:
+                a = antes[final].get(stat, (0, 0))
+                b = despues[final].get(stat, (0, 0))
+                if a != b:
+                    # Un extremo infinito que no cambia no se desplaza (inf - inf sería nan)
+                    cambios[stat] = tuple(0 if y == x else y - x for x, y in zip(a, b))
+            if cambios:
+                resultado[final] = cambios
+        return resultado
+
+    # ------------------- Barrido -------------------
+    def barrido(self, factor: float = 2.0, delta: int = 10) -> List[Dict]:
+        """Evaluar todas las opciones y ordenarlas por influencia"""
+        filas = []
+        for nodo_id, nodo in self.historia.items():
+            if nodo.es_final or (len(nodo.opciones) < 2 and factor == 0):
+                continue
+            for indice, opcion in enumerate(nodo.opciones):
+                prob = self.sensibilidad_peso(nodo_id, indice, factor)
+                influencia_prob = max((0.5 * sum(abs(x) for x in cambios.values())
+                                       for cambios in prob.values()), default=0.0)
+                stats = self.sensibilidad_cambio(nodo_id, indice, delta)
+                influencia_stats = sum(abs(lo) + abs(hi) for cambios in stats.values()
+                                       for lo, hi in cambios.values())
+                filas.append({
+                    "nodo": nodo_id,
+                    "opcion": indice,
+                    "texto": opcion["texto"],
+                    "influencia_prob": influencia_prob,
+                    "influencia_stats": influencia_stats,
+                    "finales_afectados": len(stats),
+                })
+        filas.sort(key=lambda f: (-f["influencia_prob"], -f["influencia_stats"], f["nodo"], f["opcion"]))
+        return filas
+
+
+def main():
+    """Barrer todas las opciones e imprimir las más influyentes"""
+    factor = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    delta = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    top = int(sys.argv[3]) if len(sys.argv) > 3 else 25
+
+    filas = AnalisisSensibilidad(cargar_historia()).barrido(factor, delta)
+    print(f"{len(filas)} opciones evaluadas (peso x{factor:g}, cambio {delta:+d})")
+    print("\nMás influyentes en la distribución de finales (distancia de variación total):")
+    for fila in filas[:top]:
+        print(f"  {fila['influencia_prob']:.4f}  {fila['nodo']}[{fila['opcion']}]  {fila['texto']}")
+    print("\nMás influyentes en los rangos de estadísticas finales:")
+    for fila in sorted(filas, key=lambda f: -f["influencia_stats"])[:top]:
+        print(f"  {fila['influencia_stats']:6.0f}  ({fila['finales_afectados']} finales)  "
+              f"{fila['nodo']}[{fila['opcion']}]  {fila['texto']}")
+
+
+if __name__ == "__main__":
+    main()
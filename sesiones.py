@@ -0,0 +1,209 @@
+"""
+Muchas partidas simultáneas en un solo proceso (quioscos, aulas).
+
+La historia se construye una vez y se comparte entre todas las sesiones como
+un mapeo de solo lectura (``MappingProxyType``); cada ``Sesion`` guarda solo
+su estado: un ``Jugador`` (estadísticas, máscara de items y registro compacto
+de decisiones) y su historial de instantáneas para deshacer. Las sesiones
+usan el mismo motor que el juego (``MotorJuego``), así que ``iniciar``,
+``opciones``, ``elegir``, ``deshacer``... funcionan igual.
+
+``RegistroSesiones`` crea, busca, cierra y caduca sesiones y cuenta la memoria
+propia de cada una (sin la historia compartida).
+
+Uso: python sesiones.py [-n 10000] [--pasos 20] [--semilla 1] [--sin-historial]
+"""
+import argparse
+import gc
+import itertools
+import random
+import sys
+import time
+import tracemalloc
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
+
+from grafo_historia import campanas, cargar_historia
+from juego_base import Instantanea, MotorJuego, NodoHistoria, TablaDecisiones
+
+# Segundos sin actividad tras los que ``caducar`` cierra una sesión
+INACTIVIDAD_MAXIMA = 30 * 60
+
+
+class Sesion(MotorJuego):
+    """Una partida en curso sobre la historia compartida"""
+    __slots__ = ("id", "historia", "tabla_decisiones", "jugador", "dificultad", "personaje_actual",
+                 "instantanea", "_punta", "historial", "ultimo_uso")
+
+    def __init__(self, id: str, historia: Mapping[str, NodoHistoria], historial: bool = True,
+                 tabla_decisiones: Optional[TablaDecisiones] = None):
+        self.id = id
+        self.historia = historia
+        # Compartida por todas las sesiones de la misma historia
+        self.tabla_decisiones = tabla_decisiones if tabla_decisiones is not None else TablaDecisiones()
+        self.jugador = None
+        self.dificultad = None
+        self.personaje_actual = None
+        self.instantanea: Optional[Instantanea] = None
+        self._punta: Optional[Instantanea] = None
+        # Sin historial no se guardan instantáneas (no se puede deshacer, pero ocupa menos)
+        self.historial = historial
+        self.ultimo_uso = time.monotonic()
+
+    def iniciar(self, personaje: str, dificultad: str, nombre: str = "Héroe") -> Optional[NodoHistoria]:
+        self.ultimo_uso = time.monotonic()
+        return super().iniciar(personaje, dificultad, nombre)
+
+    def elegir(self, indice: int):
+        self.ultimo_uso = time.monotonic()
+        return super().elegir(indice)
+
+
+def _compartidos(historia: Mapping[str, NodoHistoria]) -> set:
+    """Ids de los objetos de la historia (no cuentan en la memoria de las sesiones)"""
+    vistos = {id(historia)}
+    pendientes = [historia]
+    while pendientes:
+        for objeto in gc.get_referents(pendientes.pop()):
+            if id(objeto) not in vistos and not isinstance(objeto, type):
+                vistos.add(id(objeto))
+                pendientes.append(objeto)
+    return vistos
+
+
+def _es_compartido_por_python(objeto: object) -> bool:
+    """None, booleanos y enteros pequeños: Python los comparte, no ocupan memoria por sesión"""
+    return objeto is None or isinstance(objeto, bool) or (type(objeto) is int and -5 <= objeto <= 256)
+
+
+def memoria_objeto(raiz: object, excluir: set) -> int:
+    """Bytes de ``raiz`` y de todo lo que referencia, salvo los objetos de ``excluir``
+    (la historia compartida), las clases y los objetos que Python ya comparte"""
+    vistos = set()
+    total = 0
+    pendientes = [raiz]
+    while pendientes:
+        objeto = pendientes.pop()
+        if (id(objeto) in vistos or id(objeto) in excluir or isinstance(objeto, type)
+                or _es_compartido_por_python(objeto)):
+            continue
+        vistos.add(id(objeto))
+        total += sys.getsizeof(objeto)
+        pendientes.extend(gc.get_referents(objeto))
+    return total
+
+
+class RegistroSesiones:
+    """Sesiones activas sobre una única historia compartida"""
+
+    def __init__(self, historia: Optional[Dict[str, NodoHistoria]] = None, historial: bool = True):
+        historia = historia if historia is not None else cargar_historia()
+        self.historia: Mapping[str, NodoHistoria] = MappingProxyType(historia)
+        self.historial = historial
+        self.tabla_decisiones = TablaDecisiones()
+        self.sesiones: Dict[str, Sesion] = {}
+        self._contador = itertools.count(1)
+        self._compartidos: Optional[set] = None
+
+    def __len__(self):
+        return len(self.sesiones)
+
+    def __contains__(self, id_sesion: str) -> bool:
+        return id_sesion in self.sesiones
+
+    def crear(self, personaje: str, dificultad: str, nombre: str = "Héroe") -> Sesion:
+        """Nueva sesión empezada en la raíz de la campaña"""
+        sesion = Sesion(f"s{next(self._contador)}", self.historia, self.historial, self.tabla_decisiones)
+        if sesion.iniciar(personaje, dificultad, nombre) is None:
+            raise ValueError(f"No existe la campaña {personaje}/{dificultad}")
+        self.sesiones[sesion.id] = sesion
+        return sesion
+
+    def obtener(self, id_sesion: str) -> Sesion:
+        """Sesión por id (KeyError si no existe o ya se cerró)"""
+        return self.sesiones[id_sesion]
+
+    def cerrar(self, id_sesion: str) -> bool:
+        return self.sesiones.pop(id_sesion, None) is not None
+
+    def caducar(self, inactividad: float = INACTIVIDAD_MAXIMA) -> int:
+        """Cerrar las sesiones sin actividad en los últimos ``inactividad`` segundos"""
+        limite = time.monotonic() - inactividad
+        caducadas = [s.id for s in self.sesiones.values() if s.ultimo_uso < limite]
+        for id_sesion in caducadas:
+            del self.sesiones[id_sesion]
+        return len(caducadas)
+
+    def memoria_sesion(self, sesion: Sesion) -> int:
+        """Bytes propios de una sesión (sin la historia ni la tabla de decisiones compartidas)"""
+        if self._compartidos is None:
+            self._compartidos = _compartidos(self.historia)
+            self._compartidos.add(id(self.tabla_decisiones))
+        return memoria_objeto(sesion, self._compartidos)
+
+    def memoria(self, sesiones: Optional[Iterable[Sesion]] = None) -> dict:
+        """Memoria propia de las sesiones: total, media y máximo en bytes"""
+        tamanos = [self.memoria_sesion(s) for s in (sesiones if sesiones is not None else self.sesiones.values())]
+        return {"sesiones": len(tamanos), "total": sum(tamanos),
+                "media": sum(tamanos) / len(tamanos) if tamanos else 0, "maximo": max(tamanos, default=0)}
+
+
+def _jugar(registro: RegistroSesiones, sesiones: int, pasos: int, rng: random.Random):
+    """Crear ``sesiones`` sesiones en campañas al azar y jugar hasta ``pasos`` elecciones en cada
+    una, por turnos; devuelve (segundos de creación, segundos de juego, elecciones)"""
+    raices = list(campanas(registro.historia))
+    inicio = time.perf_counter()
+    for _ in range(sesiones):
+        personaje, dificultad = rng.choice(raices)
+        registro.crear(personaje, dificultad, "Jugador")
+    creacion = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    elecciones = 0
+    for _ in range(pasos):
+        for sesion in registro.sesiones.values():
+            opciones = sesion.opciones()
+            if opciones:
+                sesion.elegir(rng.randrange(len(opciones)))
+                elecciones += 1
+    return creacion, time.perf_counter() - inicio, elecciones
+
+
+def main():
+    """Benchmark: muchas sesiones activas sobre una sola historia"""
+    parser = argparse.ArgumentParser(description="Muchas sesiones simultáneas sobre una historia compartida")
+    parser.add_argument("-n", "--sesiones", type=int, default=10000)
+    parser.add_argument("--pasos", type=int, default=20, help="elecciones por sesión (como máximo)")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--sin-historial", action="store_true", help="no guardar instantáneas para deshacer")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    registro = RegistroSesiones(historial=not args.sin_historial)
+    carga = time.perf_counter() - inicio
+    print(f"Historia: {len(registro.historia)} nodos cargados una vez ({carga:.2f} s)")
+
+    semilla = args.semilla if args.semilla is not None else random.randrange(2 ** 32)
+    creacion, juego, elecciones = _jugar(registro, args.sesiones, args.pasos, random.Random(semilla))
+
+    # Misma carga otra vez con tracemalloc activo (lo ralentiza: por eso no se mide el tiempo aquí)
+    otro = RegistroSesiones(registro.historia, historial=not args.sin_historial)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    _jugar(otro, args.sesiones, args.pasos, random.Random(semilla))
+    ocupada = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del otro
+
+    compartida = all(s.historia is registro.historia for s in registro.sesiones.values())
+    memoria = registro.memoria()
+    print(f"{len(registro):,} sesiones activas (historia compartida: {'sí' if compartida else 'no'})")
+    print(f"  creación: {creacion / args.sesiones * 1e6:.1f} µs/sesión")
+    print(f"  {elecciones:,} elecciones: {juego / max(1, elecciones) * 1e6:.1f} µs/elección")
+    print(f"  memoria (tracemalloc): {ocupada / 2 ** 20:.1f} MiB, {ocupada / args.sesiones:,.0f} bytes/sesión")
+    print(f"  memoria propia por sesión: media {memoria['media']:,.0f} bytes, máximo {memoria['maximo']:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""
+Simulador de partidas sin interfaz (Monte Carlo).
+
+Juega partidas completas con ``JuegoAventuraBase`` y ``Jugador`` desde la raíz
+de una campaña, eligiendo opciones al azar (o con una política) y aplicando los
+efectos reales de cada opción. No importa Tk, PIL ni pygame.
+
+Resume la distribución de finales, las estadísticas finales, la longitud de
+los caminos y el número de items obtenidos.
+
+Con ``--procesos`` las partidas se reparten en lotes entre varios procesos. La
+historia se construye una sola vez y los procesos hijos la heredan por ``fork``
+(con ``gc.freeze`` para que el recolector no copie las páginas compartidas), así
+que no se serializa por tarea; cada lote devuelve solo sus agregados, que se van
+combinando a medida que llegan.
+
+Con ``--punto-control`` los agregados se guardan periódicamente en disco y, si
+el trabajo se interrumpe, al volver a lanzarlo continúa desde el último lote
+guardado con un resultado idéntico al de una ejecución sin cortes. El punto de
+control guarda la identidad de la política (``identidad_politica``) y no se
+reanuda con otra distinta.
+
+Con ``--telemetria`` las elecciones siguen las frecuencias registradas por
+``telemetria.py`` en partidas reales en lugar de ser uniformes.
+
+Uso: python simulador.py jason dificil -n 100000 [--semilla 1] [--procesos 0] [--json salida.json]
+                         [--punto-control progreso.json] [--telemetria telemetria_elecciones.json]
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from grafo_historia import STATS, nodo_inicial
+from juego_base import JuegoAventuraBase, Jugador, NodoHistoria, avanzar
+from telemetria import cargar_conteos, pesos_desde_conteos
+
+# Una política recibe el nodo actual, el jugador y el generador aleatorio y devuelve
+# el índice de la opción elegida
+Politica = Callable[[NodoHistoria, Jugador, random.Random], int]
+
+# Pasos máximos por partida (protege de los ciclos de la historia)
+MAX_PASOS = 10000
+
+# Partidas por lote en la simulación en paralelo
+TAM_LOTE = 10000
+
+# Segundos entre puntos de control en la simulación reanudable
+INTERVALO_PUNTO_CONTROL = 30.0
+
+# Estado de solo lectura que los procesos hijos heredan del padre (historia y política)
+_COMPARTIDO: Dict = {}
+
+
+def politica_uniforme(nodo: NodoHistoria, jugador: Jugador, rng: random.Random) -> int:
+    """Elegir cualquier opción con la misma probabilidad"""
+    return rng.randrange(len(nodo.opciones))
+
+
+class PoliticaTabla:
+    """Política con pesos por nodo: {id de nodo: [peso de cada opción]}.
+
+    Los nodos sin tabla (o con una tabla que no cuadra con sus opciones) se juegan
+    de forma uniforme.
+    """
+
+    def __init__(self, pesos: Dict[str, List[float]]):
+        self.pesos = pesos
+
+    def __call__(self, nodo: NodoHistoria, jugador: Jugador, rng: random.Random) -> int:
+        # La clave de la historia, no ``nodo.id``: algún nodo tiene un id distinto de su clave
+        pesos = self.pesos.get(jugador.nodo_actual)
+        if not pesos or len(pesos) != len(nodo.opciones) or sum(pesos) <= 0:
+            return rng.randrange(len(nodo.opciones))
+        return rng.choices(range(len(pesos)), weights=pesos)[0]
+
+    def identidad(self) -> str:
+        datos = json.dumps(self.pesos, sort_keys=True, separators=(",", ":"))
+        return f"tabla:{zlib.crc32(datos.encode('utf-8')):08x}"
+
+
+def identidad_politica(politica: Politica) -> str:
+    """Nombre estable de una política para comprobar que un punto de control es de la misma.
+
+    Las políticas con datos (tablas) definen ``identidad()``; las funciones se
+    identifican por su nombre.
+    """
+    identidad = getattr(politica, "identidad", None)
+    if callable(identidad):
+        return identidad()
+    nombre = getattr(politica, "__qualname__", type(politica).__qualname__)
+    return f"{getattr(politica, '__module__', '')}.{nombre}"
+
+
+def simular_partida(historia: Dict[str, NodoHistoria], raiz: str, politica: Politica,
+                    rng: random.Random, max_pasos: int = MAX_PASOS) -> dict:
+    """Jugar una partida desde raiz y devolver su resumen"""
+    jugador = Jugador("Simulación")
+    jugador.nodo_actual = raiz
+    resultado = None
+    for _ in range(max_pasos):
+        nodo = historia.get(jugador.nodo_actual)
+        if nodo is None:
+            resultado = "faltante:" + jugador.nodo_actual
+            break
+        if nodo.es_final:
+            resultado = nodo.id
+            break
+        if not nodo.opciones:
+            resultado = "callejon:" + nodo.id
+            break
+        k = politica(nodo, jugador, rng)
+        avanzar(jugador, k, nodo.opciones[k])
+    else:
+        resultado = "limite"
+    return {
+        "final": resultado,
+        "pasos": jugador.num_decisiones,
+        "salud": jugador.salud,
+        "reputacion": jugador.reputacion,
+        "recursos": jugador.recursos,
+        "items": jugador.num_items,
+    }
+
+
+class ResultadosSimulacion:
+    """Agregados de muchas partidas (se pueden combinar entre lotes)"""
+
+    def __init__(self):
+        self.partidas = 0
+        self.finales = Counter()
+        self.pasos = Counter()
+        self.items = Counter()
+        self.stats = {stat: Counter() for stat in STATS}
+
+    def agregar(self, resumen: dict):
+        """Sumar el resumen de una partida"""
+        self.partidas += 1
+        self.finales[resumen["final"]] += 1
+        self.pasos[resumen["pasos"]] += 1
+        self.items[resumen["items"]] += 1
+        for stat in STATS:
+            self.stats[stat][resumen[stat]] += 1
+
+    def combinar(self, otro: "ResultadosSimulacion"):
+        """Sumar los agregados de otro lote"""
+        self.partidas += otro.partidas
+        self.finales.update(otro.finales)
+        self.pasos.update(otro.pasos)
+        self.items.update(otro.items)
+        for stat in STATS:
+            self.stats[stat].update(otro.stats[stat])
+
+    @staticmethod
+    def _resumen(histograma: Counter) -> dict:
+        total = sum(histograma.values())
+        if not total:
+            return {}
+        media = sum(valor * n for valor, n in histograma.items()) / total
+        varianza = sum(n * (valor - media) ** 2 for valor, n in histograma.items()) / total
+        return {"media": media, "desviacion": varianza ** 0.5,
+                "min": min(histograma), "max": max(histograma)}
+
+    def estado(self) -> dict:
+        """Agregados en bruto para un punto de control (conserva el orden de inserción)"""
+        return {
+            "partidas": self.partidas,
+            "finales": list(self.finales.items()),
+            "pasos": list(self.pasos.items()),
+            "items": list(self.items.items()),
+            "stats": {stat: list(self.stats[stat].items()) for stat in STATS},
+        }
+
+    @classmethod
+    def desde_estado(cls, estado: dict) -> "ResultadosSimulacion":
+        """Reconstruir los agregados guardados con ``estado``"""
+        resultados = cls()
+        resultados.partidas = estado["partidas"]
+        resultados.finales = Counter(dict(estado["finales"]))
+        resultados.pasos = Counter(dict(estado["pasos"]))
+        resultados.items = Counter(dict(estado["items"]))
+        resultados.stats = {stat: Counter(dict(estado["stats"][stat])) for stat in STATS}
+        return resultados
+
+    def a_dict(self) -> dict:
+        """Resultados en un diccionario serializable a JSON"""
+        return {
+            "partidas": self.partidas,
+            "finales": dict(self.finales.most_common()),
+            "pasos": self._resumen(self.pasos),
+            "items": self._resumen(self.items),
+            "stats": {stat: self._resumen(self.stats[stat]) for stat in STATS},
+            "histogramas": {
+                "pasos": dict(sorted(self.pasos.items())),
+                "items": dict(sorted(self.items.items())),
+                **{stat: dict(sorted(self.stats[stat].items())) for stat in STATS},
+            },
+        }
+
+    def informe(self) -> str:
+        """Texto con el resumen de la simulación"""
+        datos = self.a_dict()
+        lineas = [f"Partidas: {self.partidas}", "", "FINALES:"]
+        for final, n in self.finales.most_common():
+            lineas.append(f"  {n / self.partidas:8.4%}  {final}")
+        lineas.append("")
+        for nombre, resumen in [("Pasos", datos["pasos"]), ("Items", datos["items"])] + \
+                [(stat.capitalize(), datos["stats"][stat]) for stat in STATS]:
+            if resumen:
+                lineas.append(f"{nombre:<11} media {resumen['media']:7.2f}  desv {resumen['desviacion']:6.2f}  "
+                              f"mín {resumen['min']}  máx {resumen['max']}")
+        return "\n".join(lineas)
+
+
+def simular(juego: JuegoAventuraBase, raiz: str, partidas: int, semilla: Optional[int] = None,
+            politica: Politica = politica_uniforme) -> ResultadosSimulacion:
+    """Jugar ``partidas`` partidas desde raiz y agregar los resultados"""
+    rng = random.Random(semilla)
+    resultados = ResultadosSimulacion()
+    for _ in range(partidas):
+        resultados.agregar(simular_partida(juego.historia, raiz, politica, rng))
+    return resultados
+
+
+def _iniciar_trabajador(politica: Politica):
+    """Preparar un proceso hijo que no heredó la historia (arranque sin fork)"""
+    if "historia" not in _COMPARTIDO:
+        _COMPARTIDO["historia"] = JuegoAventuraBase().historia
+        _COMPARTIDO["politica"] = politica
+
+
+def _simular_lote(tarea) -> ResultadosSimulacion:
+    """Jugar un lote en el proceso actual usando la historia compartida"""
+    raiz, semilla, lote, partidas = tarea
+    # Semilla propia por lote: el resultado no depende del número de procesos
+    rng = random.Random(f"{semilla}-{lote}") if semilla is not None else random.Random()
+    historia = _COMPARTIDO["historia"]
+    politica = _COMPARTIDO["politica"]
+    resultados = ResultadosSimulacion()
+    for _ in range(partidas):
+        resultados.agregar(simular_partida(historia, raiz, politica, rng))
+    return resultados
+
+
+def simular_paralelo(juego: JuegoAventuraBase, raiz: str, partidas: int, procesos: int = 0,
+                     semilla: Optional[int] = None, politica: Politica = politica_uniforme,
+                     tam_lote: int = TAM_LOTE, al_recibir: Optional[Callable] = None) -> ResultadosSimulacion:
+    """Repartir ``partidas`` en lotes entre ``procesos`` procesos (0 = todos los núcleos).
+
+    ``al_recibir(resultados_parciales)`` se llama cada vez que llega un lote.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    tareas = [(raiz, semilla, lote, min(tam_lote, partidas - inicio))
+              for lote, inicio in enumerate(range(0, partidas, tam_lote))]
+    _COMPARTIDO["historia"] = juego.historia
+    _COMPARTIDO["politica"] = politica
+    resultados = ResultadosSimulacion()
+
+    def combinar(parciales):
+        for parcial in parciales:
+            resultados.combinar(parcial)
+            if al_recibir:
+                al_recibir(resultados)
+
+    try:
+        if procesos == 1:
+            combinar(map(_simular_lote, tareas))
+        else:
+            metodos = multiprocessing.get_all_start_methods()
+            contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+            # Congelar los objetos actuales: el recolector no los toca y las páginas siguen compartidas
+            gc.freeze()
+            # Al salir del ``with`` (también por una excepción) el pool se termina
+            with contexto.Pool(procesos, initializer=_iniciar_trabajador, initargs=(politica,)) as pool:
+                combinar(pool.imap_unordered(_simular_lote, tareas))
+    finally:
+        if procesos != 1:
+            gc.unfreeze()
+        _COMPARTIDO.clear()
+    return resultados
+
+
+def _guardar_punto_control(ruta: str, datos: dict):
+    """Escribir el punto de control de forma atómica (nunca queda a medias)"""
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def simular_reanudable(juego: JuegoAventuraBase, raiz: str, partidas: int, punto_control: str,
+                       procesos: int = 1, semilla: Optional[int] = None, tam_lote: int = TAM_LOTE,
+                       cada_segundos: float = INTERVALO_PUNTO_CONTROL,
+                       al_recibir: Optional[Callable] = None,
+                       politica: Politica = politica_uniforme) -> ResultadosSimulacion:
+    """Como ``simular_paralelo`` pero guardando los agregados en ``punto_control`` cada
+    ``cada_segundos``; si el archivo ya existe, continúa desde el último lote guardado.
+
+    Cada lote tiene su propia semilla y los lotes se combinan siempre en orden, así
+    que el resultado es idéntico bit a bit al de una ejecución sin interrupciones.
+    Si no se da semilla se elige una y se guarda en el punto de control.
+    """
+    configuracion = {"raiz": raiz, "partidas": partidas, "tam_lote": tam_lote,
+                     "politica": identidad_politica(politica)}
+    resultados = ResultadosSimulacion()
+    completados = 0
+    if os.path.exists(punto_control):
+        with open(punto_control, "r", encoding="utf-8") as f:
+            guardado = json.load(f)
+        if guardado["configuracion"] != configuracion or (semilla is not None and guardado["semilla"] != semilla):
+            raise ValueError(f"El punto de control '{punto_control}' es de otra simulación: "
+                             f"{guardado['configuracion']} (semilla {guardado['semilla']})")
+        semilla = guardado["semilla"]
+        completados = guardado["lotes_completados"]
+        resultados = ResultadosSimulacion.desde_estado(guardado["resultados"])
+    elif semilla is None:
+        semilla = random.SystemRandom().randrange(2 ** 63)
+
+    def guardar():
+        _guardar_punto_control(punto_control, {"configuracion": configuracion, "semilla": semilla,
+                                               "lotes_completados": completados,
+                                               "resultados": resultados.estado()})
+
+    procesos = procesos or os.cpu_count() or 1
+    tareas = [(raiz, semilla, lote, min(tam_lote, partidas - inicio))
+              for lote, inicio in enumerate(range(0, partidas, tam_lote))][completados:]
+    _COMPARTIDO["historia"] = juego.historia
+    _COMPARTIDO["politica"] = politica
+    pool = None
+    ultimo = time.monotonic()
+    try:
+        if procesos == 1:
+            parciales = map(_simular_lote, tareas)
+        else:
+            metodos = multiprocessing.get_all_start_methods()
+            contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+            gc.freeze()
+            pool = contexto.Pool(procesos, initializer=_iniciar_trabajador, initargs=(politica,))
+            # imap (ordenado): los lotes se combinan en el mismo orden que sin interrupciones
+            parciales = pool.imap(_simular_lote, tareas)
+        for parcial in parciales:
+            resultados.combinar(parcial)
+            completados += 1
+            if al_recibir:
+                al_recibir(resultados)
+            if time.monotonic() - ultimo >= cada_segundos:
+                guardar()
+                ultimo = time.monotonic()
+        guardar()
+    except KeyboardInterrupt:
+        guardar()
+        raise
+    finally:
+        if pool is not None:
+            pool.terminate()
+            gc.unfreeze()
+        _COMPARTIDO.clear()
+    return resultados
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulador de partidas sin interfaz")
+    parser.add_argument("personaje", help="jason, dick, tim o damian (o un id de nodo raíz con --raiz)")
+    parser.add_argument("dificultad", nargs="?", default="facil", help="facil, normal o dificil")
+    parser.add_argument("-n", "--partidas", type=int, default=10000)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="simular en paralelo con N procesos (0 = todos los núcleos)")
+    parser.add_argument("--escalado", action="store_true",
+                        help="medir partidas/segundo con 1, 2, 4... procesos hasta el número de núcleos")
+    parser.add_argument("--punto-control", default=None,
+                        help="guardar el progreso en este archivo y reanudar desde él si existe")
+    parser.add_argument("--telemetria", default=None,
+                        help="elegir según las frecuencias de este archivo de telemetría en vez de al azar")
+    parser.add_argument("--raiz", action="store_true", help="interpretar 'personaje' como id de nodo raíz")
+    parser.add_argument("--json", dest="salida", default=None, help="guardar los resultados en un JSON")
+    args = parser.parse_args()
+
+    juego = JuegoAventuraBase()
+    raiz = args.personaje if args.raiz else nodo_inicial(args.personaje, args.dificultad)
+    if raiz not in juego.historia:
+        parser.error(f"Nodo raíz '{raiz}' no encontrado")
+    politica = politica_uniforme
+    if args.telemetria:
+        conteos = cargar_conteos(args.telemetria)
+        if not conteos:
+            parser.error(f"Sin datos de telemetría en '{args.telemetria}'")
+        politica = PoliticaTabla(pesos_desde_conteos(conteos, historia=juego.historia))
+
+    if args.escalado:
+        nucleos = os.cpu_count() or 1
+        procesos = 1
+        base = None
+        while True:
+            inicio = time.perf_counter()
+            simular_paralelo(juego, raiz, args.partidas, procesos, args.semilla, politica)
+            velocidad = args.partidas / (time.perf_counter() - inicio)
+            base = base or velocidad
+            print(f"{procesos:3d} procesos: {velocidad:12,.0f} partidas/segundo  (x{velocidad / base:.2f})")
+            if procesos >= nucleos:
+                break
+            procesos = min(procesos * 2, nucleos)
+        return
+
+    inicio = time.perf_counter()
+    if args.punto_control:
+        try:
+            resultados = simular_reanudable(juego, raiz, args.partidas, args.punto_control,
+                                            args.procesos if args.procesos is not None else 1, args.semilla,
+                                            politica=politica)
+        except KeyboardInterrupt:
+            print(f"\nInterrumpido: progreso guardado en {args.punto_control}")
+            return
+    elif args.procesos is None:
+        resultados = simular(juego, raiz, args.partidas, args.semilla, politica)
+    else:
+        resultados = simular_paralelo(juego, raiz, args.partidas, args.procesos, args.semilla, politica)
+    duracion = time.perf_counter() - inicio
+
+    print(f"Campaña: {raiz}")
+    print(resultados.informe())
+    print(f"\n{args.partidas / duracion:,.0f} partidas/segundo ({duracion:.2f} s)")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"raiz": raiz, **resultados.a_dict()}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Simulador vectorizado con NumPy: avanza N partidas a la vez.
+
+El grafo se compila a formato CSR (desplazamiento de las opciones de cada nodo,
+destino, efectos y item de cada opción) y el estado de todas las partidas vive
+en arreglos: nodo actual, (salud, reputacion, recursos), inventario como mapa de
+bits y número de pasos. En cada paso se elige una opción para todas las partidas
+activas a la vez y se aplican los efectos con el mismo recorte que
+``Jugador.modificar_stat``. Produce los mismos agregados que ``simulador``.
+
+Uso: python simulador_vectorizado.py jason dificil -n 10000000 [--semilla 1]
+"""
+import argparse
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from grafo_historia import (LIMITES, NODO_FALTANTE, STATS, STATS_INICIALES, GrafoHistoria, nodo_inicial,
+                            programa_opcion)
+from juego_base import JuegoAventuraBase
+from simulador import MAX_PASOS, ResultadosSimulacion
+
+# Partidas que se simulan a la vez (limita la memoria: ~60 bytes por partida)
+TAM_LOTE = 1_000_000
+
+# Límites de cada estadística como arreglos (recursos no tiene máximo)
+MINIMOS = np.array([minimo for minimo, _ in LIMITES], dtype=np.int64)
+MAXIMOS = np.array([np.iinfo(np.int64).max if maximo is None else maximo for _, maximo in LIMITES],
+                   dtype=np.int64)
+
+
+class GrafoCSR:
+    """Grafo de historia compilado a arreglos NumPy"""
+
+    def __init__(self, grafo: GrafoHistoria, pesos: Optional[Dict[str, List[float]]] = None):
+        pesos = pesos or {}
+        n = len(grafo)
+        # Los destinos inexistentes se convierten en nodos absorbentes extra
+        faltantes = sorted({destino for destinos in grafo.faltantes.values() for destino in destinos})
+        indice_faltante = {destino: n + k for k, destino in enumerate(faltantes)}
+        self.total_nodos = n + len(faltantes)
+        self.nombres_terminales = {}
+        for i in range(n):
+            if grafo.es_final[i]:
+                self.nombres_terminales[i] = grafo.ids[i]
+            elif not grafo.sucesores[i]:
+                self.nombres_terminales[i] = "callejon:" + grafo.ids[i]
+        for destino, i in indice_faltante.items():
+            self.nombres_terminales[i] = "faltante:" + destino
+
+        desplazamiento = [0]
+        destinos, acumulada = [], []
+        stat1, cambio1, stat2, cambio2, items = [], [], [], [], []
+        for i in range(n):
+            opciones = [] if grafo.es_final[i] else grafo.opciones(i)
+            w = pesos.get(grafo.ids[i])
+            if w is None or len(w) != len(opciones) or sum(w) <= 0:
+                w = [1.0] * len(opciones)
+            total = float(sum(w))
+            suma = 0.0
+            for opcion, destino, peso in zip(opciones, grafo.sucesores[i], w):
+                suma += peso / total
+                acumulada.append(suma)
+                destinos.append(indice_faltante[opcion["siguiente"]] if destino == NODO_FALTANTE else destino)
+                # Mismo programa de efectos que ejecuta Jugador, en dos ranuras fijas
+                pasos, _ = programa_opcion(opcion)
+                for ranura, (lista_stat, lista_cambio) in enumerate(((stat1, cambio1), (stat2, cambio2))):
+                    lista_stat.append(pasos[ranura][0] if ranura < len(pasos) else -1)
+                    lista_cambio.append(pasos[ranura][1] if ranura < len(pasos) else 0)
+                items.append(grafo.indice_items[opcion["item"]] if opcion.get("item") else -1)
+            desplazamiento.append(len(destinos))
+        for _ in faltantes:
+            desplazamiento.append(len(destinos))
+
+        self.desplazamiento = np.array(desplazamiento, dtype=np.int64)
+        self.grado = np.diff(self.desplazamiento).astype(np.int64)
+        self.max_grado = int(self.grado.max()) if len(self.grado) else 0
+        self.destino = np.array(destinos, dtype=np.int32)
+        # La última opción de cada nodo llega a 1.0 exacto para no perder masa por redondeo
+        self.acumulada = np.array(acumulada, dtype=np.float64)
+        self.acumulada[self.desplazamiento[1:][self.grado > 0] - 1] = 1.0
+        self.efectos = [(np.array(stat1, dtype=np.int8), np.array(cambio1, dtype=np.int32)),
+                        (np.array(stat2, dtype=np.int8), np.array(cambio2, dtype=np.int32))]
+        self.item = np.array(items, dtype=np.int32)
+        self.palabras_inventario = max(1, (len(grafo.items) + 63) // 64)
+        self.terminal = self.grado == 0
+        self.indice = grafo.indice
+
+
+def _contar_bits(x: "np.ndarray") -> "np.ndarray":
+    """Número de bits a 1 de cada entero sin signo de 64 bits"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x).astype(np.int64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((x * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def simular_lote(csr: GrafoCSR, raiz: str, partidas: int, rng: "np.random.Generator",
+                 max_pasos: int = MAX_PASOS, caminos: bool = False) -> Dict[str, "np.ndarray"]:
+    """Simular ``partidas`` partidas a la vez; devuelve los arreglos de estado final.
+
+    Con ``caminos`` también devuelve los nodos visitados tras cada paso de todas las
+    partidas seguidos ("camino", partida a partida); la partida i ocupa
+    ``pasos[i]`` posiciones.
+    """
+    nodo = np.full(partidas, csr.indice[raiz], dtype=np.int32)
+    stats = np.tile(np.array(STATS_INICIALES, dtype=np.int64), (partidas, 1))
+    inventario = np.zeros((partidas, csr.palabras_inventario), dtype=np.uint64)
+    pasos = np.zeros(partidas, dtype=np.int32)
+    activos = np.flatnonzero(~csr.terminal[nodo])
+    visitas_partida: List["np.ndarray"] = []
+    visitas_nodo: List["np.ndarray"] = []
+
+    for _ in range(max_pasos):
+        if not len(activos):
+            break
+        actual = nodo[activos]
+        inicio = csr.desplazamiento[actual]
+        grado = csr.grado[actual]
+        # Elegir opción: cuántas probabilidades acumuladas quedan por debajo del sorteo
+        sorteo = rng.random(len(activos))
+        k = np.zeros(len(activos), dtype=np.int64)
+        for j in range(csr.max_grado - 1):
+            posible = j < grado - 1
+            k += posible & (sorteo >= csr.acumulada[np.where(posible, inicio + j, 0)])
+        opcion = inicio + k
+
+        planos = stats.reshape(-1)
+        for stat_opcion, cambio_opcion in csr.efectos:
+            stat = stat_opcion[opcion]
+            afectados = stat >= 0
+            if not afectados.any():
+                continue
+            stat = stat[afectados]
+            celdas = activos[afectados] * len(STATS) + stat
+            valores = planos[celdas] + cambio_opcion[opcion[afectados]]
+            planos[celdas] = np.minimum(np.maximum(valores, MINIMOS[stat]), MAXIMOS[stat])
+
+        item = csr.item[opcion]
+        con_item = item >= 0
+        if con_item.any():
+            filas = activos[con_item]
+            item = item[con_item]
+            palabra = item // 64
+            bit = np.left_shift(np.uint64(1), (item % 64).astype(np.uint64))
+            inventario[filas, palabra] |= bit
+
+        nodo[activos] = csr.destino[opcion]
+        pasos[activos] += 1
+        if caminos:
+            visitas_partida.append(activos)
+            visitas_nodo.append(nodo[activos])
+        activos = activos[~csr.terminal[nodo[activos]]]
+
+    lote = {"nodo": nodo, "stats": stats, "inventario": inventario, "pasos": pasos, "sin_terminar": activos}
+    if caminos:
+        # Ordenación estable por partida: dentro de cada partida los pasos quedan en orden
+        partida = np.concatenate(visitas_partida) if visitas_partida else np.zeros(0, dtype=np.int64)
+        orden = np.argsort(partida, kind="stable")
+        lote["camino"] = (np.concatenate(visitas_nodo) if visitas_nodo else np.zeros(0, dtype=np.int32))[orden]
+    return lote
+
+
+def agregar_lote(csr: GrafoCSR, lote: Dict[str, "np.ndarray"],
+                 resultados: Optional[ResultadosSimulacion] = None) -> ResultadosSimulacion:
+    """Volcar los arreglos de un lote en un ResultadosSimulacion"""
+    resultados = resultados or ResultadosSimulacion()
+    finales = lote["nodo"].astype(np.int64)
+    if len(lote["sin_terminar"]):
+        finales[lote["sin_terminar"]] = -1
+    resultados.partidas += len(finales)
+    for valor, n in zip(*np.unique(finales, return_counts=True)):
+        resultados.finales["limite" if valor < 0 else csr.nombres_terminales[int(valor)]] += int(n)
+    for valor, n in zip(*np.unique(lote["pasos"], return_counts=True)):
+        resultados.pasos[int(valor)] += int(n)
+    items = _contar_bits(lote["inventario"]).sum(axis=1)
+    for valor, n in zip(*np.unique(items, return_counts=True)):
+        resultados.items[int(valor)] += int(n)
+    for posicion, stat in enumerate(STATS):
+        for valor, n in zip(*np.unique(lote["stats"][:, posicion], return_counts=True)):
+            resultados.stats[stat][int(valor)] += int(n)
+    return resultados
+
+
+def simular_vectorizado(juego: JuegoAventuraBase, raiz: str, partidas: int,
+                        semilla: Optional[int] = None, pesos: Optional[Dict[str, List[float]]] = None,
+                        tam_lote: int = TAM_LOTE) -> ResultadosSimulacion:
+    """Jugar ``partidas`` partidas desde raiz en lotes vectorizados"""
+    csr = GrafoCSR(GrafoHistoria(juego.historia), pesos)
+    rng = np.random.default_rng(semilla)
+    resultados = ResultadosSimulacion()
+    for inicio in range(0, partidas, tam_lote):
+        lote = simular_lote(csr, raiz, min(tam_lote, partidas - inicio), rng)
+        agregar_lote(csr, lote, resultados)
+    return resultados
+
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulador vectorizado con NumPy")
+    parser.add_argument("personaje")
+    parser.add_argument("dificultad", nargs="?", default="facil")
+    parser.add_argument("-n", "--partidas", type=int, default=1_000_000)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--lote", type=int, default=TAM_LOTE)
+    args = parser.parse_args()
+
+    juego = JuegoAventuraBase()
+    raiz = nodo_inicial(args.personaje, args.dificultad)
+    if raiz not in juego.historia:
+        parser.error(f"Nodo raíz '{raiz}' no encontrado")
+
+    inicio = time.perf_counter()
+    resultados = simular_vectorizado(juego, raiz, args.partidas, args.semilla, tam_lote=args.lote)
+    duracion = time.perf_counter() - inicio
+    print(f"Campaña: {raiz}")
+    print(resultados.informe())
+    print(f"\n{args.partidas / duracion:,.0f} partidas/segundo ({duracion:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
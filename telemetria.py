@@ -0,0 +1,124 @@
+"""
+Telemetría local y opcional de las elecciones de los jugadores.
+
+Solo se activa si la variable de entorno ``ROBINS_TELEMETRIA`` vale ``1`` (se
+guarda en ``telemetria_elecciones.json``) o una ruta de archivo. No sale nada
+del equipo: por cada nodo se guarda únicamente cuántas veces se eligió cada
+opción, ``{id de nodo: [veces opción 0, veces opción 1, ...]}``.
+
+Las tablas se convierten en pesos (``Pesos``) que aceptan ``PoliticaTabla``,
+``analisis_markov`` y el simulador vectorizado, para que las distribuciones
+simuladas se parezcan al comportamiento real en vez de al juego uniforme.
+
+Uso: python telemetria.py [archivo]   (resumen de una tabla de telemetría)
+"""
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from grafo_historia import Pesos
+
+VARIABLE_ENTORNO = "ROBINS_TELEMETRIA"
+ARCHIVO_TELEMETRIA = "telemetria_elecciones.json"
+
+# Elecciones acumuladas antes de volcarlas a disco
+GUARDAR_CADA = 20
+
+Conteos = Dict[str, List[int]]
+
+
+def cargar_conteos(ruta: str = ARCHIVO_TELEMETRIA) -> Conteos:
+    """Tabla de conteos guardada (vacía si no existe)"""
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, "r", encoding="utf-8") as f:
+        return json.load(f).get("conteos", {})
+
+
+def sumar_conteos(destino: Conteos, origen: Conteos) -> Conteos:
+    """Sumar una tabla de conteos a otra (alarga las filas si hace falta)"""
+    for nodo_id, fila in origen.items():
+        actual = destino.setdefault(nodo_id, [])
+        actual.extend([0] * (len(fila) - len(actual)))
+        for k, n in enumerate(fila):
+            actual[k] += n
+    return destino
+
+
+def pesos_desde_conteos(conteos: Conteos, suavizado: float = 1.0, historia: Optional[Dict] = None) -> Pesos:
+    """Pesos por nodo a partir de los conteos.
+
+    ``suavizado`` se suma a cada opción para que las nunca elegidas no queden
+    imposibles. Con ``historia`` las filas se ajustan al número actual de opciones
+    de cada nodo y se descartan los nodos que ya no existen.
+    """
+    pesos: Pesos = {}
+    for nodo_id, fila in conteos.items():
+        n = len(fila)
+        if historia is not None:
+            if nodo_id not in historia:
+                continue
+            n = len(historia[nodo_id].opciones)
+        fila = (list(fila) + [0] * n)[:n]
+        if sum(fila) + suavizado * n > 0:
+            pesos[nodo_id] = [c + suavizado for c in fila]
+    return pesos
+
+
+class Telemetria:
+    """Registro local de elecciones (se vuelca a disco cada GUARDAR_CADA elecciones)"""
+
+    def __init__(self, ruta: str = ARCHIVO_TELEMETRIA):
+        self.ruta = ruta
+        # Elecciones aún no guardadas
+        self.pendientes: Conteos = {}
+        self._sin_guardar = 0
+
+    @classmethod
+    def desde_entorno(cls) -> Optional["Telemetria"]:
+        """Telemetría activada por el usuario con ROBINS_TELEMETRIA (None si no la activó)"""
+        valor = os.environ.get(VARIABLE_ENTORNO, "").strip()
+        if not valor or valor.lower() in ("0", "no", "false"):
+            return None
+        return cls(ARCHIVO_TELEMETRIA if valor.lower() in ("1", "si", "sí", "true") else valor)
+
+    def registrar(self, nodo_id: str, indice: int, opciones: int):
+        """Anotar que en nodo_id se eligió la opción ``indice`` de ``opciones``"""
+        fila = self.pendientes.setdefault(nodo_id, [0] * opciones)
+        fila.extend([0] * (opciones - len(fila)))
+        fila[indice] += 1
+        self._sin_guardar += 1
+        if self._sin_guardar >= GUARDAR_CADA:
+            self.guardar()
+
+    def guardar(self):
+        """Sumar las elecciones pendientes al archivo (escritura atómica)"""
+        if not self._sin_guardar:
+            return
+        conteos = sumar_conteos(cargar_conteos(self.ruta), self.pendientes)
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "conteos": conteos}, f, ensure_ascii=False)
+        os.replace(temporal, self.ruta)
+        self.pendientes = {}
+        self._sin_guardar = 0
+
+
+def main():
+    """Resumen de una tabla de telemetría"""
+    ruta = sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_TELEMETRIA
+    conteos = cargar_conteos(ruta)
+    if not conteos:
+        print(f"Sin datos de telemetría en {ruta} (actívala con {VARIABLE_ENTORNO}=1)")
+        return 1
+    total = sum(sum(fila) for fila in conteos.values())
+    print(f"{total} elecciones en {len(conteos)} nodos")
+    for nodo_id, fila in sorted(conteos.items(), key=lambda kv: -sum(kv[1]))[:20]:
+        n = sum(fila)
+        print(f"  {n:6d}  {nodo_id}: " + "  ".join(f"{c / n:.0%}" for c in fila))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
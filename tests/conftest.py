@@ -0,0 +1,39 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Los módulos del juego están en la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def nodo(nodo_id: str, *opciones: dict, es_final: bool = False) -> SimpleNamespace:
+    """Nodo de historia mínimo (mismos atributos que NodoHistoria)"""
+    return SimpleNamespace(id=nodo_id, titulo=nodo_id, descripcion=f"Descripción de {nodo_id}",
+                           imagen="", opciones=list(opciones), es_final=es_final)
+
+
+def opcion(texto: str, siguiente: str, stat=None, cambio=0, stat2=None, cambio2=0, item=None) -> dict:
+    return {"texto": texto, "siguiente": siguiente, "stat": stat, "cambio": cambio,
+            "stat2": stat2, "cambio2": cambio2, "item": item}
+
+
+@pytest.fixture
+def historia_pequena():
+    """Campaña de jason/normal con un callejón y un ciclo der <-> bucle.
+
+    Con elección uniforme: final_a 5/12, final_b 1/3 y callejón 1/4.
+    """
+    nodos = [
+        nodo("jason_normal_inicio",
+             opcion("Izquierda", "izq", "salud", -30),
+             opcion("Derecha", "der", "reputacion", 20, item="llave")),
+        nodo("izq", opcion("Seguir", "final_a", "recursos", 2), opcion("Esperar", "callejon")),
+        nodo("der", opcion("Terminar", "final_b", "salud", -10, "reputacion", 5), opcion("Dar la vuelta", "bucle")),
+        nodo("bucle", opcion("Volver", "der", "recursos", 1), opcion("Salir", "final_a")),
+        nodo("callejon"),
+        nodo("final_a", es_final=True),
+        nodo("final_b", es_final=True),
+    ]
+    return {n.id: n for n in nodos}
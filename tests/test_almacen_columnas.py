@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from almacen_columnas import LectorColumnas, escribir_simulacion
+from grafo_historia import GrafoHistoria
+from simulador_vectorizado import GrafoCSR, simular_lote
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_ida_y_vuelta(historia_pequena, tmp_path):
+    juego = SimpleNamespace(historia=historia_pequena)
+    carpeta = str(tmp_path / "columnas")
+    # Lotes pequeños para probar la escritura por partes
+    assert escribir_simulacion(carpeta, juego, [RAIZ], 1000, semilla=4, tam_lote=300) == 1000
+
+    csr = GrafoCSR(GrafoHistoria(historia_pequena))
+    rng = np.random.default_rng(4)
+    lotes = [simular_lote(csr, RAIZ, n, rng, caminos=True) for n in (300, 300, 300, 100)]
+    lector = LectorColumnas(carpeta)
+    assert len(lector) == 1000
+    assert lector["salud"].dtype == np.uint8 and lector["recursos"].dtype == np.int32
+    assert np.array_equal(lector["pasos"], np.concatenate([lote["pasos"] for lote in lotes]))
+    assert np.array_equal(lector["camino"], np.concatenate([lote["camino"] for lote in lotes]))
+
+    finales = lector.finales()
+    assert sum(finales.values()) == 1000
+    assert set(finales) == {"final_a", "final_b", "callejon:callejon"}
+    for i in (0, 299, 300, 999):
+        camino = lector.camino(i)
+        assert len(camino) == lector["pasos"][i]
+        assert camino[-1] in ("final_a", "final_b", "callejon")
+
+
+def test_seleccionar(historia_pequena, tmp_path):
+    carpeta = str(tmp_path / "columnas")
+    escribir_simulacion(carpeta, SimpleNamespace(historia=historia_pequena), [RAIZ, "izq"], 500, semilla=1)
+    lector = LectorColumnas(carpeta)
+    assert len(lector) == 1000
+    assert len(lector.seleccionar(campana="izq")) == 500
+    assert len(lector.seleccionar(campana="otra")) == 0
+    # Desde izq no se puede pasar por der
+    assert lector.seleccionar(campana="izq", final="final_b").size == 0
+
+    indices = lector.seleccionar(final="final_b", salud_min=60, reputacion_max=80)
+    assert indices.size
+    assert set(lector.finales(indices)) == {"final_b"}
+    assert (lector["salud"][indices] >= 60).all()
+    assert (lector["reputacion"][indices] <= 80).all()
+    assert all("der" in lector.camino(int(i)) for i in indices)
@@ -0,0 +1,73 @@
+import math
+import os
+import subprocess
+import sys
+
+from analisis_incremental import AnalisisIncremental
+from conftest import nodo, opcion
+
+
+def comparar_con_calculo_completo(incremental: AnalisisIncremental):
+    completo = AnalisisIncremental(incremental.historia)
+    for nodo_id in incremental.historia:
+        assert incremental.finales_alcanzables(nodo_id) == completo.finales_alcanzables(nodo_id), nodo_id
+        assert incremental.num_caminos(nodo_id) == completo.num_caminos(nodo_id), nodo_id
+        assert incremental.campanas_que_alcanzan(nodo_id) == completo.campanas_que_alcanzan(nodo_id), nodo_id
+        # Los intervalos son una sobreaproximación: nunca más estrechos que el cálculo completo
+        for stat, (minimo, maximo) in completo.intervalos(nodo_id).items():
+            lo, hi = incremental.intervalos(nodo_id)[stat]
+            assert lo <= minimo and hi >= maximo, (nodo_id, stat)
+
+
+def test_resultados_iniciales(historia_pequena):
+    analisis = AnalisisIncremental(historia_pequena)
+    assert analisis.finales_alcanzables("jason_normal_inicio") == {"final_a", "final_b"}
+    assert analisis.finales_alcanzables("izq") == {"final_a"}
+    assert analisis.num_caminos("izq") == 1
+    assert math.isinf(analisis.num_caminos("der"))
+    assert analisis.intervalos("final_b") == {"salud": (90, 90), "reputacion": (75, 75), "recursos": (3, math.inf)}
+    assert analisis.intervalos("final_a")["salud"] == (70, 100)
+    assert analisis.problemas() == {"inalcanzables": [], "sin_final": ["callejon"], "faltantes": []}
+
+
+def test_ediciones_coinciden_con_el_calculo_completo(historia_pequena):
+    analisis = AnalisisIncremental(historia_pequena)
+
+    historia_pequena["izq"].opciones[1] = opcion("Esperar", "final_b", "salud", -50)
+    analisis.notificar_cambio("izq")
+    assert analisis.finales_alcanzables("izq") == {"final_a", "final_b"}
+    comparar_con_calculo_completo(analisis)
+
+    analisis.actualizar_nodo(nodo("bucle", opcion("Salir", "final_a")))
+    assert analisis.num_caminos("der") == 2
+    comparar_con_calculo_completo(analisis)
+
+    analisis.actualizar_nodo(nodo("izq", opcion("Perderse", "no_existe")))
+    assert analisis.problemas()["faltantes"] == ["izq -> no_existe"]
+    comparar_con_calculo_completo(analisis)
+
+    analisis.eliminar_nodo("callejon")
+    assert "callejon" not in historia_pequena
+    comparar_con_calculo_completo(analisis)
+
+
+def test_el_resultado_no_depende_del_orden_de_los_conjuntos():
+    programa = (
+        "from conftest import nodo, opcion\n"
+        "from analisis_incremental import AnalisisIncremental\n"
+        "historia = {n.id: n for n in [\n"
+        "    nodo('jason_normal_inicio', opcion('a', 'x'), opcion('b', 'y')),\n"
+        "    nodo('x', opcion('c', 'y', 'recursos', 1), opcion('d', 'f')),\n"
+        "    nodo('y', opcion('e', 'x', 'salud', -1), opcion('g', 'f')),\n"
+        "    nodo('f', es_final=True)]}\n"
+        "analisis = AnalisisIncremental(historia)\n"
+        "historia['y'].opciones[0]['cambio'] = -7\n"
+        "analisis.notificar_cambio('y')\n"
+        "print(sorted((n, analisis.intervalos(n)) for n in historia))\n"
+    )
+    salidas = set()
+    for semilla in ("1", "2", "3"):
+        entorno = dict(os.environ, PYTHONHASHSEED=semilla)
+        salidas.add(subprocess.run([sys.executable, "-c", programa], env=entorno, capture_output=True,
+                                   text=True, check=True, cwd=os.path.dirname(__file__)).stdout)
+    assert len(salidas) == 1
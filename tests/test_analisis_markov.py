@@ -0,0 +1,51 @@
+import pytest
+
+from analisis_markov import absorcion, finales_improbables, probabilidades_finales, probabilidades_por_campana
+from conftest import nodo, opcion
+from grafo_historia import GrafoHistoria
+
+
+def test_probabilidades_exactas_con_ciclo(historia_pequena):
+    probabilidades = probabilidades_finales(GrafoHistoria(historia_pequena), "jason_normal_inicio")
+    assert probabilidades["final_a"] == pytest.approx(5 / 12)
+    assert probabilidades["final_b"] == pytest.approx(1 / 3)
+    assert sum(probabilidades.values()) == pytest.approx(1.0)
+
+
+def test_los_callejones_llevan_prefijo(historia_pequena):
+    grafo = GrafoHistoria(historia_pequena)
+    probabilidades = probabilidades_finales(grafo, "jason_normal_inicio")
+    assert probabilidades["callejon:callejon"] == pytest.approx(1 / 4)
+    assert absorcion(grafo)[grafo.indice["final_a"]] == {"final_a": 1.0}
+
+
+def test_destinos_faltantes_y_ciclos_cerrados(historia_pequena):
+    historia_pequena["izq"].opciones[1] = opcion("Saltar", "no_existe")
+    historia_pequena["bucle"].opciones[1] = opcion("Quedarse", "der")
+    historia_pequena["der"].opciones[0] = opcion("Quedarse", "bucle")
+    probabilidades = probabilidades_finales(GrafoHistoria(historia_pequena), "jason_normal_inicio")
+    assert probabilidades["faltante:no_existe"] == pytest.approx(1 / 4)
+    assert probabilidades["final_a"] == pytest.approx(1 / 4)
+    [ciclo] = [clave for clave in probabilidades if clave.startswith("ciclo:")]
+    assert probabilidades[ciclo] == pytest.approx(1 / 2)
+
+
+def test_pesos_por_nodo(historia_pequena):
+    grafo = GrafoHistoria(historia_pequena)
+    probabilidades = probabilidades_finales(grafo, "jason_normal_inicio",
+                                            pesos={"jason_normal_inicio": [0, 1], "der": [3, 1]})
+    # der: final_b con 3/4 y, por el bucle, vuelta a der con 1/8
+    assert probabilidades == pytest.approx({"final_b": 6 / 7, "final_a": 1 / 7})
+
+
+def test_finales_inalcanzables_e_improbables(historia_pequena):
+    historia_pequena["final_c"] = nodo("final_c", es_final=True)
+    historia_pequena["raro"] = nodo("raro", *[opcion(str(k), "final_b") for k in range(999)],
+                                    opcion("Suerte", "final_d"))
+    historia_pequena["final_d"] = nodo("final_d", es_final=True)
+    historia_pequena["izq"].opciones[1] = opcion("Esperar", "raro")
+    grafo = GrafoHistoria(historia_pequena)
+    assert list(probabilidades_por_campana(grafo)) == [("jason", "normal")]
+    inalcanzables, raros = finales_improbables(grafo, umbral=1e-3)
+    assert inalcanzables == ["final_c"]
+    assert raros == {"final_d": pytest.approx(0.25 / 1000)}
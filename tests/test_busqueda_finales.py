@@ -0,0 +1,41 @@
+import pytest
+
+from busqueda_finales import buscar, describir, resolver_final
+from conftest import nodo, opcion
+from grafo_historia import GrafoHistoria
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_caminos_hacia_un_final(historia_pequena):
+    grafo = GrafoHistoria(historia_pequena)
+    resultado = buscar(grafo, "final_a", k=3)
+    campana = resultado["campanas"][("jason", "normal")]
+    assert describir(grafo, campana["mas_corto"]) == [f"{RAIZ}: «Izquierda»", "izq: «Seguir»"]
+    probabilidades = [p for p, _ in campana["mas_probables"]]
+    assert probabilidades == pytest.approx([1 / 4, 1 / 8, 1 / 32])
+    # El tercero da una vuelta al ciclo der -> bucle -> der
+    assert [grafo.ids[u] for u, _ in campana["mas_probables"][2][1]] == [RAIZ, "der", "bucle", "der", "bucle"]
+
+
+def test_pesos(historia_pequena):
+    grafo = GrafoHistoria(historia_pequena)
+    resultado = buscar(grafo, "al_b", k=1, pesos={RAIZ: [0, 1], "der": [1, 3]})
+    assert resultado["final"] == "final_b"
+    [(p, _)] = resultado["campanas"][("jason", "normal")]["mas_probables"]
+    assert p == pytest.approx(1 / 4)
+
+
+def test_final_que_ninguna_campana_alcanza(historia_pequena):
+    historia_pequena["huerfano"] = nodo("huerfano", opcion("Ir", "final_c"))
+    historia_pequena["final_c"] = nodo("final_c", es_final=True)
+    resultado = buscar(GrafoHistoria(historia_pequena), "final_c")
+    assert resultado["campanas"] == {}
+    assert resultado["origenes"] == ["huerfano"]
+
+
+def test_resolver_final(historia_pequena):
+    grafo = GrafoHistoria(historia_pequena)
+    assert resolver_final(grafo, "final_b") == "final_b"
+    with pytest.raises(ValueError, match="final_a"):
+        resolver_final(grafo, "final_z")
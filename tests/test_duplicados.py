@@ -0,0 +1,42 @@
+import random
+
+from duplicados import agrupar, clusters_descripciones, jaccard, normalizar, pares_similares, tejas
+from conftest import nodo
+
+TEXTO = ("La lluvia cae sobre Gotham mientras el murciélago vigila desde la gárgola. "
+         "Abajo, en el callejón, tres hombres descargan cajas de un camión sin matrícula.")
+
+
+def test_normalizar_quita_tildes_y_signos():
+    assert normalizar("¡Él llegó!  ¿Y ahora?") == "el llego y ahora"
+    assert tejas("Gárgola") == tejas("gargola")
+
+
+def test_jaccard():
+    assert jaccard({1, 2, 3}, {2, 3, 4}) == 0.5
+    assert jaccard(set(), set()) == 1.0
+
+
+def test_pares_similares_encuentra_los_casi_duplicados():
+    rng = random.Random(3)
+    palabras = "noche ciudad sombra capa puño grito sirena tejado puerto fábrica".split()
+    textos = {f"relleno_{i}": " ".join(rng.choice(palabras) for _ in range(30)) for i in range(40)}
+    textos["original"] = TEXTO
+    textos["copia"] = TEXTO.replace("tres hombres", "cuatro hombres")
+    pares = pares_similares(textos, umbral=0.7)
+    assert [(a, b) for a, b, _ in pares] == [("copia", "original")]
+    assert pares[0][2] == jaccard(tejas(textos["copia"]), tejas(TEXTO))
+
+
+def test_agrupar_une_pares_encadenados():
+    clusters = agrupar([("a", "b", 0.9), ("b", "c", 0.7), ("x", "y", 0.8)])
+    assert [c["nodos"] for c in clusters] == [["a", "b", "c"], ["x", "y"]]
+    assert clusters[0]["similitud_min"] == 0.7
+
+
+def test_clusters_descripciones(historia_pequena):
+    historia_pequena["izq"].descripcion = TEXTO
+    historia_pequena["der"].descripcion = TEXTO + " Nadie los ve."
+    historia_pequena["extra"] = nodo("extra")
+    [cluster] = clusters_descripciones(historia_pequena, umbral=0.8)
+    assert cluster["nodos"] == ["der", "izq"]
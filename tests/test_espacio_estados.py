@@ -0,0 +1,38 @@
+import math
+
+import pytest
+
+from analisis_markov import probabilidades_finales
+from espacio_estados import EspacioDemasiadoGrande, EspacioEstados
+from grafo_historia import GrafoHistoria
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_estados_y_caminos_sin_ciclos(historia_pequena):
+    historia_pequena["bucle"].opciones.pop(0)
+    espacio = EspacioEstados(GrafoHistoria(historia_pequena), RAIZ)
+    finales = espacio.finales()
+    assert finales["final_a"] == {"estados": 2, "caminos": 2, "probabilidad": pytest.approx(0.5)}
+    assert finales["final_b"] == {"estados": 1, "caminos": 1, "probabilidad": pytest.approx(0.25)}
+    assert finales["callejon:callejon"]["probabilidad"] == pytest.approx(0.25)
+    descritos = sorted((espacio.describir(e)["salud"], espacio.describir(e)["items"])
+                       for e in espacio.terminales() if espacio.nombre_terminal(e) == "final_a")
+    assert descritos == [(70, []), (100, ["llave"])]
+
+
+def test_probabilidades_con_ciclo_coinciden_con_markov(historia_pequena):
+    historia_pequena["bucle"].opciones[0]["cambio"] = 0
+    historia_pequena["izq"].opciones[1]["siguiente"] = "final_b"
+    grafo = GrafoHistoria(historia_pequena)
+    espacio = EspacioEstados(grafo, RAIZ)
+    exactas = probabilidades_finales(grafo, RAIZ)
+    assert {nombre: datos["probabilidad"] for nombre, datos in espacio.finales().items()} == pytest.approx(exactas)
+    assert math.isinf(espacio.finales()["final_b"]["caminos"])
+
+
+def test_ciclo_que_acumula_recursos_supera_el_limite(historia_pequena):
+    with pytest.raises(EspacioDemasiadoGrande) as error:
+        EspacioEstados(GrafoHistoria(historia_pequena), RAIZ, max_estados=500)
+    assert error.value.estados == 500
+    assert error.value.bytes_estimados > 0
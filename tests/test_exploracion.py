@@ -0,0 +1,36 @@
+from conftest import nodo, opcion
+from exploracion import explorar
+from juego_base import JuegoAventuraBase
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_la_exploracion_guiada_cubre_la_historia_pequena(historia_pequena):
+    cobertura = explorar(historia_pequena, RAIZ, 100, semilla=1)
+    assert cobertura.completa()
+    informe = cobertura.informe()
+    assert informe["cobertura_opciones"] == 1.0
+    assert informe["nodos"] == informe["nodos_alcanzables"] == 7
+    assert informe["sin_cubrir"] == []
+    # Cada partida cubre al menos una opción nueva hasta terminar
+    assert cobertura.partidas <= informe["opciones_alcanzables"]
+
+
+def test_faltantes_vistos(historia_pequena):
+    historia_pequena["izq"].opciones.append(opcion("Perderse", "no_existe"))
+    historia_pequena["solo"] = nodo("solo", opcion("Ir", "final_a"))
+    cobertura = explorar(historia_pequena, RAIZ, 100, semilla=2)
+    informe = cobertura.informe()
+    assert informe["faltantes"] == ["no_existe"]
+    assert informe["nodos_alcanzables"] == 7
+    assert informe["cobertura_historia_nodos"] < 1.0
+
+
+def test_la_guiada_cubre_mas_que_la_uniforme():
+    historia = JuegoAventuraBase().historia
+    raiz = "damian_dificil_inicio"
+    guiada = explorar(historia, raiz, 1000, semilla=1)
+    assert guiada.completa()
+    # Con las mismas partidas el juego uniforme no cubre más opciones
+    uniforme = explorar(historia, raiz, guiada.partidas, semilla=1, guiada=False)
+    assert len(uniforme.aristas_vistas) <= len(guiada.aristas_vistas)
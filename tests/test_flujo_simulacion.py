@@ -0,0 +1,89 @@
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+from flujo_simulacion import (ContadorFinales, Histograma, TopCaminos, Welford, agregadores_por_defecto,
+                              ejecutar, filtrar, fuente_partidas, resumir)
+from simulador import politica_uniforme, simular_partida
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_los_resumenes_coinciden_con_el_simulador(historia_pequena):
+    resumenes = list(resumir(fuente_partidas(historia_pequena, RAIZ, 200, random.Random(3))))
+    rng = random.Random(3)
+    for resumen in resumenes:
+        esperado = simular_partida(historia_pequena, RAIZ, politica_uniforme, rng)
+        camino = resumen.pop("camino")
+        assert resumen == esperado
+        assert camino[0] == RAIZ and len(camino) == resumen["pasos"] + 1
+
+
+def test_eventos_con_el_efecto_ya_aplicado(historia_pequena):
+    jugador = None
+    for evento in fuente_partidas(historia_pequena, RAIZ, 20, random.Random(1)):
+        if evento[0] == "inicio":
+            jugador = evento[2]
+        elif evento[0] == "eleccion":
+            consecuencia = evento[1]
+            assert consecuencia.opcion is historia_pequena[consecuencia.origen].opciones[consecuencia.indice]
+            assert (jugador.salud, jugador.reputacion, jugador.recursos) == consecuencia.despues
+            assert jugador.nodo_actual == consecuencia.siguiente
+
+
+def test_agregadores():
+    valores = [3, 1, 4, 1, 5, 9, 2, 6]
+    a, b = Welford("x"), Welford("x")
+    for x in valores[:3]:
+        a.agregar({"x": x})
+    for x in valores[3:]:
+        b.agregar({"x": x})
+    a.combinar(b)
+    resultado = a.resultado()
+    assert resultado["n"] == len(valores)
+    assert resultado["media"] == pytest.approx(statistics.mean(valores))
+    assert resultado["desviacion"] == pytest.approx(statistics.pstdev(valores))
+    assert (resultado["min"], resultado["max"]) == (1, 9)
+
+    histograma = Histograma("x", ancho=5)
+    finales = ContadorFinales()
+    for x in valores:
+        histograma.agregar({"x": x})
+        finales.agregar({"final": "par" if x % 2 == 0 else "impar"})
+    assert histograma.resultado() == {0: 5, 5: 3}
+    assert finales.resultado() == {"impar": 5, "par": 3}
+
+
+def test_top_caminos_exacto_con_capacidad_suficiente(historia_pequena):
+    resumenes = list(resumir(fuente_partidas(historia_pequena, RAIZ, 500, random.Random(7))))
+    exactas = Counter(r["camino"] for r in resumenes)
+    top = TopCaminos(k=3, capacidad=len(exactas))
+    for resumen in resumenes:
+        top.agregar(resumen)
+    assert [(camino, cuenta) for camino, cuenta, _ in top.resultado()] == [
+        (camino, cuenta) for camino, cuenta in exactas.most_common(3)]
+    assert all(error == 0 for _, _, error in top.resultado())
+
+
+def test_top_caminos_sustituye_el_menos_frecuente():
+    top = TopCaminos(k=2, capacidad=2)
+    for camino in ["a", "a", "a", "b", "b", "a", "c"]:
+        top.agregar({"camino": (camino,)})
+    # "c" sustituye a "b" (cuenta 2) y hereda su cuenta como error
+    assert top.resultado() == [(("a",), 4, 0), (("c",), 3, 2)]
+    top.agregar({"camino": ("d",)})
+    assert top.cuentas == {("a",): 4, ("d",): 4}
+    assert top.error[("d",)] == 3
+
+
+def test_ejecutar_con_etapas(historia_pequena):
+    agregadores = ejecutar(fuente_partidas(historia_pequena, RAIZ, 300, random.Random(5)),
+                           agregadores_por_defecto(top=2),
+                           etapas=[filtrar(lambda r: r["final"] != "callejon:callejon")])
+    finales = agregadores["finales"].resultado()
+    assert set(finales) == {"final_a", "final_b"}
+    assert agregadores["pasos"].n == sum(finales.values())
+    assert sum(agregadores["histograma_pasos"].resultado().values()) == agregadores["pasos"].n
+    assert len(agregadores["caminos"].resultado()) == 2
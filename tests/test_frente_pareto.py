@@ -0,0 +1,31 @@
+import math
+
+from frente_pareto import en_frente, fronteras, fronteras_por_campana, podar
+from grafo_historia import GrafoHistoria
+
+
+def test_podar_quita_los_dominados():
+    assert podar([(50, 50, 3), (60, 50, 3), (40, 90, 1), (40, 80, 1)]) == [(60, 50, 3), (40, 90, 1)]
+    assert podar([(50, 50, 3), (60, 50, 3)], "min") == [(50, 50, 3)]
+
+
+def test_frentes_con_recursos_no_acotados(historia_pequena):
+    frentes = fronteras(GrafoHistoria(historia_pequena), "jason_normal_inicio")
+    # El bucle suma recursos sin límite, así que el frente los lleva a infinito
+    assert frentes == {"final_a": [(100, 70, math.inf)], "final_b": [(90, 75, math.inf)]}
+
+
+def test_frentes_minimos(historia_pequena):
+    frentes = fronteras(GrafoHistoria(historia_pequena), "jason_normal_inicio", "min")
+    assert sorted(frentes["final_a"]) == [(70, 50, 5), (100, 70, 3)]
+    assert frentes["final_b"] == [(90, 75, 3)]
+
+
+def test_en_frente(historia_pequena):
+    historia_pequena["bucle"].opciones[0]["cambio"] = 0
+    grafo = GrafoHistoria(historia_pequena)
+    frente = fronteras_por_campana(grafo)[("jason", "normal")]["final_a"]
+    assert frente == [(100, 70, 3), (70, 50, 5)]
+    assert en_frente((100, 70, 3), frente)
+    assert not en_frente((70, 50, 3), frente)
+    assert en_frente((80, 60, 4), frente)
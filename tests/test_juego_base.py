@@ -0,0 +1,304 @@
+import json
+import random
+
+import pytest
+
+from grafo_historia import indice_item
+from juego_base import (SIN_OPCION, CambioNodo, CambioStat, ColaEventos, ItemAgregado, ItemQuitado,
+                        JuegoAventuraBase, Jugador, avanzar)
+
+
+@pytest.fixture(scope="module")
+def juego():
+    return JuegoAventuraBase()
+
+
+@pytest.fixture
+def juego_nuevo():
+    """Juego con su propia historia, para las pruebas que la editan"""
+    return JuegoAventuraBase()
+
+
+def aplicar_por_diccionario(jugador: Jugador, opcion: dict):
+    """Aplicación de efectos de la opción campo a campo (referencia)"""
+    if opcion.get("stat"):
+        jugador.modificar_stat(opcion["stat"], opcion.get("cambio", 0))
+    if opcion.get("stat2"):
+        jugador.modificar_stat(opcion["stat2"], opcion.get("cambio2", 0))
+    if opcion.get("item"):
+        jugador.agregar_item(opcion["item"])
+
+
+def jugar(juego: JuegoAventuraBase, personaje: str, dificultad: str, semilla: int, max_pasos: int = 60) -> int:
+    """Jugar al azar desde el inicio de una campaña; devuelve las elecciones hechas"""
+    rng = random.Random(semilla)
+    juego.iniciar(personaje, dificultad)
+    pasos = 0
+    while not juego.terminada() and pasos < max_pasos:
+        juego.elegir(rng.randrange(len(juego.opciones())))
+        pasos += 1
+    return pasos
+
+
+def stats(jugador: Jugador) -> tuple:
+    return jugador.salud, jugador.reputacion, jugador.recursos
+
+
+def estado(jugador: Jugador) -> tuple:
+    return jugador.clave_estado(), jugador.inventario, jugador.decisiones
+
+
+# ------------------- Efectos (avanzar / Jugador.ejecutar) -------------------
+def test_avanzar_aplica_los_mismos_efectos_que_el_diccionario(juego):
+    rng = random.Random(1)
+    for nodo_id, nodo in juego.historia.items():
+        for k, opcion in enumerate(nodo.opciones):
+            inicial = (rng.randint(0, 100), rng.randint(0, 100), rng.randint(0, 30))
+            referencia, motor = Jugador("referencia"), Jugador("motor")
+            for jugador in (referencia, motor):
+                jugador.salud, jugador.reputacion, jugador.recursos = inicial
+                jugador.nodo_actual = nodo_id
+            aplicar_por_diccionario(referencia, opcion)
+            consecuencia = avanzar(motor, k, opcion)
+            assert stats(motor) == stats(referencia), (nodo_id, k)
+            assert motor.inventario == referencia.inventario, (nodo_id, k)
+            assert motor.nodo_actual == opcion["siguiente"]
+            assert motor.decisiones == [{"nodo": nodo_id, "eleccion": opcion["texto"]}]
+            assert consecuencia.despues == tuple(motor.stats)
+            assert consecuencia.cambios == {stat: b - a for stat, a, b in
+                                            zip(("salud", "reputacion", "recursos"), inicial, stats(motor))
+                                            if a != b}
+
+
+def test_los_limites_de_las_estadisticas_se_respetan():
+    jugador = Jugador("limites")
+    jugador.salud, jugador.reputacion, jugador.recursos = 80, 30, 5
+    jugador.ejecutar((((0, 50, 0, 100), (1, -80, 0, 100), (2, -10, 0, 2 ** 62)), indice_item("llave")))
+    assert jugador.stats == [100, 0, 0]
+    assert jugador.inventario == ["llave"]
+
+
+def test_editar_una_opcion_cambia_el_efecto_aplicado(juego_nuevo):
+    nodo, k, opcion = next((nodo, k, opcion) for nodo in juego_nuevo.historia.values()
+                           for k, opcion in enumerate(nodo.opciones) if opcion.get("stat") == "reputacion")
+    jugador = Jugador("edición")
+    jugador.nodo_actual = nodo.id
+    avanzar(jugador, k, opcion)
+    opcion["cambio"] = -40
+    jugador.reputacion = 50
+    consecuencia = avanzar(jugador, k, opcion)
+    assert jugador.reputacion == 10
+    assert consecuencia.mensajes()[0] == "Reputacion: -40"
+
+
+def test_consecuencia_y_mensajes():
+    jugador = Jugador("mensajes")
+    jugador.nodo_actual = "a"
+    jugador.salud = 95
+    opcion = {"texto": "Ir", "siguiente": "b", "stat": "salud", "cambio": 10,
+              "stat2": "recursos", "cambio2": -1, "item": "llave"}
+    consecuencia = avanzar(jugador, 2, opcion)
+    assert (consecuencia.origen, consecuencia.indice, consecuencia.siguiente) == ("a", 2, "b")
+    # Los efectos son los declarados; los cambios, los reales tras los límites
+    assert consecuencia.efectos == [("salud", 10), ("recursos", -1)]
+    assert consecuencia.cambios == {"salud": 5, "recursos": -1}
+    assert consecuencia.mensajes() == ["Salud: +10", "Recursos: -1", "Obtenido: llave"]
+    # Un item que ya se tenía no se anuncia otra vez
+    jugador.nodo_actual = "a"
+    assert avanzar(jugador, 2, opcion).mensajes() == ["Salud: +10", "Recursos: -1"]
+
+
+def test_inventario_como_mascara_de_bits():
+    jugador = Jugador("items")
+    for item in ["mapa", "llave", "mapa", "linterna"]:
+        jugador.agregar_item(item)
+    assert jugador.inventario == ["mapa", "llave", "linterna"]
+    assert jugador.num_items == 3
+    assert jugador.tiene_item("llave") and not jugador.tiene_item("no_existe")
+    assert jugador.clave_estado()[2] == sum(1 << indice_item(i) for i in ["mapa", "llave", "linterna"])
+    jugador.truncar_inventario(1)
+    assert jugador.inventario == ["mapa"]
+    assert not jugador.tiene_item("llave")
+    assert jugador.clave_estado()[2] == 1 << indice_item("mapa")
+
+
+# ------------------- Motor sin interfaz -------------------
+def test_iniciar_y_elegir(juego):
+    nodo = juego.iniciar("jason", "dificil")
+    assert nodo.id == juego.jugador.nodo_actual == "jason_dificil_inicio"
+    assert juego.opciones() == nodo.opciones
+    consecuencia = juego.elegir(0)
+    assert consecuencia.origen == "jason_dificil_inicio"
+    assert juego.jugador.nodo_actual == nodo.opciones[0]["siguiente"]
+    with pytest.raises(IndexError):
+        juego.elegir(len(juego.opciones()))
+    assert juego.iniciar("nadie", "normal") is None
+    assert juego.terminada()
+
+
+# ------------------- Deshacer / rehacer -------------------
+@pytest.mark.parametrize("personaje, dificultad", [("jason", "dificil"), ("damian", "dificil"), ("tim", "normal")])
+def test_deshacer_y_rehacer_restauran_el_mismo_estado(juego_nuevo, personaje, dificultad):
+    rng = random.Random(7)
+    juego_nuevo.iniciar(personaje, dificultad)
+    estados = [estado(juego_nuevo.jugador)]
+    while not juego_nuevo.terminada() and len(estados) < 40:
+        juego_nuevo.elegir(rng.randrange(len(juego_nuevo.opciones())))
+        estados.append(estado(juego_nuevo.jugador))
+
+    for atras in range(len(estados) - 1, -1, -1):
+        assert estado(juego_nuevo.jugador) == estados[atras]
+        assert juego_nuevo.deshacer() == (1 if atras else 0)
+    assert not juego_nuevo.puede_deshacer()
+    for adelante in range(1, len(estados)):
+        assert juego_nuevo.rehacer() == 1
+        assert estado(juego_nuevo.jugador) == estados[adelante]
+    assert not juego_nuevo.puede_rehacer()
+
+
+def test_elegir_tras_deshacer_abre_otra_rama(juego_nuevo):
+    juego_nuevo.iniciar("jason", "dificil")
+    juego_nuevo.elegir(0)
+    juego_nuevo.elegir(0)
+    juego_nuevo.deshacer()
+    juego_nuevo.elegir(1)
+    assert not juego_nuevo.puede_rehacer()
+    assert len(juego_nuevo.jugador.decisiones) == 2
+
+
+def test_deshacer_tras_cargar_se_detiene_en_la_partida_cargada(juego_nuevo, tmp_path):
+    jugar(juego_nuevo, "tim", "normal", semilla=2, max_pasos=5)
+    ruta = str(tmp_path / "partida.json")
+    juego_nuevo.guardar_partida(ruta)
+    cargado = estado(juego_nuevo.jugador)
+
+    otro = JuegoAventuraBase()
+    assert otro.cargar_partida(ruta)
+    assert not otro.puede_deshacer()
+    assert otro.deshacer() == 0
+    otro.elegir(0)
+    otro.elegir(0)
+    # Se deshacen las dos elecciones nuevas, no las que venían en la partida
+    assert otro.deshacer(10) == 2
+    assert estado(otro.jugador) == cargado
+    assert otro.deshacer() == 0
+    assert otro.rehacer(10) == 2
+    assert otro.jugador.num_decisiones == len(cargado[2]) + 2
+
+
+# ------------------- Guardar / cargar -------------------
+@pytest.mark.parametrize("compacto", [True, False])
+def test_guardar_y_cargar_conserva_la_partida(juego_nuevo, tmp_path, compacto):
+    jugar(juego_nuevo, "jason", "dificil", semilla=3)
+    original = juego_nuevo.jugador
+    ruta = tmp_path / "partida.json"
+    ruta.write_text(json.dumps({"jugador": original.a_dict(compacto)}), encoding="utf-8")
+
+    otro = JuegoAventuraBase()
+    assert otro.cargar_partida(str(ruta))
+    assert estado(otro.jugador) == estado(original)
+    assert otro.jugador.a_dict(compacto) == original.a_dict(compacto)
+
+
+def test_guardar_partida_usa_el_formato_compacto(juego_nuevo, tmp_path):
+    jugar(juego_nuevo, "tim", "dificil", semilla=5)
+    ruta = str(tmp_path / "partida.json")
+    assert juego_nuevo.guardar_partida(ruta)
+    with open(ruta, encoding="utf-8") as f:
+        assert "registro" in json.load(f)["jugador"]
+    decisiones = juego_nuevo.jugador.decisiones
+    assert juego_nuevo.cargar_partida(ruta)
+    assert juego_nuevo.jugador.decisiones == decisiones
+
+
+def test_cargar_con_un_nodo_eliminado_conserva_el_texto(juego_nuevo, tmp_path):
+    jugar(juego_nuevo, "jason", "dificil", semilla=3)
+    decisiones = juego_nuevo.jugador.decisiones
+    ruta = str(tmp_path / "partida.json")
+    juego_nuevo.guardar_partida(ruta)
+
+    del juego_nuevo.historia[decisiones[1]["nodo"]]
+    assert juego_nuevo.cargar_partida(ruta)
+    assert juego_nuevo.jugador.decisiones == decisiones
+    assert juego_nuevo.jugador.decision(1)[1] == SIN_OPCION
+    # Volver a guardar y cargar tampoco falla
+    juego_nuevo.guardar_partida(ruta)
+    assert juego_nuevo.cargar_partida(ruta)
+    assert juego_nuevo.jugador.decisiones == decisiones
+
+
+def test_cargar_con_opciones_reordenadas_conserva_el_texto(juego_nuevo, tmp_path):
+    jugar(juego_nuevo, "jason", "dificil", semilla=3)
+    decisiones = juego_nuevo.jugador.decisiones
+    ruta = str(tmp_path / "partida.json")
+    juego_nuevo.guardar_partida(ruta)
+
+    nodo = juego_nuevo.historia[decisiones[0]["nodo"]]
+    nodo.opciones.reverse()
+    assert juego_nuevo.cargar_partida(ruta)
+    assert juego_nuevo.jugador.decisiones == decisiones
+    _, indice, texto = juego_nuevo.jugador.decision(0)
+    assert nodo.opciones[indice]["texto"] == texto
+
+
+def test_cada_historia_tiene_su_tabla_de_decisiones(tmp_path):
+    a, b = JuegoAventuraBase(), JuegoAventuraBase()
+    jugar(a, "jason", "dificil", semilla=3)
+    decisiones = a.jugador.decisiones
+    ruta = str(tmp_path / "partida.json")
+    a.guardar_partida(ruta)
+
+    # La misma partida cargada en una historia con las opciones reordenadas
+    b.historia[decisiones[0]["nodo"]].opciones.reverse()
+    assert b.cargar_partida(ruta)
+    assert b.jugador.decisiones == decisiones
+    assert b.jugador.decision(0)[1] != a.jugador.decision(0)[1]
+    assert a.jugador.decision(0)[2] == b.jugador.decision(0)[2]
+    # Los jugadores de una misma historia comparten la tabla
+    primero = a.jugador
+    jugar(a, "jason", "dificil", semilla=3)
+    assert a.jugador.decision_codificada(0) == primero.decision_codificada(0)
+
+
+# ------------------- Eventos de cambio -------------------
+def test_eventos_del_jugador():
+    jugador = Jugador("eventos")
+    recibidos = []
+    cancelar = jugador.suscribir(recibidos.append)
+    jugador.salud = 90
+    jugador.agregar_item("llave")
+    assert [type(e) for lote in recibidos for e in lote] == [CambioStat, ItemAgregado]
+
+    recibidos.clear()
+    with jugador.agrupar():
+        jugador.salud = 80
+        jugador.salud = 70
+        jugador.nodo_actual = "a"
+        jugador.nodo_actual = "b"
+        jugador.reputacion = jugador.reputacion
+        jugador.truncar_inventario(0)
+    [lote] = recibidos
+    assert [(type(e), getattr(e, "antes", None), getattr(e, "despues", None)) for e in lote] == [
+        (CambioStat, 90, 70), (CambioNodo, "inicio", "b"), (ItemQuitado, None, None)]
+
+    cancelar()
+    recibidos.clear()
+    jugador.salud = 10
+    assert recibidos == []
+
+
+def test_cola_de_eventos_entrega_una_tanda_por_fotograma(juego_nuevo):
+    programadas = []
+    cola = ColaEventos(programadas.append)
+    recibidos = []
+    cola.suscribir(recibidos.append)
+    juego_nuevo.iniciar("jason", "dificil")
+    juego_nuevo.jugador.suscribir(cola)
+    juego_nuevo.elegir(0)
+    juego_nuevo.elegir(0)
+    juego_nuevo.deshacer()
+    assert len(programadas) == 1 and recibidos == []
+    programadas.pop()()
+    [lote] = recibidos
+    cambios_nodo = [e for e in lote if isinstance(e, CambioNodo)]
+    assert [(e.antes, e.despues) for e in cambios_nodo] == [("jason_dificil_inicio", juego_nuevo.jugador.nodo_actual)]
@@ -0,0 +1,73 @@
+import math
+import random
+
+import pytest
+
+from grafo_historia import GrafoHistoria
+from juego_base import Jugador
+from politica_optima import PoliticaOptima, SolucionOptima, cubeta, objetivo, representante
+
+RAIZ = "jason_normal_inicio"
+
+
+def resolver(historia, nombre: str, **kwargs) -> SolucionOptima:
+    grafo = GrafoHistoria(historia)
+    return SolucionOptima(grafo, [RAIZ], objetivo(nombre, grafo), **kwargs)
+
+
+def test_cubetas():
+    assert cubeta((0, 55, 7), ancho=10) == (0, 6, 7)
+    assert cubeta((100, 1, 7), ancho=10, tope_recursos=5) == (10, 1, 5)
+    assert representante((6, 0, 7), ancho=10) == (56, 0, 7)
+
+
+def test_maximizar_una_estadistica(historia_pequena):
+    solucion = resolver(historia_pequena, "salud")
+    assert solucion.valor_desde(RAIZ) == 100
+    assert [(paso["nodo"], paso["opcion"]) for paso in solucion.camino(RAIZ)] == [
+        (RAIZ, 1), ("der", 1), ("bucle", 1)]
+    assert resolver(historia_pequena, "reputacion").valor_desde(RAIZ) == 75
+
+
+def test_recursos_no_acotados_por_un_ciclo(historia_pequena):
+    solucion = resolver(historia_pequena, "recursos")
+    assert math.isinf(solucion.valor_desde(RAIZ))
+    assert not solucion.saturado()
+    assert resolver(historia_pequena, "recursos", tope_recursos=4).saturado()
+
+
+def test_objetivo_final(historia_pequena):
+    solucion = resolver(historia_pequena, "final:final_b")
+    assert solucion.valor_desde(RAIZ) == 1.0
+    assert solucion.camino(RAIZ)[-1]["siguiente"] == "final_b"
+    # Un sufijo único también vale
+    assert resolver(historia_pequena, "final:al_b").valor_desde(RAIZ) == 1.0
+
+
+@pytest.mark.parametrize("nombre", ["final:no_existe", "final:callejon", "suerte"])
+def test_objetivos_invalidos(historia_pequena, nombre):
+    with pytest.raises(ValueError):
+        objetivo(nombre, GrafoHistoria(historia_pequena))
+
+
+def test_supervivencia(historia_pequena):
+    historia_pequena["izq"].opciones[0]["cambio"] = 0
+    historia_pequena["der"].opciones[0]["cambio"] = -100
+    historia_pequena["bucle"].opciones.pop()
+    solucion = resolver(historia_pequena, "supervivencia")
+    assert solucion.valor_desde(RAIZ) == 1.0
+    assert solucion.camino(RAIZ)[0]["opcion"] == 0
+
+
+def test_politica_optima_en_el_simulador(historia_pequena):
+    solucion = resolver(historia_pequena, "salud")
+    politica = PoliticaOptima(solucion.tabla(), solucion.ancho, solucion.tope_recursos)
+    copia = PoliticaOptima.desde_dict(politica.a_dict())
+    assert copia.tabla == politica.tabla
+    assert copia.identidad() == politica.identidad()
+    assert politica.elegir(RAIZ, (100, 50, 3), 2) == 1
+    assert politica.elegir("final_a", (100, 50, 3), 0) is None
+
+    jugador = Jugador("Óptimo")
+    jugador.nodo_actual = RAIZ
+    assert politica(historia_pequena[RAIZ], jugador, random.Random(1)) == 1
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from juego_base import JuegoAventuraBase
+from regresion import comprobar, compactar, expandir, grabar
+
+
+@pytest.fixture
+def historia():
+    return JuegoAventuraBase().historia
+
+
+@pytest.fixture
+def referencias(historia):
+    return expandir(json.loads(json.dumps(compactar(grabar(historia, 5)))))
+
+
+def opcion_jugada(referencias, paso_minimo: int = 1):
+    """Primera (id de nodo, opción) elegida en alguna partida con al menos ``paso_minimo`` pasos antes"""
+    for referencia in referencias:
+        if len(referencia["pasos"]) > paso_minimo:
+            return referencia["pasos"][paso_minimo][:2]
+    raise AssertionError("sin partidas largas")
+
+
+def test_sin_cambios(historia, referencias):
+    assert len(referencias) == 5 * 12
+    assert comprobar(historia, referencias) == []
+
+
+def test_destino_cambiado(historia, referencias):
+    nodo_id, k = opcion_jugada(referencias)
+    historia[nodo_id].opciones[k]["siguiente"] = nodo_id
+    diferencias = comprobar(historia, referencias)
+    assert diferencias
+    assert {d["tipo"] for d in diferencias if d["nodo"] == nodo_id} == {"destino cambiado"}
+
+
+def test_efecto_recortado_tambien_se_detecta(historia, referencias):
+    # Una opción que sube la salud cuando ya está a 100: el cambio no se ve en las estadísticas
+    nodo_id, k = next(paso[:2] for referencia in referencias for paso in referencia["pasos"]
+                      if historia[paso[0]].opciones[paso[1]].get("stat") == "salud"
+                      and historia[paso[0]].opciones[paso[1]]["cambio"] > 0 and paso[4] == 100)
+    historia[nodo_id].opciones[k]["cambio"] += 10
+    diferencias = [d for d in comprobar(historia, referencias) if d["nodo"] == nodo_id]
+    assert diferencias
+    assert {d["tipo"] for d in diferencias} == {"efectos cambiados"}
+
+
+def test_opciones_y_campanas(historia, referencias):
+    nodo_id, _ = opcion_jugada(referencias, paso_minimo=0)
+    historia[nodo_id].opciones.append(dict(historia[nodo_id].opciones[0]))
+    assert {d["tipo"] for d in comprobar(historia, referencias) if d["nodo"] == nodo_id} == {
+        "número de opciones cambiado"}
+    del historia[referencias[0]["raiz"]]
+    assert "campaña eliminada" in {d["tipo"] for d in comprobar(historia, referencias)}
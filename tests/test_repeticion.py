@@ -0,0 +1,106 @@
+import json
+import os
+import random
+
+import pytest
+
+from juego_base import JuegoAventuraBase, Jugador, avanzar
+from repeticion import repetir, repetir_lote
+
+RAIZ = "tim_normal_inicio"
+PARTIDA_GUARDADA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "partida_guardada.json")
+
+
+@pytest.fixture
+def historia():
+    return JuegoAventuraBase().historia
+
+
+def partida(historia, semilla: int, pasos: int = 8) -> dict:
+    """Partida guardada en el formato antiguo tras ``pasos`` elecciones al azar"""
+    rng = random.Random(semilla)
+    jugador = Jugador("Repetición")
+    jugador.nodo_actual = RAIZ
+    for _ in range(pasos):
+        nodo = historia[jugador.nodo_actual]
+        if nodo.es_final or not nodo.opciones:
+            break
+        k = rng.randrange(len(nodo.opciones))
+        avanzar(jugador, k, nodo.opciones[k])
+    return {"jugador": jugador.a_dict(compacto=False), "personaje": "tim", "dificultad": "normal"}
+
+
+def test_la_partida_guardada_del_repositorio_se_repite(historia):
+    with open(PARTIDA_GUARDADA, encoding="utf-8") as f:
+        informe = repetir(historia, json.load(f))
+    assert informe["ok"], informe
+    assert informe["pasos"] == 9
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_una_partida_jugada_se_repite(historia, semilla):
+    datos = partida(historia, semilla)
+    informe = repetir(historia, datos)
+    assert informe["ok"], informe
+    assert informe["pasos"] == len(datos["jugador"]["decisiones"])
+    assert informe["nodo_final"] == datos["jugador"]["nodo_actual"]
+
+
+def test_destino_cambiado_diverge(historia):
+    datos = partida(historia, 1)
+    decision = datos["jugador"]["decisiones"][2]
+    nodo = historia[decision["nodo"]]
+    opcion = next(o for o in nodo.opciones if o["texto"] == decision["eleccion"])
+    opcion["siguiente"] = RAIZ
+    informe = repetir(historia, datos)
+    assert not informe["ok"]
+    assert informe["divergencia"]["paso"] == 3
+    assert informe["divergencia"]["motivo"] == "nodo distinto"
+
+
+def test_opcion_eliminada_y_efectos_cambiados(historia):
+    datos = partida(historia, 2)
+    decision = datos["jugador"]["decisiones"][0]
+    nodo = historia[decision["nodo"]]
+    k = next(k for k, o in enumerate(nodo.opciones) if o["texto"] == decision["eleccion"])
+    nodo.opciones[k]["stat2"], nodo.opciones[k]["cambio2"] = "recursos", 50
+    informe = repetir(historia, datos)
+    assert informe["divergencia"] is None
+    guardados, repetidos = informe["diferencias"]["recursos"]
+    assert repetidos > guardados
+    assert not informe["ok"]
+
+    nodo.opciones[k]["texto"] = "Otra cosa"
+    informe = repetir(historia, datos)
+    assert informe["divergencia"]["motivo"] == "opción inexistente"
+    assert informe["divergencia"]["paso"] == 0
+
+
+def test_parte_de_la_raiz_de_la_campana(historia):
+    datos = partida(historia, 3)
+    del datos["jugador"]["decisiones"][0]
+    informe = repetir(historia, datos)
+    assert informe["divergencia"]["paso"] == 0
+    assert informe["divergencia"]["nodo_real"] == RAIZ
+
+
+def test_partida_sin_decisiones(historia):
+    jugador = Jugador("Nuevo")
+    jugador.nodo_actual = RAIZ
+    datos = {"jugador": jugador.a_dict(compacto=False), "personaje": "tim", "dificultad": "normal"}
+    assert repetir(historia, datos)["ok"]
+    datos["jugador"]["nodo_actual"] = "tim_normal_llamada"
+    assert repetir(historia, datos)["divergencia"]["motivo"] == "nodo final distinto"
+
+
+def test_repetir_lote(historia, tmp_path):
+    rutas = []
+    for semilla in range(4):
+        ruta = tmp_path / f"partida_{semilla}.json"
+        ruta.write_text(json.dumps(partida(historia, semilla)), encoding="utf-8")
+        rutas.append(str(ruta))
+    (tmp_path / "rota.json").write_text("{", encoding="utf-8")
+    rutas.append(str(tmp_path / "rota.json"))
+    informes = repetir_lote(rutas, historia, procesos=2)
+    assert [informe["ok"] for informe in informes] == [True, True, True, True, False]
+    assert informes[-1]["divergencia"]["motivo"].startswith("archivo ilegible")
@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from analisis_markov import probabilidades_finales
+from conftest import opcion
+from grafo_historia import GrafoHistoria
+from sensibilidad import AnalisisSensibilidad
+
+RAIZ = "jason_normal_inicio"
+
+
+def cambio_recalculado(historia, nodo_id: str, indice: int, factor: float) -> dict:
+    """Diferencia de probabilidades resolviendo la cadena entera con el peso cambiado"""
+    grafo = GrafoHistoria(historia)
+    pesos = [1.0] * len(historia[nodo_id].opciones)
+    pesos[indice] *= factor
+    antes = probabilidades_finales(grafo, RAIZ)
+    despues = probabilidades_finales(grafo, RAIZ, pesos={nodo_id: pesos})
+    cambios = {clave: despues.get(clave, 0.0) - antes.get(clave, 0.0) for clave in set(antes) | set(despues)}
+    return {clave: valor for clave, valor in cambios.items() if abs(valor) > 1e-12}
+
+
+@pytest.mark.parametrize("nodo_id, indice, factor", [
+    ("jason_normal_inicio", 0, 3.0), ("der", 1, 2.0), ("bucle", 0, 0.0), ("der", 0, 0.0), ("izq", 1, 0.5)])
+def test_sensibilidad_peso_coincide_con_recalcular(historia_pequena, nodo_id, indice, factor):
+    analisis = AnalisisSensibilidad(historia_pequena)
+    cambios = analisis.sensibilidad_peso(nodo_id, indice, factor).get(("jason", "normal"), {})
+    esperado = cambio_recalculado(historia_pequena, nodo_id, indice, factor)
+    assert set(cambios) == set(esperado)
+    for clave, valor in esperado.items():
+        assert cambios[clave] == pytest.approx(valor)
+
+
+def test_quitar_la_unica_salida_de_un_ciclo(historia_pequena):
+    historia_pequena["der"].opciones[0] = opcion("Quedarse", "bucle")
+    analisis = AnalisisSensibilidad(historia_pequena)
+    cambios = analisis.sensibilidad_peso("bucle", 1, 0.0)[("jason", "normal")]
+    [ciclo] = [clave for clave in cambios if clave.startswith("ciclo:")]
+    assert cambios == pytest.approx({"final_a": -0.5, ciclo: 0.5})
+
+
+def test_quitar_la_unica_opcion_es_un_error(historia_pequena):
+    historia_pequena["izq"].opciones.pop()
+    with pytest.raises(ValueError):
+        AnalisisSensibilidad(historia_pequena).sensibilidad_peso("izq", 0, 0.0)
+
+
+def test_sensibilidad_cambio(historia_pequena):
+    analisis = AnalisisSensibilidad(historia_pequena)
+    assert analisis.sensibilidad_cambio("der", 0, 10) == {"final_b": {"salud": (10, 10)}}
+    assert analisis.sensibilidad_cambio("der", 0, 10, segundo=True) == {"final_b": {"reputacion": (10, 10)}}
+    assert analisis.sensibilidad_cambio("izq", 1) == {}
+    # La edición se deshace
+    assert historia_pequena["der"].opciones[0]["cambio"] == -10
+    assert analisis.incremental.intervalos("final_b")["salud"] == (90, 90)
+
+
+def test_sensibilidad_cambio_con_recursos_no_acotados(historia_pequena):
+    historia_pequena["der"].opciones[0] = opcion("Terminar", "final_b", "recursos", 1)
+    analisis = AnalisisSensibilidad(historia_pequena)
+    assert analisis.incremental.intervalos("final_b")["recursos"] == (4, math.inf)
+    # El máximo sigue siendo infinito: no se desplaza (y no sale nan)
+    assert analisis.sensibilidad_cambio("der", 0, 5) == {"final_b": {"recursos": (5, 0)}}
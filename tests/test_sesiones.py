@@ -0,0 +1,66 @@
+import pytest
+
+from sesiones import RegistroSesiones, memoria_objeto
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_crear_obtener_y_cerrar(historia_pequena):
+    registro = RegistroSesiones(historia_pequena)
+    a = registro.crear("jason", "normal", "Ana")
+    b = registro.crear("jason", "normal", "Beto")
+    assert len(registro) == 2 and a.id != b.id
+    assert registro.obtener(a.id) is a
+    assert a.jugador.nodo_actual == RAIZ
+
+    a.elegir(1)
+    b.elegir(0)
+    assert (a.jugador.nodo_actual, b.jugador.nodo_actual) == ("der", "izq")
+    assert a.jugador.inventario == ["llave"] and b.jugador.inventario == []
+    assert a.deshacer() == 1 and a.jugador.nodo_actual == RAIZ
+
+    assert registro.cerrar(a.id)
+    assert not registro.cerrar(a.id)
+    assert a.id not in registro
+    with pytest.raises(KeyError):
+        registro.obtener(a.id)
+    with pytest.raises(ValueError):
+        registro.crear("nadie", "normal")
+
+
+def test_la_historia_es_de_solo_lectura_y_compartida(historia_pequena):
+    registro = RegistroSesiones(historia_pequena)
+    a = registro.crear("jason", "normal")
+    b = registro.crear("jason", "normal")
+    assert a.historia is b.historia is registro.historia
+    with pytest.raises(TypeError):
+        registro.historia["otro"] = None
+    # Misma decisión en dos sesiones: mismo código en la tabla compartida
+    a.elegir(0)
+    b.elegir(0)
+    assert a.jugador.decision_codificada(0) == b.jugador.decision_codificada(0)
+    assert len(registro.tabla_decisiones) == 1
+
+
+def test_caducar(historia_pequena):
+    registro = RegistroSesiones(historia_pequena)
+    vieja = registro.crear("jason", "normal")
+    nueva = registro.crear("jason", "normal")
+    vieja.ultimo_uso -= 100
+    assert registro.caducar(inactividad=50) == 1
+    assert list(registro.sesiones) == [nueva.id]
+
+
+def test_memoria_sin_la_historia(historia_pequena):
+    registros = [RegistroSesiones(historia_pequena, historial=h) for h in (True, False)]
+    sesiones = [registro.crear("jason", "normal") for registro in registros]
+    for sesion in sesiones:
+        sesion.elegir(1)
+        sesion.elegir(1)
+    assert sesiones[1].instantanea is None
+    con_historial, sin_historial = (r.memoria_sesion(s) for r, s in zip(registros, sesiones))
+    assert 0 < sin_historial < con_historial
+    memoria = registros[0].memoria()
+    assert memoria["sesiones"] == 1 and memoria["total"] == memoria["maximo"] == con_historial
+    # La historia compartida no cuenta
+    assert con_historial < memoria_objeto(historia_pequena, set())
@@ -0,0 +1,110 @@
+import json
+import random
+
+import pytest
+
+from analisis_markov import probabilidades_finales
+from grafo_historia import GrafoHistoria, STATS, campanas
+from juego_base import JuegoAventuraBase, Jugador
+from simulador import (PoliticaTabla, ResultadosSimulacion, identidad_politica, politica_uniforme, simular,
+                       simular_paralelo, simular_reanudable)
+
+RAIZ = "jason_dificil_inicio"
+
+
+@pytest.fixture(scope="module")
+def juego():
+    return JuegoAventuraBase()
+
+
+def test_simular_es_reproducible_con_semilla(juego):
+    a = simular(juego, RAIZ, 500, semilla=4)
+    b = simular(juego, RAIZ, 500, semilla=4)
+    assert a.a_dict() == b.a_dict()
+    assert a.partidas == sum(a.finales.values()) == 500
+    assert all(sum(a.stats[stat].values()) == 500 for stat in STATS)
+
+
+@pytest.mark.parametrize("personaje, dificultad", [("jason", "dificil"), ("dick", "normal"), ("tim", "dificil")])
+def test_markov_coincide_con_monte_carlo(juego, personaje, dificultad):
+    raiz = campanas(juego.historia)[(personaje, dificultad)]
+    exactas = probabilidades_finales(GrafoHistoria(juego.historia), raiz)
+    partidas = 20000
+    resultados = simular(juego, raiz, partidas, semilla=11)
+    frecuencias = {final: n / partidas for final, n in resultados.finales.items()}
+    for final in set(exactas) | set(frecuencias):
+        p = exactas.get(final, 0.0)
+        frecuencia = frecuencias.get(final, 0.0)
+        # 5 desviaciones típicas de una binomial (y un margen para probabilidades casi nulas)
+        tolerancia = 5 * (p * (1 - p) / partidas) ** 0.5 + 1e-3
+        assert abs(frecuencia - p) <= tolerancia, (final, p, frecuencia)
+
+
+def test_combinar_lotes(juego):
+    a = simular(juego, RAIZ, 300, semilla=1)
+    b = simular(juego, RAIZ, 200, semilla=2)
+    total = ResultadosSimulacion()
+    total.combinar(a)
+    total.combinar(b)
+    assert total.partidas == 500
+    assert total.finales == a.finales + b.finales
+
+
+def test_paralelo_no_depende_del_numero_de_procesos(juego):
+    uno = simular_paralelo(juego, RAIZ, 2000, procesos=1, semilla=5, tam_lote=300)
+    dos = simular_paralelo(juego, RAIZ, 2000, procesos=2, semilla=5, tam_lote=300)
+    # Los lotes llegan en otro orden: se comparan los histogramas, no las medias en coma flotante
+    assert uno.finales == dos.finales
+    assert uno.a_dict()["histogramas"] == dos.a_dict()["histogramas"]
+    assert uno.partidas == 2000
+
+
+def test_reanudar_da_el_mismo_resultado(juego, tmp_path):
+    ruta = str(tmp_path / "progreso.json")
+    completo = simular_reanudable(juego, RAIZ, 1000, str(tmp_path / "completo.json"), semilla=9, tam_lote=100)
+
+    def interrumpir(parcial):
+        if parcial.partidas >= 400:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        simular_reanudable(juego, RAIZ, 1000, ruta, semilla=9, tam_lote=100, al_recibir=interrumpir)
+    with open(ruta, encoding="utf-8") as f:
+        assert json.load(f)["lotes_completados"] == 4
+    reanudado = simular_reanudable(juego, RAIZ, 1000, ruta, tam_lote=100, procesos=2)
+    assert json.dumps(reanudado.estado()) == json.dumps(completo.estado())
+
+
+def test_estado_se_reconstruye_sin_perdidas(juego):
+    resultados = simular(juego, RAIZ, 300, semilla=3)
+    estado = json.loads(json.dumps(resultados.estado()))
+    assert ResultadosSimulacion.desde_estado(estado).a_dict() == resultados.a_dict()
+
+
+def test_no_se_reanuda_con_otra_configuracion(juego, tmp_path):
+    ruta = str(tmp_path / "progreso.json")
+    simular_reanudable(juego, RAIZ, 200, ruta, semilla=1, tam_lote=100)
+    with pytest.raises(ValueError):
+        simular_reanudable(juego, RAIZ, 300, ruta, tam_lote=100)
+    with pytest.raises(ValueError):
+        simular_reanudable(juego, RAIZ, 200, ruta, tam_lote=100, politica=PoliticaTabla({RAIZ: [1, 0, 0]}))
+
+
+def test_identidad_de_las_politicas():
+    assert identidad_politica(politica_uniforme) == "simulador.politica_uniforme"
+    assert identidad_politica(PoliticaTabla({"a": [1, 2]})) == identidad_politica(PoliticaTabla({"a": [1, 2]}))
+    assert identidad_politica(PoliticaTabla({"a": [1, 2]})) != identidad_politica(PoliticaTabla({"a": [2, 1]}))
+
+
+def test_politica_tabla_sigue_los_pesos(juego):
+    nodo = juego.historia[RAIZ]
+    jugador = Jugador("Tabla")
+    jugador.nodo_actual = RAIZ
+    pesos = [0.0] * len(nodo.opciones)
+    pesos[1] = 1.0
+    politica = PoliticaTabla({RAIZ: pesos})
+    rng = random.Random(1)
+    assert {politica(nodo, jugador, rng) for _ in range(50)} == {1}
+    # Un nodo sin tabla (o con una tabla que no cuadra) se juega de forma uniforme
+    politica = PoliticaTabla({RAIZ: [1.0]})
+    assert {politica(nodo, jugador, rng) for _ in range(200)} == set(range(len(nodo.opciones)))
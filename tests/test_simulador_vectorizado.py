@@ -0,0 +1,50 @@
+import pytest
+
+from analisis_markov import probabilidades_finales
+from grafo_historia import GrafoHistoria, STATS
+from juego_base import JuegoAventuraBase
+from simulador import simular
+from simulador_vectorizado import simular_vectorizado
+
+RAIZ = "damian_dificil_inicio"
+
+
+@pytest.fixture(scope="module")
+def juego():
+    return JuegoAventuraBase()
+
+
+def test_finales_coinciden_con_markov(juego):
+    partidas = 50000
+    resultados = simular_vectorizado(juego, RAIZ, partidas, semilla=2, tam_lote=20000)
+    assert resultados.partidas == partidas
+    exactas = probabilidades_finales(GrafoHistoria(juego.historia), RAIZ)
+    for final in set(exactas) | set(resultados.finales):
+        p = exactas.get(final, 0.0)
+        tolerancia = 5 * (p * (1 - p) / partidas) ** 0.5 + 1e-3
+        assert abs(resultados.finales[final] / partidas - p) <= tolerancia, final
+
+
+def test_estadisticas_coinciden_con_el_simulador(juego):
+    partidas = 20000
+    vectorizado = simular_vectorizado(juego, RAIZ, partidas, semilla=3).a_dict()
+    escalar = simular(juego, RAIZ, partidas, semilla=3).a_dict()
+    resumenes = [(vectorizado["stats"][stat], escalar["stats"][stat]) for stat in STATS]
+    resumenes += [(vectorizado[clave], escalar[clave]) for clave in ("pasos", "items")]
+    for a, b in resumenes:
+        # Medias iguales salvo por el error de muestreo (las dos simulaciones usan generadores distintos)
+        assert a["media"] == pytest.approx(b["media"], abs=6 * b["desviacion"] / partidas ** 0.5 + 1e-9)
+
+
+def test_reproducible_con_semilla(juego):
+    a = simular_vectorizado(juego, RAIZ, 3000, semilla=7, tam_lote=1000)
+    b = simular_vectorizado(juego, RAIZ, 3000, semilla=7, tam_lote=1000)
+    assert a.a_dict() == b.a_dict()
+
+
+def test_pesos(juego):
+    nodo = juego.historia[RAIZ]
+    pesos = {RAIZ: [1.0] + [0.0] * (len(nodo.opciones) - 1)}
+    forzado = simular_vectorizado(juego, RAIZ, 5000, semilla=1, pesos=pesos)
+    exactas = probabilidades_finales(GrafoHistoria(juego.historia), RAIZ, pesos)
+    assert set(forzado.finales) <= {final for final, p in exactas.items() if p > 0}
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import telemetria
+from analisis_markov import absorcion
+from conftest import nodo, opcion
+from grafo_historia import GrafoHistoria
+from telemetria import Telemetria, cargar_conteos, pesos_desde_conteos, sumar_conteos
+
+RAIZ = "jason_normal_inicio"
+
+
+def test_pesos_desde_conteos(historia_pequena):
+    conteos = {RAIZ: [9, 0], "der": [1, 2, 5], "borrado": [4]}
+    assert pesos_desde_conteos(conteos) == {RAIZ: [10, 1], "der": [2, 3, 6], "borrado": [5]}
+    # Con la historia las filas se ajustan a las opciones actuales
+    pesos = pesos_desde_conteos(conteos, suavizado=0, historia=historia_pequena)
+    assert pesos == {RAIZ: [9, 0], "der": [1, 2]}
+    assert pesos_desde_conteos({"izq": [0, 0]}, suavizado=0) == {}
+
+    grafo = GrafoHistoria(historia_pequena)
+    probabilidades = absorcion(grafo, pesos)[grafo.indice[RAIZ]]
+    assert probabilidades["callejon:callejon"] == pytest.approx(0.5)
+
+
+def test_sumar_conteos():
+    destino = {"a": [1], "b": [2, 2]}
+    assert sumar_conteos(destino, {"a": [0, 3], "c": [1]}) == {"a": [1, 3], "b": [2, 2], "c": [1]}
+
+
+def test_registrar_y_guardar(tmp_path, monkeypatch):
+    ruta = str(tmp_path / "telemetria.json")
+    monkeypatch.setattr(telemetria, "GUARDAR_CADA", 3)
+    registro = Telemetria(ruta)
+    registro.registrar("a", 1, 2)
+    registro.registrar("a", 1, 2)
+    assert cargar_conteos(ruta) == {}
+    registro.registrar("b", 0, 1)
+    assert cargar_conteos(ruta) == {"a": [0, 2], "b": [1]}
+    # Un nodo que ganó una opción alarga su fila
+    registro.registrar("a", 2, 3)
+    registro.guardar()
+    assert cargar_conteos(ruta) == {"a": [0, 2, 1], "b": [1]}
+    with open(ruta, encoding="utf-8") as f:
+        assert json.load(f)["version"] == 1
+    assert not os.path.exists(ruta + ".tmp")
+
+
+@pytest.mark.parametrize("valor, ruta", [("", None), ("0", None), ("no", None),
+                                         ("1", telemetria.ARCHIVO_TELEMETRIA), ("otra.json", "otra.json")])
+def test_desde_entorno(monkeypatch, valor, ruta):
+    monkeypatch.setenv(telemetria.VARIABLE_ENTORNO, valor)
+    registro = Telemetria.desde_entorno()
+    assert (registro and registro.ruta) == ruta
+
+
+def test_no_importa_numpy():
+    programa = "import sys, telemetria; print('numpy' in sys.modules)"
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    salida = subprocess.run([sys.executable, "-c", programa], cwd=raiz, capture_output=True, text=True, check=True)
+    assert salida.stdout.strip() == "False"
+
+
+def test_pesos_de_un_nodo_sin_opciones_en_la_historia():
+    historia = {"a": nodo("a"), "b": nodo("b", opcion("Ir", "a"))}
+    assert pesos_desde_conteos({"a": [3], "b": [2]}, historia=historia) == {"b": [3]}